@@ -3,35 +3,44 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Generator
 from app.database import get_db
-from app.utils.security import get_user_id_from_token
+from app.utils.security import decode_access_token
 from app.utils.token_blacklist import token_blacklist
-from app.services.auth import get_user_by_id
+from app.utils.principal_cache import Principal, principal_cache
+from app.services.auth import get_user_by_id, get_principal_by_id
 from app.models.user import User
 
 # Security scheme for JWT bearer token
 security = HTTPBearer()
 
 
-def get_current_user(
+def get_current_principal(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> User:
+) -> Principal:
     """
-    Dependency to get current authenticated user from JWT token.
+    Dependency to get the current authenticated principal from JWT token.
+    
+    Use this instead of get_current_user when the endpoint only needs the
+    user's id, username or active status: the principal comes from an
+    in-memory cache, so most requests skip the user SELECT entirely.
+    
+    The token's "ver" claim must match the user's token_version, which is
+    bumped to revoke all of a user's tokens (password change or reset,
+    deactivation).
     
     Args:
         credentials: HTTP Authorization credentials with bearer token
-        db: Database session
+        db: Database session (only used on a cache miss)
         
     Returns:
-        Current authenticated User object
+        Current authenticated Principal
         
     Raises:
         HTTPException: If token is invalid, blacklisted, or user not found
     """
     token = credentials.credentials
     
-    # Check if token is blacklisted
+    # Check if token is blacklisted (this worker's synced copy, no query)
     if token_blacklist.is_blacklisted(token):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -39,17 +48,69 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Decode token to get user ID
-    user_id = get_user_id_from_token(token)
+    # Decode token to get user ID and token version
+    payload = decode_access_token(token)
+    user_id = payload.get("sub") if payload else None
     if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
+    # Tokens issued before token versions existed count as version 0
+    token_version = payload.get("ver", 0)
+    
+    # Get principal from cache, else from database. A token newer than the
+    # cached principal means the version moved in another worker: reload
+    principal = principal_cache.get(user_id)
+    if principal is None or principal.token_version < token_version:
+        principal = get_principal_by_id(db, user_id)
+        if not principal:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        principal_cache.put(user_id, principal)
+    
+    if principal.token_version != token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
+    if not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User account is inactive"
+        )
     
+    return principal
+
+
+def get_current_user(
+    principal: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Dependency to get current authenticated user from JWT token.
+    
+    Loads the full User row, for endpoints that need more than
+    get_current_principal provides (profile fields, password hash).
+    
+    Args:
+        principal: Authenticated principal
+        db: Database session
+        
+    Returns:
+        Current authenticated User object
+        
+    Raises:
+        HTTPException: If token is invalid, blacklisted, or user not found
+    """
     # Get user from database
-    user = get_user_by_id(db, user_id)
+    user = get_user_by_id(db, principal.id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -57,6 +118,7 @@ def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    # The cached principal may predate a deactivation in another worker
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.user import UserCreate, UserResponse
@@ -11,10 +12,13 @@ from app.schemas.auth import (
     PasswordResetResponse
 )
 from app.services.auth import create_user, authenticate_user, get_user_by_username
+from app.services.token_revocation import revoke_token
 from app.utils.security import create_token_for_user, get_user_id_from_token, get_token_expiry
-from app.utils.token_blacklist import token_blacklist
-from app.api.deps import get_current_user, get_current_token
-from app.models.user import User
+from app.utils.password_hasher import PasswordHasherBusy
+from app.utils.login_throttle import login_throttle
+from app.utils.serializers import user_to_dict
+from app.api.deps import get_current_principal, get_current_token
+from app.utils.principal_cache import Principal
 
 router = APIRouter()
 
@@ -35,16 +39,7 @@ def register_user(
     try:
         user = create_user(db, user_data)
         
-        # Convert UUID to string for response
-        user_dict = {
-            "id": str(user.id),
-            "username": user.username,
-            "is_active": user.is_active,
-            "created_at": user.created_at,
-            "updated_at": user.updated_at
-        }
-        
-        return UserResponse(**user_dict)
+        return ORJSONResponse(user_to_dict(user), status_code=status.HTTP_201_CREATED)
     
     except ValueError as e:
         # Username already exists
@@ -52,6 +47,9 @@ def register_user(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
+    except PasswordHasherBusy:
+        # Handled by the app (503)
+        raise
     except Exception as e:
         # Unexpected error
         raise HTTPException(
@@ -63,32 +61,44 @@ def register_user(
 @router.post("/login", response_model=Token)
 def login(
     login_data: LoginRequest,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
     Login with username and password.
     
-    Returns a JWT access token valid for 24 hours.
+    Returns a JWT access token valid for 24 hours. After repeated failures
+    for a username or from a client IP, further attempts get 429 (with
+    Retry-After) for a doubling delay, without checking the password.
     """
+    client_ip = request.client.host if request.client else "unknown"
+    
+    # Reject throttled attempts before the user lookup and bcrypt
+    login_throttle.check(login_data.username, client_ip)
+    
     user = authenticate_user(db, login_data.username, login_data.password)
     
     if not user:
+        login_throttle.record_failure(login_data.username, client_ip)
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
+    login_throttle.record_success(login_data.username)
+    
     # Create access token
-    access_token = create_token_for_user(str(user.id), user.username)
+    access_token = create_token_for_user(str(user.id), user.username, user.token_version)
     
     return Token(access_token=access_token, token_type="bearer")
 
 
 @router.post("/refresh", response_model=Token)
 def refresh_token(
-    current_user: User = Depends(get_current_user),
-    current_token: str = Depends(get_current_token)
+    current_user: Principal = Depends(get_current_principal),
+    current_token: str = Depends(get_current_token),
+    db: Session = Depends(get_db)
 ):
     """
     Refresh access token.
@@ -99,10 +109,12 @@ def refresh_token(
     # Blacklist the old token
     token_expiry = get_token_expiry(current_token)
     if token_expiry:
-        token_blacklist.add(current_token, token_expiry)
+        revoke_token(db, current_token, token_expiry)
     
     # Create new token
-    new_token = create_token_for_user(str(current_user.id), current_user.username)
+    new_token = create_token_for_user(
+        str(current_user.id), current_user.username, current_user.token_version
+    )
     
     return Token(access_token=new_token, token_type="bearer")
 
@@ -110,7 +122,8 @@ def refresh_token(
 @router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
 def logout(
     current_token: str = Depends(get_current_token),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
 ):
     """
     Logout the current user.
@@ -120,7 +133,7 @@ def logout(
     # Get token expiry and add to blacklist
     token_expiry = get_token_expiry(current_token)
     if token_expiry:
-        token_blacklist.add(current_token, token_expiry)
+        revoke_token(db, current_token, token_expiry)
     
     # 204 No Content - successful logout with no response body
     return None
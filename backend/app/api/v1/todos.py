@@ -1,35 +1,73 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Header, Response, UploadFile, File
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi.security import HTTPAuthorizationCredentials
+from starlette.concurrency import run_in_threadpool
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from app.database import get_db
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+import asyncio
+import orjson
+import time
+from app.config import settings
+from app.database import get_db, SessionLocal
 from app.schemas.todo import (
     TodoCreate, 
     TodoResponse, 
     TodoUpdate,
     TodoListResponse,
-    PaginationMetadata,
+    TodoBatchCreate,
+    TodoBatchCreateResponse,
+    TodoImportResponse,
+    TodoChangesResponse,
+    TodoBulkIds,
+    TodoBulkResult,
     SortField,
-    SortOrder
+    SortOrder,
+    ExportFormat
 )
-from app.api.deps import get_current_user
-from app.models.user import User
+from app.api.deps import get_current_principal, security
+from app.utils.principal_cache import Principal, principal_cache
+from app.utils.serializers import (
+    todo_to_dict,
+    todo_to_partial_dict,
+    parse_todo_fields,
+    todos_to_ndjson,
+    todos_to_csv,
+    parse_ndjson,
+    parse_csv
+)
+from app.utils.etag import make_etag, etag_matches
+from app.utils.security import get_token_expiry
+from app.utils.todo_page_cache import todo_page_cache
+from app.utils.todo_events import todo_events
+from app.utils.token_blacklist import token_blacklist
+from app.services.auth import get_principal_by_id
 from app.services.todo import (
     create_todo, 
+    create_todos,
+    import_todos,
     get_user_todos, 
+    iter_user_todos,
+    get_todo_changes,
+    get_todos_version,
     calculate_total_pages,
     get_todo_by_id,
-    update_todo,
-    complete_and_delete_todo,
-    delete_todo
+    update_todo_by_id,
+    delete_todo_by_id,
+    delete_todos_by_ids,
+    ChangesCursorExpired
 )
 
 router = APIRouter()
 
+# Clients may keep a copy but must revalidate it (If-None-Match) before use
+CACHE_CONTROL = "private, no-cache"
+
 
 @router.post("/", response_model=TodoResponse, status_code=status.HTTP_201_CREATED)
 def create_new_todo(
     todo_data: TodoCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -46,20 +84,8 @@ def create_new_todo(
         # Create the todo
         todo = create_todo(db, current_user, todo_data)
         
-        # Convert to response format
-        todo_dict = {
-            "id": str(todo.id),
-            "user_id": str(todo.user_id),
-            "title": todo.title,
-            "description": todo.description,
-            "priority": todo.priority,
-            "due_date": todo.due_date,
-            "is_completed": todo.is_completed,
-            "created_at": todo.created_at,
-            "updated_at": todo.updated_at
-        }
-        
-        return TodoResponse(**todo_dict)
+        # Render directly (skips response_model re-validation)
+        return ORJSONResponse(todo_to_dict(todo), status_code=status.HTTP_201_CREATED)
     
     except Exception as e:
         raise HTTPException(
@@ -68,13 +94,175 @@ def create_new_todo(
         )
 
 
+@router.post("/batch", response_model=TodoBatchCreateResponse, status_code=status.HTTP_201_CREATED)
+def create_todos_batch(
+    batch_data: TodoBatchCreate,
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    Create many todos in one request and one transaction.
+    
+    - **items**: List of todos (1-500), each with the same fields as `POST /api/todos`
+    
+    Each item is validated on its own: invalid items are reported in `errors`
+    (with their position in the request) and do not stop the valid ones from
+    being created.
+    
+    Returns the created todos in request order, plus per-item errors.
+    Returns 422 if no item was valid.
+    """
+    valid_items = []
+    errors = []
+    for index, item in enumerate(batch_data.items):
+        try:
+            valid_items.append(TodoCreate.model_validate(item))
+        except ValidationError as e:
+            errors.append({
+                "index": index,
+                "errors": [
+                    f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                    for error in e.errors()
+                ]
+            })
+    
+    if not valid_items:
+        return ORJSONResponse(
+            {"created": [], "errors": errors},
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY
+        )
+    
+    try:
+        todos = create_todos(db, current_user, valid_items)
+        
+        return ORJSONResponse(
+            {"created": [todo_to_dict(todo) for todo in todos], "errors": errors},
+            status_code=status.HTTP_201_CREATED
+        )
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred while creating todos: {str(e)}"
+        )
+
+
+@router.post("/import", response_model=TodoImportResponse, status_code=status.HTTP_201_CREATED)
+def import_todos_file(
+    file: UploadFile = File(..., description="NDJSON or CSV file of todos"),
+    format: Optional[ExportFormat] = Query(
+        None, description="File format (default: from the file name or content type)"
+    ),
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    Import todos from an uploaded NDJSON or CSV file (multipart form field `file`).
+    
+    - **ndjson**: One JSON object per line, with the fields of `POST /api/todos`
+    - **csv**: Header row naming the fields (title, description, priority,
+      due_date), then one todo per row; unknown columns are ignored, so files
+      from `GET /api/todos/export` can be imported as they are
+    
+    The file is read and validated record by record and inserted in
+    transactions of TODO_IMPORT_CHUNK_SIZE todos. Invalid records are
+    skipped and reported with their line number (the first 100 are listed).
+    
+    Returns 422 if no todo could be imported.
+    """
+    if format is None:
+        is_csv = (file.filename or "").lower().endswith(".csv") or (
+            (file.content_type or "").startswith("text/csv")
+        )
+        format = ExportFormat.CSV if is_csv else ExportFormat.NDJSON
+    
+    records = parse_csv(file.file) if format == ExportFormat.CSV else parse_ndjson(file.file)
+    
+    try:
+        result = import_todos(db, current_user, records)
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred while importing todos: {str(e)}"
+        )
+    
+    return ORJSONResponse(
+        result,
+        status_code=status.HTTP_201_CREATED if result["imported"] else status.HTTP_422_UNPROCESSABLE_ENTITY
+    )
+
+
+@router.post("/batch/complete", response_model=TodoBulkResult)
+def complete_todos_batch(
+    bulk_data: TodoBulkIds,
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    Mark many todos as completed and delete them, in one transaction.
+    
+    **WARNING: This action is irreversible!**
+    
+    - **ids**: UUIDs of the todos to complete (max 500)
+    
+    Only the user's own todos are affected. IDs that don't exist or belong
+    to another user are reported in `not_found`.
+    """
+    return _remove_todos(db, current_user, bulk_data, completed=True)
+
+
+@router.post("/batch/delete", response_model=TodoBulkResult)
+def delete_todos_batch(
+    bulk_data: TodoBulkIds,
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    Delete many todos (hard delete), in one transaction.
+    
+    **WARNING: This action is irreversible!**
+    
+    - **ids**: UUIDs of the todos to delete (max 500)
+    
+    Only the user's own todos are affected. IDs that don't exist or belong
+    to another user are reported in `not_found`.
+    """
+    return _remove_todos(db, current_user, bulk_data)
+
+
+def _remove_todos(
+    db: Session,
+    current_user: Principal,
+    bulk_data: TodoBulkIds,
+    completed: bool = False
+) -> ORJSONResponse:
+    """Delete the requested todos and report which ones were removed."""
+    # Completed todos are deleted (as per requirements), so both bulk
+    # endpoints run the same single DELETE statement
+    requested_ids = list(dict.fromkeys(str(todo_id) for todo_id in bulk_data.ids))
+    removed = delete_todos_by_ids(db, str(current_user.id), requested_ids, completed=completed)
+    
+    removed_set = set(removed)
+    return ORJSONResponse({
+        "removed": [todo_id for todo_id in requested_ids if todo_id in removed_set],
+        "not_found": [todo_id for todo_id in requested_ids if todo_id not in removed_set]
+    })
+
+
 @router.get("/", response_model=TodoListResponse)
 def list_todos(
     page: int = Query(1, ge=1, description="Page number (starts at 1)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page (max 100)"),
-    sort_by: SortField = Query(SortField.CREATED_AT, description="Field to sort by"),
+    sort_by: Optional[SortField] = Query(
+        None, description="Field to sort by (default: relevance when searching, else created_at)"
+    ),
     sort_order: SortOrder = Query(SortOrder.DESC, description="Sort order (asc or desc)"),
-    current_user: User = Depends(get_current_user),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page (overrides page)"),
+    q: Optional[str] = Query(None, min_length=1, max_length=200, description="Full-text search in title and description"),
+    fields: Optional[str] = Query(None, description="Comma-separated todo fields to return (default: all)"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -84,59 +272,99 @@ def list_todos(
     
     - **page**: Page number (default: 1, minimum: 1)
     - **page_size**: Items per page (default: 20, minimum: 1, maximum: 100)
-    - **sort_by**: Field to sort by (default: created_at)
+    - **sort_by**: Field to sort by (default: relevance when `q` is given, else created_at)
       - created_at: Sort by creation date
       - due_date: Sort by due date
       - priority: Sort by priority (high > medium > low > none)
+      - relevance: Sort by search relevance (only with `q`; desc is best match first)
     - **sort_order**: Sort order (default: desc)
       - asc: Ascending (oldest/earliest/lowest first)
       - desc: Descending (newest/latest/highest first)
+    - **cursor**: Opaque cursor from `pagination.next_cursor` of a previous response
+      - Seeks straight to the next page, so deep pages are as fast as the first
+      - Must be used with the same sort_by and sort_order it was issued for
+    - **q**: Search text (optional)
+      - Returns todos whose title or description contain every word (prefix match)
+      - Served by a full-text index, so it does not scan the user's todos
+    - **fields**: Todo fields to return, e.g. `id,title,priority,due_date` (optional)
+      - `id` is always included; columns not asked for are not read from the database
     
     Returns paginated list of todos with metadata.
+    Responses carry an ETag; send it back in If-None-Match to get
+    304 Not Modified while the user's todos are unchanged.
+    Rendered pages are cached in memory until the user's todos change.
     """
+    if sort_by is None:
+        sort_by = SortField.RELEVANCE if q is not None else SortField.CREATED_AT
+    
+    field_list = _parse_fields(fields)
+    field_key = ",".join(field_list) if field_list is not None else None
+    
+    # The version changes on every write, so a matching tag means the page
+    # is unchanged and neither the query nor serialization is needed
+    todos_version = get_todos_version(db, current_user.id)
+    etag = make_etag(
+        todos_version,
+        current_user.id, page, page_size, sort_by.value, sort_order.value, cursor, q, field_key
+    )
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    user_id = str(current_user.id)
+    cache_key = (
+        todos_version, page, page_size, sort_by.value, sort_order.value, cursor, q, field_key
+    )
+    body = todo_page_cache.get(user_id, cache_key)
+    if body is not None:
+        return Response(content=body, media_type="application/json", headers=headers)
+    
     try:
         # Get todos (only uncompleted, with sorting)
-        todos, total = get_user_todos(
+        todos, total, next_cursor = get_user_todos(
             db, 
-            str(current_user.id), 
+            user_id, 
             page=page, 
             page_size=page_size,
             only_uncompleted=True,
             sort_by=sort_by,
-            sort_order=sort_order
+            sort_order=sort_order,
+            cursor=cursor,
+            search=q,
+            fields=field_list
         )
         
-        # Convert todos to response format
-        todo_responses = []
-        for todo in todos:
-            todo_dict = {
-                "id": str(todo.id),
-                "user_id": str(todo.user_id),
-                "title": todo.title,
-                "description": todo.description,
-                "priority": todo.priority,
-                "due_date": todo.due_date,
-                "is_completed": todo.is_completed,
-                "created_at": todo.created_at,
-                "updated_at": todo.updated_at
-            }
-            todo_responses.append(TodoResponse(**todo_dict))
+        # Calculate pagination metadata (total is None if not counted)
+        total_pages = calculate_total_pages(total, page_size) if total is not None else None
         
-        # Calculate pagination metadata
-        total_pages = calculate_total_pages(total, page_size)
+        # Render directly (skips response_model re-validation)
+        if field_list is not None:
+            todo_dicts = [todo_to_partial_dict(todo, field_list) for todo in todos]
+        else:
+            todo_dicts = [todo_to_dict(todo) for todo in todos]
         
-        pagination = PaginationMetadata(
-            total=total,
-            page=page,
-            page_size=page_size,
-            total_pages=total_pages
-        )
+        response = ORJSONResponse({
+            "todos": todo_dicts,
+            "pagination": {
+                "total": total,
+                "page": page,
+                "page_size": page_size,
+                "total_pages": total_pages,
+                "has_more": next_cursor is not None,
+                "next_cursor": next_cursor
+            }
+        }, headers=headers)
         
-        return TodoListResponse(
-            todos=todo_responses,
-            pagination=pagination
-        )
+        todo_page_cache.put(user_id, cache_key, response.body)
+        
+        return response
     
+    except ValueError as e:
+        # Invalid or mismatched cursor, or invalid search
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -144,10 +372,230 @@ def list_todos(
         )
 
 
+@router.get("/changes", response_model=TodoChangesResponse)
+def list_todo_changes(
+    since: Optional[str] = Query(None, description="Cursor from a previous call (omit for a full sync)"),
+    limit: int = Query(500, ge=1, le=1000, description="Maximum changes per call (max 1000)"),
+    current_user: Principal = Depends(get_current_principal),
+    db: Session = Depends(get_db)
+):
+    """
+    Get what changed in the authenticated user's todos since a sync cursor.
+    
+    - **since**: `cursor` from the previous response; omit it to get every todo
+    - **limit**: Maximum number of changes (default: 500, maximum: 1000)
+    
+    Returns todos created or updated since the cursor (full objects, in
+    `todos`) and IDs of todos deleted or completed since then (in `deleted`).
+    Store the returned `cursor` and pass it as `since` next time; while
+    `has_more` is true, call again right away.
+    
+    Deletions are only kept for a retention period: a cursor from a client
+    that has not caught up for longer gets 410 Gone, and the client must
+    start over with a full sync (no `since`).
+    
+    The cost depends on the number of changes, not on the number of todos.
+    """
+    try:
+        todos, deleted_ids, cursor, has_more = get_todo_changes(
+            db, current_user, cursor=since, limit=limit
+        )
+    
+    except ChangesCursorExpired as e:
+        # Deletions since the cursor may have been purged
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail=str(e)
+        )
+    
+    except ValueError as e:
+        # Invalid cursor
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    return ORJSONResponse({
+        "todos": [todo_to_dict(todo) for todo in todos],
+        "deleted": deleted_ids,
+        "cursor": cursor,
+        "has_more": has_more
+    })
+
+
+@router.get("/events")
+async def stream_todo_events(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+):
+    """
+    Stream changes to the authenticated user's todos as Server-Sent Events.
+    
+    Replaces polling: the connection stays open and receives one event per
+    write, whichever client made it.
+    
+    - `ready`: sent first, data `{"version": N}` (the user's todos_version)
+    - `created`, `updated`, `completed`, `deleted`: data
+      `{"type": ..., "ids": [...], "version": N}`
+    - `resync`: the client fell behind and events were dropped; refetch
+    - `expired`: the access token expired or was revoked (logout, refresh,
+      password change or reset, deactivation); reconnect with a new token
+    
+    A comment line is sent every TODO_EVENTS_HEARTBEAT_SECONDS to keep
+    proxies from closing an idle connection. A gap in `version` means
+    events were missed (e.g. a write handled by another worker); fetch
+    them with `GET /api/todos/changes`.
+    
+    An open stream holds no database connection. Before every event and
+    heartbeat the token is checked again against the blacklist and the
+    cached principal; the principal is only reloaded on a cache miss.
+    """
+    # Authenticate with a short-lived session: get_db would keep a pooled
+    # connection checked out for as long as the stream stays open
+    current_user, todos_version = await run_in_threadpool(_authenticate_event_stream, credentials)
+    expires_at = get_token_expiry(credentials.credentials)
+    
+    return StreamingResponse(
+        _todo_event_stream(
+            str(current_user.id),
+            todos_version,
+            expires_at.timestamp() if expires_at else None,
+            credentials.credentials,
+            current_user.token_version
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+def _authenticate_event_stream(credentials: HTTPAuthorizationCredentials) -> Tuple[Principal, int]:
+    """Authenticate and read the todos_version with a session closed right after."""
+    db = SessionLocal()
+    try:
+        current_user = get_current_principal(credentials, db)
+        return current_user, get_todos_version(db, current_user.id)
+    finally:
+        db.close()
+
+
+async def _todo_event_stream(
+    user_id: str,
+    version: int,
+    expires_at: Optional[float],
+    token: str,
+    token_version: int
+) -> AsyncIterator[bytes]:
+    """Yield SSE frames for a user's todo events until the token expires or is revoked."""
+    heartbeat = settings.TODO_EVENTS_HEARTBEAT_SECONDS
+    queue = todo_events.subscribe(user_id)
+    try:
+        yield b"retry: 5000\n" + _sse_frame("ready", {"version": version})
+        
+        while True:
+            timeout = heartbeat
+            if expires_at is not None:
+                timeout = min(timeout, expires_at - time.time())
+                if timeout <= 0:
+                    yield _sse_frame("expired", {})
+                    return
+            
+            try:
+                event = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                event = None
+            
+            if not await _event_stream_authorized(user_id, token, token_version):
+                yield _sse_frame("expired", {})
+                return
+            
+            if event is None:
+                yield b": keepalive\n\n"
+            else:
+                yield _sse_frame(event["type"], event)
+    finally:
+        # Also runs when the client disconnects (the stream is cancelled)
+        todo_events.unsubscribe(user_id, queue)
+
+
+async def _event_stream_authorized(user_id: str, token: str, token_version: int) -> bool:
+    """
+    Check that an open stream's token is still valid, as get_current_principal would.
+    
+    Memory-only while the principal is cached; on a miss (e.g. right after
+    a password change invalidated it) it is reloaded with a short-lived
+    session and cached again.
+    """
+    if token_blacklist.is_blacklisted(token):
+        return False
+    
+    principal = principal_cache.get(user_id)
+    if principal is None or principal.token_version < token_version:
+        principal = await run_in_threadpool(_load_principal, user_id)
+        if principal is None:
+            return False
+        principal_cache.put(user_id, principal)
+    
+    return principal.is_active and principal.token_version == token_version
+
+
+def _load_principal(user_id: str) -> Optional[Principal]:
+    """Load a principal with a session closed right after."""
+    db = SessionLocal()
+    try:
+        return get_principal_by_id(db, user_id)
+    finally:
+        db.close()
+
+
+def _sse_frame(event_type: str, data: Dict[str, Any]) -> bytes:
+    """Encode one Server-Sent Event."""
+    return b"event: " + event_type.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+@router.get("/export")
+def export_todos(
+    format: ExportFormat = Query(ExportFormat.NDJSON, description="File format (ndjson or csv)"),
+    current_user: Principal = Depends(get_current_principal)
+):
+    """
+    Export all of the authenticated user's todos in one streamed download.
+    
+    - **format**: File format (default: ndjson)
+      - ndjson: One JSON object per line, same fields as `GET /api/todos/{id}`
+      - csv: Header row, then one row per todo
+    
+    Todos are sent oldest first, a batch at a time as they are read from the
+    database, so the download starts immediately and the server holds only
+    one batch at a time. No database read stays open while a batch is sent,
+    so a slow download does not hold up writes.
+    """
+    user_id = str(current_user.id)
+    
+    def batches():
+        # Own session: the stream outlives the request's dependencies
+        db = SessionLocal()
+        try:
+            yield from iter_user_todos(db, user_id)
+        finally:
+            db.close()
+    
+    if format == ExportFormat.CSV:
+        content, media_type = todos_to_csv(batches()), "text/csv"
+    else:
+        content, media_type = todos_to_ndjson(batches()), "application/x-ndjson"
+    
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="todos.{format.value}"'}
+    )
+
+
 @router.get("/{todo_id}", response_model=TodoResponse)
 def get_todo(
     todo_id: str = Path(..., description="Todo ID (UUID)"),
-    current_user: User = Depends(get_current_user),
+    fields: Optional[str] = Query(None, description="Comma-separated todo fields to return (default: all)"),
+    if_none_match: Optional[str] = Header(None),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -156,11 +604,16 @@ def get_todo(
     Requires authentication. Users can only access their own todos.
     
     - **todo_id**: UUID of the todo to retrieve
+    - **fields**: Todo fields to return, e.g. `id,title` (optional, `id` is always included)
     
     Returns 404 if todo doesn't exist or doesn't belong to the user.
+    Otherwise returns 304 Not Modified if If-None-Match matches the current ETag.
     """
-    # Get todo with authorization check
-    todo = get_todo_by_id(db, todo_id, str(current_user.id))
+    field_list = _parse_fields(fields)
+    
+    # Get todo with authorization check (first: If-None-Match only matches
+    # a representation that exists, "*" included)
+    todo = get_todo_by_id(db, todo_id, str(current_user.id), fields=field_list)
     
     if not todo:
         # Return 404 whether todo doesn't exist or belongs to another user
@@ -170,27 +623,36 @@ def get_todo(
             detail="Todo not found"
         )
     
-    # Convert to response format
-    todo_dict = {
-        "id": str(todo.id),
-        "user_id": str(todo.user_id),
-        "title": todo.title,
-        "description": todo.description,
-        "priority": todo.priority,
-        "due_date": todo.due_date,
-        "is_completed": todo.is_completed,
-        "created_at": todo.created_at,
-        "updated_at": todo.updated_at
-    }
+    etag = make_etag(
+        get_todos_version(db, current_user.id),
+        current_user.id, todo_id, ",".join(field_list) if field_list is not None else None
+    )
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
     
-    return TodoResponse(**todo_dict)
+    if field_list is not None:
+        return ORJSONResponse(todo_to_partial_dict(todo, field_list), headers=headers)
+    
+    return ORJSONResponse(todo_to_dict(todo), headers=headers)
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """Parse the ?fields= parameter, rejecting unknown fields with 400."""
+    try:
+        return parse_todo_fields(fields)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
 
 @router.put("/{todo_id}", response_model=Optional[TodoResponse])
 def update_todo_endpoint(
     todo_id: str = Path(..., description="Todo ID (UUID)"),
     update_data: TodoUpdate = ...,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -211,37 +673,18 @@ def update_todo_endpoint(
     Returns 404 if todo doesn't exist or doesn't belong to the user.
     Returns 204 No Content if todo was marked complete and deleted.
     """
-    # Get todo with authorization check
-    todo = get_todo_by_id(db, todo_id, str(current_user.id))
-    
-    if not todo:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Todo not found"
-        )
+    # Marking as completed deletes the todo (as per requirements)
+    if update_data.is_completed:
+        if not delete_todo_by_id(db, todo_id, str(current_user.id), completed=True):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Todo not found"
+            )
+        return None  # FastAPI will return 204 No Content
     
     try:
-        # Update the todo (may return None if completed and deleted)
-        updated_todo = update_todo(db, todo, update_data)
-        
-        # If None, todo was completed and deleted
-        if updated_todo is None:
-            return None  # FastAPI will return 204 No Content
-        
-        # Convert to response format
-        todo_dict = {
-            "id": str(updated_todo.id),
-            "user_id": str(updated_todo.user_id),
-            "title": updated_todo.title,
-            "description": updated_todo.description,
-            "priority": updated_todo.priority,
-            "due_date": updated_todo.due_date,
-            "is_completed": updated_todo.is_completed,
-            "created_at": updated_todo.created_at,
-            "updated_at": updated_todo.updated_at
-        }
-        
-        return TodoResponse(**todo_dict)
+        # Ownership-checked UPDATE ... RETURNING (one round trip)
+        updated_todo = update_todo_by_id(db, todo_id, str(current_user.id), update_data)
     
     except ValueError as e:
         # No fields provided or validation error
@@ -254,12 +697,20 @@ def update_todo_endpoint(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An error occurred while updating todo: {str(e)}"
         )
+    
+    if updated_todo is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Todo not found"
+        )
+    
+    return ORJSONResponse(todo_to_dict(updated_todo))
 
 
 @router.post("/{todo_id}/complete", status_code=status.HTTP_204_NO_CONTENT)
 def complete_todo(
     todo_id: str = Path(..., description="Todo ID (UUID)"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -275,18 +726,14 @@ def complete_todo(
     Returns 204 No Content on success.
     Returns 404 if todo doesn't exist or doesn't belong to the user.
     """
-    # Get todo with authorization check
-    todo = get_todo_by_id(db, todo_id, str(current_user.id))
-    
-    if not todo:
+    # Complete and delete the todo (ownership-checked DELETE, one statement)
+    # No need to mark as completed first since it's being deleted
+    if not delete_todo_by_id(db, todo_id, str(current_user.id), completed=True):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Todo not found"
         )
     
-    # Complete and delete the todo
-    complete_and_delete_todo(db, todo)
-    
     # Return 204 No Content
     return None
 
@@ -294,7 +741,7 @@ def complete_todo(
 @router.delete("/{todo_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_todo_endpoint(
     todo_id: str = Path(..., description="Todo ID (UUID)"),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -309,17 +756,12 @@ def delete_todo_endpoint(
     Returns 204 No Content on success.
     Returns 404 if todo doesn't exist or doesn't belong to the user.
     """
-    # Get todo with authorization check
-    todo = get_todo_by_id(db, todo_id, str(current_user.id))
-    
-    if not todo:
+    # Delete the todo (ownership-checked DELETE, one statement)
+    if not delete_todo_by_id(db, todo_id, str(current_user.id)):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Todo not found"
         )
     
-    # Delete the todo
-    delete_todo(db, todo)
-    
     # Return 204 No Content
     return None
\ No newline at end of file
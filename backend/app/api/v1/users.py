@@ -1,12 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.schemas.user import UserResponse, UserUpdate, UserDelete
 from app.api.deps import get_current_user, get_current_token
 from app.models.user import User
 from app.services.user import update_user_profile, delete_user
+from app.services.token_revocation import revoke_token
 from app.utils.security import verify_password, get_token_expiry
-from app.utils.token_blacklist import token_blacklist
+from app.utils.password_hasher import PasswordHasherBusy
+from app.utils.serializers import user_to_dict
 
 router = APIRouter()
 
@@ -21,16 +24,7 @@ def get_my_profile(
     Requires valid JWT token in Authorization header.
     Returns the authenticated user's profile information (without password).
     """
-    # Convert UUID to string for response
-    user_dict = {
-        "id": str(current_user.id),
-        "username": current_user.username,
-        "is_active": current_user.is_active,
-        "created_at": current_user.created_at,
-        "updated_at": current_user.updated_at
-    }
-    
-    return UserResponse(**user_dict)
+    return ORJSONResponse(user_to_dict(current_user))
 
 
 @router.put("/me", response_model=UserResponse)
@@ -47,21 +41,13 @@ def update_my_profile(
     
     - **username**: New username (optional, must be unique)
     - **password**: New password (optional, will be hashed)
+      - Revokes every access token of the user, including the one used here
     """
     try:
         # Update user profile
         updated_user = update_user_profile(db, current_user, update_data)
         
-        # Convert UUID to string for response
-        user_dict = {
-            "id": str(updated_user.id),
-            "username": updated_user.username,
-            "is_active": updated_user.is_active,
-            "created_at": updated_user.created_at,
-            "updated_at": updated_user.updated_at
-        }
-        
-        return UserResponse(**user_dict)
+        return ORJSONResponse(user_to_dict(updated_user))
     
     except ValueError as e:
         # Username taken or no fields provided
@@ -75,6 +61,9 @@ def update_my_profile(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=str(e)
             )
+    except PasswordHasherBusy:
+        # Handled by the app (503)
+        raise
     except Exception as e:
         # Unexpected error
         raise HTTPException(
@@ -110,7 +99,7 @@ def delete_my_account(
     # Blacklist current token
     token_expiry = get_token_expiry(current_token)
     if token_expiry:
-        token_blacklist.add(current_token, token_expiry)
+        revoke_token(db, current_token, token_expiry)
     
     # Delete user (cascade will delete related data)
     delete_user(db, current_user)
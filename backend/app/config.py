@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Literal
 
 
 class Settings(BaseSettings):
@@ -13,6 +13,32 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
     ALLOWED_ORIGINS: str = "http://localhost:5173"
     RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_PER_MINUTE: int = 600  # API requests per user (per client IP without a token)
+    RATE_LIMIT_BULK_PER_MINUTE: int = 30  # import, export and batch requests per user
+    RATE_LIMIT_AUTH_PER_MINUTE: int = 20  # login, register and password reset requests per client IP
+    RATE_LIMIT_MAX_BUCKETS: int = 100000  # clients tracked, least recently seen evicted
+    LOGIN_THROTTLE_USER_ATTEMPTS: int = 5  # failed logins per username before backoff
+    LOGIN_THROTTLE_IP_ATTEMPTS: int = 20  # failed logins per client IP before backoff
+    LOGIN_THROTTLE_MAX_DELAY_SECONDS: int = 300  # longest backoff (doubles from 1 s)
+    LOGIN_THROTTLE_RESET_SECONDS: int = 900  # failures forgotten after this long without one
+    LOGIN_THROTTLE_MAX_ENTRIES: int = 100000  # usernames + IPs tracked
+    TODO_COUNT_STRATEGY: Literal["exact", "window", "cached", "none"] = "exact"  # see schemas.todo.CountStrategy
+    TODO_PAGE_CACHE_MAX_BYTES: int = 33554432  # 32 MB, 0 disables the cache
+    TODO_PAGE_CACHE_TTL_SECONDS: int = 60
+    TODO_IMPORT_CHUNK_SIZE: int = 1000  # todos per transaction when importing
+    TODO_EVENTS_QUEUE_SIZE: int = 100  # pending events per stream before a resync
+    TODO_EVENTS_HEARTBEAT_SECONDS: int = 15
+    TODO_TOMBSTONE_RETENTION_DAYS: int = 30  # deletions kept for delta sync, older cursors must resync, 0 = forever
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000  # 0 disables the cache
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000  # verified tokens kept decoded, 0 disables
+    TOKEN_REVOCATION_SYNC_SECONDS: float = 1.0  # how often workers load others' revocations, 0 = startup only
+    TOKEN_REVOCATION_SYNC_OVERLAP: int = 100  # ids below the last synced one re-read, for rows committed late
+    PASSWORD_HASH_WORKERS: int = 0  # bcrypt worker processes, 0 = one per CPU
+    PASSWORD_HASH_MAX_PENDING: int = 8  # running + queued, beyond that 503; keep well under the 40 AnyIO threads
+    PASSWORD_HASH_ROUNDS: int = 12  # bcrypt cost of new hashes
+    PASSWORD_HASH_TARGET_MS: int = 0  # if set, calibrate the cost to this budget once, shared via the database
+    PASSWORD_HASH_MIN_ROUNDS: int = 12  # lowest cost calibration may pick
     
     @property
     def allowed_origins_list(self) -> List[str]:
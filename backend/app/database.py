@@ -1,6 +1,6 @@
 from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from app.config import settings
 
 # Create SQLAlchemy engine
@@ -25,6 +25,25 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def commit_without_expiring(db: Session) -> None:
+    """
+    Commit a session without expiring the objects loaded in it.
+    
+    For write paths that read their objects back right after the commit:
+    models fetch server-generated values eagerly (INSERT/UPDATE ...
+    RETURNING), so expiring them would only cost a refresh SELECT. Other
+    sessions keep the default expire-on-commit behaviour.
+    
+    Args:
+        db: Database session
+    """
+    expire_on_commit, db.expire_on_commit = db.expire_on_commit, False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
+
+
 def get_db():
     """
     Dependency function to get database session.
@@ -43,8 +62,13 @@ def init_db():
     Should be called on application startup.
     """
     # Import all models here to ensure they're registered with SQLAlchemy
-    from app.models import user, password_reset, todo  # noqa: F401
+    from app.models import user, password_reset, todo, todo_tombstone, revoked_token, app_setting  # noqa: F401
+    
+    from app.migrations import run_migrations
     
     # Create all tables
     Base.metadata.create_all(bind=engine)
-    print(f"✅ Database tables created successfully")
\ No newline at end of file
+    print(f"✅ Database tables created successfully")
+    
+    # Apply schema changes to existing tables
+    run_migrations(engine)
\ No newline at end of file
@@ -1,16 +1,40 @@
-from fastapi import FastAPI
+import asyncio
+import math
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
 from app.config import settings
-from app.database import init_db
+from app.database import SessionLocal, init_db
 from app.api.v1 import api_router
+from app.utils.todo_page_cache import todo_page_cache
+from app.utils.todo_events import todo_events
+from app.utils.principal_cache import principal_cache
+from app.utils.token_cache import decoded_token_cache
+from app.utils.password_hasher import password_hasher, PasswordHasherBusy
+from app.utils.token_blacklist import token_blacklist
+from app.utils.rate_limiter import RateLimitMiddleware, rate_limit_store
+from app.utils.login_throttle import login_throttle, LoginThrottled
+from app.services.token_revocation import sync_revoked_tokens
+from app.services.todo import purge_todo_tombstones
+from app.services.password_policy import load_password_hash_rounds
+
+# How often to delete tombstones past TODO_TOMBSTONE_RETENTION_DAYS
+TOMBSTONE_PURGE_INTERVAL_SECONDS = 3600
 
 # Create FastAPI application
 app = FastAPI(
     title=settings.APP_NAME,
     debug=settings.DEBUG,
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
+# Rate limit API requests (added before CORS so that CORS wraps it and
+# 429 responses still carry CORS headers)
+if settings.RATE_LIMIT_ENABLED:
+    app.add_middleware(RateLimitMiddleware)
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -21,15 +45,112 @@ app.add_middleware(
 )
 
 
+def _sync_revoked_tokens() -> int:
+    """Run one revoked token sync with its own short-lived session."""
+    db = SessionLocal()
+    try:
+        return sync_revoked_tokens(db)
+    finally:
+        db.close()
+
+
+async def _sync_revoked_tokens_forever(interval: float) -> None:
+    """Pick up tokens revoked by other workers every interval seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(_sync_revoked_tokens)
+        except Exception as e:
+            print(f"⚠️  Revoked token sync failed: {e}")
+
+
+def _load_password_hash_rounds() -> int:
+    """Load (or calibrate and store) the bcrypt cost with its own short-lived session."""
+    db = SessionLocal()
+    try:
+        return load_password_hash_rounds(db)
+    finally:
+        db.close()
+
+
+def _purge_todo_tombstones() -> int:
+    """Run one tombstone purge with its own short-lived session."""
+    db = SessionLocal()
+    try:
+        return purge_todo_tombstones(db)
+    finally:
+        db.close()
+
+
+async def _purge_todo_tombstones_forever(interval: float) -> None:
+    """Delete tombstones past the retention horizon now and every interval seconds."""
+    while True:
+        try:
+            purged = await run_in_threadpool(_purge_todo_tombstones)
+            if purged:
+                print(f"🧹 Purged {purged} todo tombstones")
+        except Exception as e:
+            print(f"⚠️  Tombstone purge failed: {e}")
+        await asyncio.sleep(interval)
+
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize database on application startup."""
     init_db()
+    
+    # Load the tokens still revoked, then follow revocations by other workers
+    revoked = await run_in_threadpool(_sync_revoked_tokens)
+    print(f"🔒 Revoked tokens loaded: {revoked}")
+    if settings.TOKEN_REVOCATION_SYNC_SECONDS > 0:
+        app.state.revocation_sync = asyncio.create_task(
+            _sync_revoked_tokens_forever(settings.TOKEN_REVOCATION_SYNC_SECONDS)
+        )
+    
+    if settings.TODO_TOMBSTONE_RETENTION_DAYS > 0:
+        app.state.tombstone_purge = asyncio.create_task(
+            _purge_todo_tombstones_forever(TOMBSTONE_PURGE_INTERVAL_SECONDS)
+        )
+    
+    if settings.PASSWORD_HASH_TARGET_MS > 0:
+        rounds = await run_in_threadpool(_load_password_hash_rounds)
+        print(f"🔑 Password hashing: bcrypt cost {rounds} (budget {settings.PASSWORD_HASH_TARGET_MS} ms)")
+    
     print(f"✅ {settings.APP_NAME} started successfully")
     print(f"📊 Database: {settings.DATABASE_URL}")
     print(f"🐛 Debug mode: {settings.DEBUG}")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the background tasks and the password hashing worker processes."""
+    for name in ("revocation_sync", "tombstone_purge"):
+        task = getattr(app.state, name, None)
+        if task is not None:
+            task.cancel()
+    password_hasher.shutdown()
+
+
+@app.exception_handler(PasswordHasherBusy)
+async def password_hasher_busy_handler(request: Request, exc: PasswordHasherBusy):
+    """Shed password work beyond the hasher's queue cap with 503."""
+    return ORJSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Too many authentication requests, try again shortly"},
+        headers={"Retry-After": "1"}
+    )
+
+
+@app.exception_handler(LoginThrottled)
+async def login_throttled_handler(request: Request, exc: LoginThrottled):
+    """Reject logins during a failed-login backoff with 429."""
+    return ORJSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(math.ceil(exc.retry_after))}
+    )
+
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -46,7 +167,15 @@ async def health_check():
     return {
         "status": "healthy",
         "database": "connected",
-        "app_name": settings.APP_NAME
+        "app_name": settings.APP_NAME,
+        "todo_page_cache": todo_page_cache.stats(),
+        "todo_events": todo_events.stats(),
+        "principal_cache": principal_cache.stats(),
+        "decoded_token_cache": decoded_token_cache.stats(),
+        "token_blacklist": token_blacklist.stats(),
+        "rate_limit": rate_limit_store.stats(),
+        "login_throttle": login_throttle.stats(),
+        "password_hasher": password_hasher.stats()
     }
 
 
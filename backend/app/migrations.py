@@ -0,0 +1,246 @@
+from sqlalchemy import inspect, text, update, case
+from sqlalchemy.engine import Engine
+
+
+def run_migrations(engine: Engine) -> None:
+    """
+    Bring an existing database schema up to date with the models.
+    
+    create_all() only creates missing tables, so columns and indexes added
+    to existing tables are applied here. Every step is idempotent and safe
+    to run on each startup.
+    
+    Args:
+        engine: SQLAlchemy engine bound to the database
+    """
+    add_todo_priority_rank(engine)
+    add_todo_change_seq(engine)
+    sync_todo_indexes(engine)
+    sync_tombstone_indexes(engine)
+    add_user_todos_version(engine)
+    add_user_token_version(engine)
+    create_todo_search_index(engine)
+
+
+def _column_names(engine: Engine, table: str) -> set:
+    """Get the column names of a table as they exist in the database."""
+    return {column["name"] for column in inspect(engine).get_columns(table)}
+
+
+def _index_names(engine: Engine, table: str) -> set:
+    """Get the index names of a table as they exist in the database."""
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def add_todo_priority_rank(engine: Engine) -> None:
+    """
+    Add and backfill todos.priority_rank.
+    
+    Args:
+        engine: SQLAlchemy engine bound to the database
+    """
+    from app.models.todo import Todo, PRIORITY_RANKS
+    
+    if "priority_rank" in _column_names(engine, "todos"):
+        return
+    
+    with engine.begin() as conn:
+        conn.execute(text(
+            "ALTER TABLE todos ADD COLUMN priority_rank SMALLINT NOT NULL DEFAULT 0"
+        ))
+        conn.execute(
+            update(Todo.__table__).values(priority_rank=case(
+                *[(Todo.priority == level, rank) for level, rank in PRIORITY_RANKS.items()],
+                else_=0
+            ))
+        )
+    
+    print("✅ Migration: added todos.priority_rank")
+
+
+def add_todo_change_seq(engine: Engine) -> None:
+    """
+    Add todos.change_seq (0 for existing todos, i.e. before any sync cursor).
+    
+    Args:
+        engine: SQLAlchemy engine bound to the database
+    """
+    if "change_seq" in _column_names(engine, "todos"):
+        return
+    
+    with engine.begin() as conn:
+        conn.execute(text(
+            "ALTER TABLE todos ADD COLUMN change_seq INTEGER NOT NULL DEFAULT 0"
+        ))
+    
+    print("✅ Migration: added todos.change_seq")
+
+
+def sync_todo_indexes(engine: Engine) -> None:
+    """
+    Create todo indexes defined on the model and drop replaced ones.
+    
+    Args:
+        engine: SQLAlchemy engine bound to the database
+    """
+    from app.models.todo import Todo, OBSOLETE_INDEXES
+    
+    existing = _index_names(engine, "todos")
+    
+    with engine.begin() as conn:
+        for name in OBSOLETE_INDEXES:
+            if name in existing:
+                conn.execute(text(f"DROP INDEX {name}"))
+                print(f"✅ Migration: dropped index {name}")
+        
+        for index in Todo.__table__.indexes:
+            if index.name not in existing:
+                index.create(conn)
+                print(f"✅ Migration: created index {index.name}")
+
+
+def sync_tombstone_indexes(engine: Engine) -> None:
+    """
+    Create todo tombstone indexes defined on the model.
+    
+    Args:
+        engine: SQLAlchemy engine bound to the database
+    """
+    from app.models.todo_tombstone import TodoTombstone
+    
+    existing = _index_names(engine, "todo_tombstones")
+    
+    with engine.begin() as conn:
+        for index in TodoTombstone.__table__.indexes:
+            if index.name not in existing:
+                index.create(conn)
+                print(f"✅ Migration: created index {index.name}")
+
+
+def add_user_todos_version(engine: Engine) -> None:
+    """
+    Add users.todos_version (starts at 0 for existing users).
+    
+    Args:
+        engine: SQLAlchemy engine bound to the database
+    """
+    if "todos_version" in _column_names(engine, "users"):
+        return
+    
+    with engine.begin() as conn:
+        conn.execute(text(
+            "ALTER TABLE users ADD COLUMN todos_version INTEGER NOT NULL DEFAULT 0"
+        ))
+    
+    print("✅ Migration: added users.todos_version")
+
+
+def add_user_token_version(engine: Engine) -> None:
+    """
+    Add users.token_version (starts at 0 for existing users).
+    
+    Args:
+        engine: SQLAlchemy engine bound to the database
+    """
+    if "token_version" in _column_names(engine, "users"):
+        return
+    
+    with engine.begin() as conn:
+        conn.execute(text(
+            "ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0"
+        ))
+    
+    print("✅ Migration: added users.token_version")
+
+
+def create_todo_search_index(engine: Engine) -> None:
+    """
+    Create the full-text search index over todo titles and descriptions.
+    
+    On SQLite this is an FTS5 table kept in sync by triggers on todos, so
+    every write path (ORM or Core) updates it in the same transaction. On
+    PostgreSQL it is a GIN index over a tsvector expression. Other
+    databases are left without a search index.
+    
+    todos has no INTEGER PRIMARY KEY, so its implicit rowid may be
+    renumbered by VACUUM and cannot key the FTS rows. Instead each todo id
+    gets a key in todos_fts_keys (INTEGER PRIMARY KEY, never renumbered)
+    that is the rowid of its FTS row. An FTS table from before the keys
+    table (keyed by the todos rowid) is dropped and rebuilt.
+    
+    Args:
+        engine: SQLAlchemy engine bound to the database
+    """
+    from app.models.todo import TODO_FTS_TABLE, TODO_FTS_KEYS_TABLE, TODO_SEARCH_INDEX, TODO_TSVECTOR_SQL
+    
+    if engine.dialect.name == "postgresql":
+        if TODO_SEARCH_INDEX in _index_names(engine, "todos"):
+            return
+        with engine.begin() as conn:
+            conn.execute(text(
+                f"CREATE INDEX {TODO_SEARCH_INDEX} ON todos USING GIN ({TODO_TSVECTOR_SQL})"
+            ))
+        print(f"✅ Migration: created index {TODO_SEARCH_INDEX}")
+        return
+    
+    if engine.dialect.name != "sqlite" or TODO_FTS_KEYS_TABLE in inspect(engine).get_table_names():
+        return
+    
+    fts_key = f"(SELECT rowid FROM {TODO_FTS_KEYS_TABLE} WHERE todo_id = {{row}}.id)"
+    
+    with engine.begin() as conn:
+        for trigger in ("ai", "ad", "au"):
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {TODO_FTS_TABLE}_{trigger}"))
+        conn.execute(text(f"DROP TABLE IF EXISTS {TODO_FTS_TABLE}"))
+        
+        conn.execute(text(
+            f"CREATE TABLE {TODO_FTS_KEYS_TABLE} ("
+            "rowid INTEGER PRIMARY KEY, todo_id CHAR(36) NOT NULL UNIQUE)"
+        ))
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE {TODO_FTS_TABLE} USING fts5("
+            "title, description, tokenize='unicode61 remove_diacritics 2')"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER {TODO_FTS_TABLE}_ai AFTER INSERT ON todos BEGIN "
+            f"INSERT INTO {TODO_FTS_KEYS_TABLE}(todo_id) VALUES (new.id); "
+            f"INSERT INTO {TODO_FTS_TABLE}(rowid, title, description) "
+            f"VALUES ({fts_key.format(row='new')}, new.title, new.description); "
+            "END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER {TODO_FTS_TABLE}_ad AFTER DELETE ON todos BEGIN "
+            f"DELETE FROM {TODO_FTS_TABLE} WHERE rowid = {fts_key.format(row='old')}; "
+            f"DELETE FROM {TODO_FTS_KEYS_TABLE} WHERE todo_id = old.id; "
+            "END"
+        ))
+        conn.execute(text(
+            f"CREATE TRIGGER {TODO_FTS_TABLE}_au AFTER UPDATE OF title, description ON todos BEGIN "
+            f"UPDATE {TODO_FTS_TABLE} SET title = new.title, description = new.description "
+            f"WHERE rowid = {fts_key.format(row='old')}; "
+            "END"
+        ))
+    
+    rebuild_todo_search_index(engine)
+    
+    print(f"✅ Migration: created full-text search table {TODO_FTS_TABLE}")
+
+
+def rebuild_todo_search_index(engine: Engine) -> None:
+    """
+    Re-index all todos in the SQLite FTS5 table from the todos table.
+    
+    Args:
+        engine: SQLAlchemy engine bound to the database
+    """
+    from app.models.todo import TODO_FTS_TABLE, TODO_FTS_KEYS_TABLE
+    
+    with engine.begin() as conn:
+        conn.execute(text(f"DELETE FROM {TODO_FTS_TABLE}"))
+        conn.execute(text(f"DELETE FROM {TODO_FTS_KEYS_TABLE}"))
+        conn.execute(text(f"INSERT INTO {TODO_FTS_KEYS_TABLE}(todo_id) SELECT id FROM todos"))
+        conn.execute(text(
+            f"INSERT INTO {TODO_FTS_TABLE}(rowid, title, description) "
+            f"SELECT k.rowid, t.title, t.description "
+            f"FROM {TODO_FTS_KEYS_TABLE} k JOIN todos t ON t.id = k.todo_id"
+        ))
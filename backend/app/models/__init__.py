@@ -1,5 +1,8 @@
 from app.models.user import User
 from app.models.password_reset import PasswordResetToken
 from app.models.todo import Todo, PriorityLevel
+from app.models.todo_tombstone import TodoTombstone
+from app.models.revoked_token import RevokedToken
+from app.models.app_setting import AppSetting
 
-__all__ = ["User", "PasswordResetToken", "Todo", "PriorityLevel"]
\ No newline at end of file
+__all__ = ["User", "PasswordResetToken", "Todo", "PriorityLevel", "TodoTombstone", "RevokedToken", "AppSetting"]
\ No newline at end of file
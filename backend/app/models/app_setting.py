@@ -0,0 +1,30 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class AppSetting(Base):
+    """
+    Value computed once and shared by every worker process.
+    
+    Used for settings measured at runtime rather than configured, e.g. the
+    calibrated bcrypt cost (see app.services.password_policy): the first
+    worker to compute one stores it, and every other worker reads it back.
+    
+    Attributes:
+        name: Setting name
+        value: Setting value, as text
+        created_at: When the value was stored
+    """
+    __tablename__ = "app_settings"
+    
+    name = Column(String(100), primary_key=True)
+    value = Column(String(255), nullable=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    
+    def __repr__(self):
+        return f"<AppSetting(name='{self.name}', value='{self.value}')>"
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, Integer, LargeBinary, Index
+from app.database import Base
+
+
+class RevokedToken(Base):
+    """
+    Record of a revoked (logged out or refreshed) access token.
+    
+    Shared by all worker processes: each one loads the rows added since
+    its last sync into its local token blacklist (see
+    app.services.token_revocation).
+    
+    Attributes:
+        id: Autoincrement sequence, the workers' sync cursor (never reused;
+            ids committed late are caught by re-reading an overlap window)
+        token_digest: 16-byte BLAKE2b digest of the token (see TokenBlacklist.digest)
+        expires_at: Token's exp claim (Unix seconds); the row is purged after that
+    """
+    __tablename__ = "revoked_tokens"
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    token_digest = Column(LargeBinary(16), unique=True, nullable=False)
+    expires_at = Column(Integer, nullable=False)
+    
+    __table_args__ = (
+        # Serves the purge of expired rows
+        Index('ix_revoked_tokens_expires_at', 'expires_at'),
+        {'sqlite_autoincrement': True},
+    )
+    
+    def __repr__(self):
+        return f"<RevokedToken(id={self.id}, expires_at={self.expires_at})>"
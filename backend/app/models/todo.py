@@ -1,6 +1,7 @@
-from sqlalchemy import Column, String, Text, Boolean, Date, DateTime, ForeignKey, Index, Enum as SQLEnum
+from sqlalchemy import Column, String, Text, Boolean, Date, DateTime, SmallInteger, Integer, ForeignKey, Index, Enum as SQLEnum
 from sqlalchemy.sql import func
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
+from typing import Optional
 import uuid
 import enum
 from app.database import Base
@@ -14,6 +15,47 @@ class PriorityLevel(str, enum.Enum):
     HIGH = "high"
 
 
+# Sortable rank for each priority (no priority ranks lowest, as 0)
+PRIORITY_RANKS = {
+    PriorityLevel.LOW: 1,
+    PriorityLevel.MEDIUM: 2,
+    PriorityLevel.HIGH: 3,
+}
+
+# Indexes replaced by newer definitions, dropped by migrations
+OBSOLETE_INDEXES = [
+    'ix_todos_user_id',
+    'ix_todos_user_completed',
+    'ix_todos_user_created',
+    'ix_todos_user_due_date',
+    'ix_todos_user_priority',
+]
+
+# Full-text search over title and description, created by migrations
+# (not create_all): an FTS5 table on SQLite, a GIN index on PostgreSQL
+TODO_FTS_TABLE = 'todos_fts'
+TODO_FTS_KEYS_TABLE = 'todos_fts_keys'  # FTS rowid <-> todo id
+TODO_SEARCH_INDEX = 'ix_todos_search'
+TODO_TSVECTOR_SQL = (
+    "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(description, ''))"
+)
+
+
+def priority_rank(priority: Optional[PriorityLevel]) -> int:
+    """
+    Get the sortable rank for a priority level.
+    
+    Args:
+        priority: Priority level, or None
+        
+    Returns:
+        Rank from 0 (no priority) to 3 (high)
+    """
+    if priority is None:
+        return 0
+    return PRIORITY_RANKS[PriorityLevel(priority)]
+
+
 class Todo(Base):
     """
     Todo model for task management.
@@ -24,10 +66,14 @@ class Todo(Base):
         title: Todo title (required, max 200 chars)
         description: Detailed description (optional)
         priority: Priority level (low/medium/high, optional)
+        priority_rank: Sortable priority (0 = none, 1 = low ... 3 = high),
+            kept in sync with priority
         due_date: Due date (required)
         is_completed: Completion status (default False)
         created_at: When todo was created
         updated_at: When todo was last updated
+        change_seq: Owner's todos_version of the last transaction that
+            created or updated the todo (0 for todos older than delta sync)
     """
     __tablename__ = "todos"
     
@@ -41,8 +87,7 @@ class Todo(Base):
     user_id = Column(
         GUID,
         ForeignKey('users.id', ondelete='CASCADE'),
-        nullable=False,
-        index=True
+        nullable=False
     )
     title = Column(
         String(200),
@@ -56,6 +101,12 @@ class Todo(Base):
         SQLEnum(PriorityLevel),
         nullable=True
     )
+    priority_rank = Column(
+        SmallInteger,
+        default=0,
+        server_default="0",
+        nullable=False
+    )
     due_date = Column(
         Date,
         nullable=False
@@ -76,21 +127,40 @@ class Todo(Base):
         onupdate=func.now(),
         nullable=False
     )
+    change_seq = Column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False
+    )
     
     # Relationship to User
     user = relationship("User", backref="todos")
     
-    # Composite indexes for efficient queries
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself
+    __mapper_args__ = {"eager_defaults": True}
+    
+    # Composite indexes matching the list query:
+    #   WHERE user_id = ? AND is_completed = ? ORDER BY <sort column>, id
+    # Each one serves the filter, the sort (including the id tie-break) and
+    # the keyset seek, so listing never needs a temp B-tree. The user_id
+    # prefix also serves lookups by user alone (e.g. deleting a user).
     __table_args__ = (
-        # Index for filtering by user and completion status
-        Index('ix_todos_user_completed', 'user_id', 'is_completed'),
         # Index for sorting by creation date
-        Index('ix_todos_user_created', 'user_id', 'created_at'),
+        Index('ix_todos_user_completed_created', 'user_id', 'is_completed', 'created_at', 'id'),
         # Index for sorting by due date
-        Index('ix_todos_user_due_date', 'user_id', 'due_date'),
-        # Index for filtering/sorting by priority
-        Index('ix_todos_user_priority', 'user_id', 'priority'),
+        Index('ix_todos_user_completed_due_date', 'user_id', 'is_completed', 'due_date', 'id'),
+        # Index for sorting by priority
+        Index('ix_todos_user_priority_rank', 'user_id', 'is_completed', 'priority_rank', 'id'),
+        # Index for delta sync (GET /api/todos/changes)
+        Index('ix_todos_user_change_seq', 'user_id', 'change_seq', 'id'),
     )
     
+    @validates('priority')
+    def _sync_priority_rank(self, key, value):
+        """Keep priority_rank in sync whenever priority is assigned."""
+        self.priority_rank = priority_rank(value)
+        return value
+    
     def __repr__(self):
         return f"<Todo(id={self.id}, title='{self.title}', user_id={self.user_id}, completed={self.is_completed})>"
\ No newline at end of file
@@ -0,0 +1,40 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
+from sqlalchemy.sql import func
+from app.database import Base
+from app.models.user import GUID
+
+
+class TodoTombstone(Base):
+    """
+    Record of a deleted (or completed, hence deleted) todo, for delta sync.
+    
+    Attributes:
+        todo_id: ID of the deleted todo
+        user_id: Foreign key to User (owner of the todo)
+        change_seq: User's todos_version of the deleting transaction
+        deleted_at: When the todo was deleted
+    """
+    __tablename__ = "todo_tombstones"
+    
+    todo_id = Column(GUID, primary_key=True, nullable=False)
+    user_id = Column(
+        GUID,
+        ForeignKey('users.id', ondelete='CASCADE'),
+        nullable=False
+    )
+    change_seq = Column(Integer, nullable=False)
+    deleted_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        nullable=False
+    )
+    
+    __table_args__ = (
+        # Serves GET /api/todos/changes
+        Index('ix_todo_tombstones_user_seq', 'user_id', 'change_seq', 'todo_id'),
+        # Serves the purge of tombstones past the retention horizon
+        Index('ix_todo_tombstones_deleted_at', 'deleted_at'),
+    )
+    
+    def __repr__(self):
+        return f"<TodoTombstone(todo_id={self.todo_id}, change_seq={self.change_seq})>"
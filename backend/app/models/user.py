@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean, DateTime, Index, TypeDecorator, CHAR
+from sqlalchemy import Column, String, Boolean, Integer, DateTime, Index, TypeDecorator, CHAR
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.sql import func
 import uuid
@@ -51,6 +51,9 @@ class User(Base):
         created_at: Timestamp of user creation
         updated_at: Timestamp of last update
         is_active: Whether the user account is active
+        todos_version: Counter bumped on every change to the user's todos
+        token_version: Counter baked into access tokens ("ver" claim), bumped
+            to revoke all of the user's tokens at once
     """
     __tablename__ = "users"
     
@@ -80,6 +83,11 @@ class User(Base):
         nullable=False
     )
     is_active = Column(Boolean, default=True, nullable=False)
+    todos_version = Column(Integer, default=0, server_default="0", nullable=False)
+    token_version = Column(Integer, default=0, server_default="0", nullable=False)
+    
+    # Fetch server-generated timestamps in the INSERT/UPDATE itself
+    __mapper_args__ = {"eager_defaults": True}
       
     def __repr__(self):
         return f"<User(id={self.id}, username={self.username})>"
\ No newline at end of file
@@ -1,7 +1,8 @@
 from pydantic import BaseModel, Field, field_validator
 from datetime import date, datetime
-from typing import Optional, List
+from typing import Optional, List, Dict, Any
 from enum import Enum
+from uuid import UUID
 from app.models.todo import PriorityLevel
 
 
@@ -9,6 +10,7 @@ class SortField(str, Enum):
     CREATED_AT = "created_at"
     DUE_DATE = "due_date"
     PRIORITY = "priority"
+    RELEVANCE = "relevance"  # search results only
 
 
 class SortOrder(str, Enum):
@@ -16,6 +18,20 @@ class SortOrder(str, Enum):
     DESC = "desc"
 
 
+class CountStrategy(str, Enum):
+    """How the total for a todo list page is computed."""
+    EXACT = "exact"    # Separate COUNT query (two scans)
+    WINDOW = "window"  # COUNT(*) OVER() in the page query (one round trip)
+    CACHED = "cached"  # Per-user in-memory counter kept up to date on writes
+    NONE = "none"      # No total, only has_more
+
+
+class ExportFormat(str, Enum):
+    """File format of a todo export or import."""
+    NDJSON = "ndjson"  # One JSON object per line
+    CSV = "csv"
+
+
 class TodoCreate(BaseModel):
     """Schema for creating a new todo."""
     title: str = Field(
@@ -154,12 +170,149 @@ class TodoUpdate(BaseModel):
         }
 
 
+class TodoBatchCreate(BaseModel):
+    """Schema for creating many todos in one request."""
+    items: List[Dict[str, Any]] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Todos to create (same fields as TodoCreate, max 500)"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "items": [
+                    {"title": "Buy milk", "due_date": "2024-12-31"},
+                    {"title": "Call mom", "priority": "high", "due_date": "2024-12-25"}
+                ]
+            }
+        }
+
+
+class TodoBatchError(BaseModel):
+    """Validation errors for one item of a batch request."""
+    index: int = Field(..., description="Position of the item in the request")
+    errors: List[str] = Field(..., description="Validation error messages")
+
+
+class TodoBatchCreateResponse(BaseModel):
+    """Schema for batch create response."""
+    created: List[TodoResponse]
+    errors: List[TodoBatchError]
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "created": [
+                    {
+                        "id": "550e8400-e29b-41d4-a716-446655440000",
+                        "user_id": "660e8400-e29b-41d4-a716-446655440001",
+                        "title": "Buy milk",
+                        "description": None,
+                        "priority": None,
+                        "due_date": "2024-12-31",
+                        "is_completed": False,
+                        "created_at": "2024-01-15T10:30:00Z",
+                        "updated_at": "2024-01-15T10:30:00Z"
+                    }
+                ],
+                "errors": [
+                    {"index": 1, "errors": ["priority: Input should be 'low', 'medium' or 'high'"]}
+                ]
+            }
+        }
+
+
+class TodoChangesResponse(BaseModel):
+    """Schema for delta sync response."""
+    todos: List[TodoResponse] = Field(..., description="Todos created or updated since the cursor")
+    deleted: List[str] = Field(..., description="IDs of todos deleted (or completed) since the cursor")
+    cursor: str = Field(..., description="Cursor to pass as since on the next call")
+    has_more: bool = Field(..., description="True if more changes are waiting (call again right away)")
+
+
+class TodoImportError(BaseModel):
+    """Validation errors for one record of an import file."""
+    line: int = Field(..., description="Line number of the record in the file (1-based)")
+    errors: List[str] = Field(..., description="Validation error messages")
+
+
+class TodoImportResponse(BaseModel):
+    """Schema for import summary."""
+    imported: int = Field(..., description="Number of todos created")
+    failed: int = Field(..., description="Number of records rejected")
+    errors: List[TodoImportError] = Field(
+        ...,
+        description="Errors of the first rejected records (see errors_truncated)"
+    )
+    errors_truncated: bool = Field(
+        ...,
+        description="True if more records failed than are listed in errors"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "imported": 4998,
+                "failed": 2,
+                "errors": [
+                    {"line": 17, "errors": ["due_date: Field required"]},
+                    {"line": 240, "errors": ["Invalid JSON"]}
+                ],
+                "errors_truncated": False
+            }
+        }
+
+
+class TodoBulkIds(BaseModel):
+    """Schema for completing or deleting many todos by ID."""
+    ids: List[UUID] = Field(
+        ...,
+        min_length=1,
+        max_length=500,
+        description="Todo IDs (max 500)"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "ids": [
+                    "550e8400-e29b-41d4-a716-446655440000",
+                    "550e8400-e29b-41d4-a716-446655440001"
+                ]
+            }
+        }
+
+
+class TodoBulkResult(BaseModel):
+    """Schema for bulk complete/delete response."""
+    removed: List[str] = Field(..., description="IDs of todos that were removed")
+    not_found: List[str] = Field(
+        ...,
+        description="IDs that don't exist or don't belong to the user"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "removed": ["550e8400-e29b-41d4-a716-446655440000"],
+                "not_found": ["550e8400-e29b-41d4-a716-446655440001"]
+            }
+        }
+
+
 class PaginationMetadata(BaseModel):
     """Pagination metadata."""
-    total: int = Field(..., description="Total number of items")
+    total: Optional[int] = Field(..., description="Total number of items (null if not counted)")
     page: int = Field(..., description="Current page number")
     page_size: int = Field(..., description="Number of items per page")
-    total_pages: int = Field(..., description="Total number of pages")
+    total_pages: Optional[int] = Field(..., description="Total number of pages (null if not counted)")
+    has_more: bool = Field(..., description="Whether there is a next page")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page (null on the last page)"
+    )
     
     class Config:
         json_schema_extra = {
@@ -167,7 +320,9 @@ class PaginationMetadata(BaseModel):
                 "total": 42,
                 "page": 1,
                 "page_size": 20,
-                "total_pages": 3
+                "total_pages": 3,
+                "has_more": True,
+                "next_cursor": "eyJzIjoiY3JlYXRlZF9hdCIsIm8iOiJkZXNjIn0"
             }
         }
 
@@ -197,7 +352,9 @@ class TodoListResponse(BaseModel):
                     "total": 42,
                     "page": 1,
                     "page_size": 20,
-                    "total_pages": 3
+                    "total_pages": 3,
+                    "has_more": True,
+                    "next_cursor": "eyJzIjoiY3JlYXRlZF9hdCIsIm8iOiJkZXNjIn0"
                 }
             }
         }
\ No newline at end of file
@@ -7,14 +7,23 @@ from app.services.password_reset import (
     cleanup_expired_tokens
 )
 from app.services.user import update_user_profile, deactivate_user, delete_user
+from app.services.token_revocation import revoke_token, sync_revoked_tokens
+from app.services.password_policy import load_password_hash_rounds
 from app.services.todo import (
     create_todo, 
+    create_todos,
+    import_todos,
     get_todo_by_id, 
-    update_todo,
-    complete_and_delete_todo,
-    delete_todo,
+    update_todo_by_id,
+    delete_todo_by_id,
+    delete_todos_by_ids,
     get_user_todos,
-    calculate_total_pages
+    iter_user_todos,
+    get_todo_changes,
+    get_todos_version,
+    purge_todo_tombstones,
+    calculate_total_pages,
+    ChangesCursorExpired
 )
 
 __all__ = [
@@ -29,11 +38,21 @@ __all__ = [
     "update_user_profile",
     "deactivate_user",
     "delete_user",
+    "revoke_token",
+    "sync_revoked_tokens",
+    "load_password_hash_rounds",
     "create_todo",
+    "create_todos",
+    "import_todos",
     "get_todo_by_id",
-    "update_todo",
-    "complete_and_delete_todo",
-    "delete_todo",
+    "update_todo_by_id",
+    "delete_todo_by_id",
+    "delete_todos_by_ids",
     "get_user_todos",
-    "calculate_total_pages"
+    "iter_user_todos",
+    "get_todo_changes",
+    "get_todos_version",
+    "purge_todo_tombstones",
+    "calculate_total_pages",
+    "ChangesCursorExpired"
 ]
\ No newline at end of file
@@ -1,8 +1,12 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import select
 from typing import Optional
+from app.database import commit_without_expiring
 from app.models.user import User
 from app.schemas.user import UserCreate
-from app.utils.security import hash_password, verify_password
+from app.utils.security import hash_password, verify_password, password_needs_rehash
+from app.utils.password_hasher import PasswordHasherBusy
+from app.utils.principal_cache import Principal
 
 
 def get_user_by_username(db: Session, username: str) -> Optional[User]:
@@ -33,6 +37,29 @@ def get_user_by_id(db: Session, user_id: str) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
 
 
+def get_principal_by_id(db: Session, user_id: str) -> Optional[Principal]:
+    """
+    Retrieve the authorization fields of a user by ID.
+    
+    Reads only id, username, is_active and token_version rather than the
+    full row.
+    
+    Args:
+        db: Database session
+        user_id: User ID to search for
+        
+    Returns:
+        Principal if found, None otherwise
+    """
+    row = db.execute(
+        select(User.id, User.username, User.is_active, User.token_version)
+        .where(User.id == user_id)
+    ).first()
+    if row is None:
+        return None
+    return Principal(row.id, row.username, row.is_active, row.token_version)
+
+
 def create_user(db: Session, user_data: UserCreate) -> User:
     """
     Create a new user with hashed password.
@@ -61,10 +88,9 @@ def create_user(db: Session, user_data: UserCreate) -> User:
         password_hash=hashed_password
     )
     
-    # Add to database
+    # Add to database (server defaults come back through INSERT ... RETURNING)
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    commit_without_expiring(db)
     
     return db_user
 
@@ -73,6 +99,10 @@ def authenticate_user(db: Session, username: str, password: str) -> Optional[Use
     """
     Authenticate a user with username and password.
     
+    A hash made under an older policy (e.g. a lower bcrypt cost) is
+    replaced in place with one made under the current policy, since the
+    plain password is at hand only now.
+    
     Args:
         db: Database session
         username: Username
@@ -92,4 +122,12 @@ def authenticate_user(db: Session, username: str, password: str) -> Optional[Use
     if not verify_password(password, user.password_hash):
         return None
     
+    if password_needs_rehash(user.password_hash):
+        try:
+            user.password_hash = hash_password(password)
+            db.commit()
+        except PasswordHasherBusy:
+            # Not worth failing the login for; retried on the next one
+            pass
+    
     return user
\ No newline at end of file
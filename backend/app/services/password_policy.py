@@ -0,0 +1,46 @@
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.app_setting import AppSetting
+from app.utils.password_hasher import password_hasher
+
+
+def load_password_hash_rounds(db: Session) -> int:
+    """
+    Set the bcrypt cost of new hashes from the shared calibration.
+    
+    With PASSWORD_HASH_TARGET_MS set, the cost is measured once per budget
+    and stored in app_settings; later workers and restarts reuse it, so all
+    workers hash at the same cost (workers calibrating separately could
+    disagree, and each would rehash the others' hashes on login). Delete
+    the row to recalibrate, e.g. after a hardware change. The cost never
+    goes below PASSWORD_HASH_MIN_ROUNDS. Without a budget, the configured
+    PASSWORD_HASH_ROUNDS is used as is.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        bcrypt cost of new hashes
+    """
+    if settings.PASSWORD_HASH_TARGET_MS <= 0:
+        return password_hasher.rounds
+    
+    name = f"password_hash_rounds:{settings.PASSWORD_HASH_TARGET_MS}ms"
+    stored = db.get(AppSetting, name)
+    
+    if stored is None:
+        rounds = password_hasher.calibrate(
+            settings.PASSWORD_HASH_TARGET_MS,
+            min_rounds=settings.PASSWORD_HASH_MIN_ROUNDS
+        )
+        db.add(AppSetting(name=name, value=str(rounds)))
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another worker calibrated concurrently: its value wins
+            db.rollback()
+        stored = db.get(AppSetting, name, populate_existing=True)
+    
+    password_hasher.rounds = max(int(stored.value), settings.PASSWORD_HASH_MIN_ROUNDS)
+    return password_hasher.rounds
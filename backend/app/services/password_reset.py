@@ -6,6 +6,7 @@ from app.models.password_reset import PasswordResetToken
 from app.models.user import User
 from app.services.auth import get_user_by_username
 from app.utils.security import hash_password
+from app.utils.principal_cache import principal_cache
 
 
 def generate_reset_token() -> str:
@@ -113,6 +114,8 @@ def use_reset_token(db: Session, token: str, new_password: str) -> bool:
     """
     Use a password reset token to change user's password.
     
+    Also bumps the user's token_version, revoking their access tokens.
+    
     Args:
         db: Database session
         token: Reset token string
@@ -127,8 +130,9 @@ def use_reset_token(db: Session, token: str, new_password: str) -> bool:
     if not user:
         return False
     
-    # Update user password
+    # Update user password and log out everywhere
     user.password_hash = hash_password(new_password)
+    user.token_version += 1
     
     # Mark token as used
     reset_token = get_reset_token(db, token)
@@ -137,6 +141,8 @@ def use_reset_token(db: Session, token: str, new_password: str) -> bool:
     # Commit changes
     db.commit()
     
+    principal_cache.invalidate(str(user.id))
+    
     return True
 
 
@@ -1,10 +1,30 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import case
-from typing import Optional, Tuple, List
-from app.models.todo import Todo, PriorityLevel
-from app.models.user import User
-from app.schemas.todo import TodoCreate, TodoUpdate, SortField, SortOrder
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import (
+    or_, and_, func, insert, update, delete, select, literal, literal_column, table, column,
+    type_coerce, String, Float, Row
+)
+from sqlalchemy.orm import Query
+from typing import Optional, Tuple, List, Dict, Any, Iterable, Iterator
+from pydantic import ValidationError
+from app.config import settings
+from app.database import commit_without_expiring
+from app.models.todo import Todo, priority_rank, TODO_FTS_TABLE, TODO_FTS_KEYS_TABLE, TODO_TSVECTOR_SQL
+from app.models.user import User, GUID
+from app.models.todo_tombstone import TodoTombstone
+from app.schemas.todo import TodoCreate, TodoUpdate, SortField, SortOrder, CountStrategy
+from app.utils.pagination import encode_cursor, decode_cursor
+from app.utils.todo_counter import todo_counter
+from app.utils.todo_page_cache import todo_page_cache
+from app.utils.todo_events import todo_events
+from datetime import datetime, timedelta, timezone
 import math
+import re
+import time
+import uuid
+
+
+class ChangesCursorExpired(ValueError):
+    """Raised when a delta sync cursor predates the tombstone retention horizon."""
 
 
 def create_todo(db: Session, user: User, todo_data: TodoCreate) -> Todo:
@@ -19,24 +39,205 @@ def create_todo(db: Session, user: User, todo_data: TodoCreate) -> Todo:
     Returns:
         Created Todo object
     """
+    change_seq = _bump_todos_version(db, user.id)
+    
     # Create todo object
     todo = Todo(
         user_id=user.id,
         title=todo_data.title,
         description=todo_data.description,
         priority=todo_data.priority,
-        due_date=todo_data.due_date
+        due_date=todo_data.due_date,
+        change_seq=change_seq
     )
     
-    # Add to database
+    # Add to database (server defaults come back through INSERT ... RETURNING)
     db.add(todo)
-    db.commit()
-    db.refresh(todo)
+    with todo_counter.writing():
+        commit_without_expiring(db)
+        todo_counter.adjust(str(user.id), 1)
+    
+    todo_page_cache.invalidate(str(user.id))
+    todo_events.publish(str(user.id), "created", [todo.id], change_seq)
     
     return todo
 
 
-def get_todo_by_id(db: Session, todo_id: str, user_id: str) -> Optional[Todo]:
+def create_todos(db: Session, user: User, todos_data: List[TodoCreate]) -> List[Row]:
+    """
+    Create many todos for a user in a single transaction.
+    
+    Rows are inserted with one multi-row INSERT ... RETURNING where the
+    dialect supports it, otherwise with executemany followed by one SELECT
+    of the client-generated ids.
+    
+    Args:
+        db: Database session
+        user: User who owns the todos
+        todos_data: Validated todo creation data
+        
+    Returns:
+        Created todo rows, in the same order as todos_data
+    """
+    if not todos_data:
+        return []
+    
+    change_seq = _bump_todos_version(db, user.id)
+    rows = _todo_rows(user, todos_data, change_seq)
+    
+    # Core rows rather than ORM objects: they stay readable after commit
+    # without a refresh SELECT per todo
+    todos_table = Todo.__table__
+    if db.get_bind().dialect.insert_executemany_returning_sort_by_parameter_order:
+        todos = db.execute(
+            insert(todos_table).returning(*todos_table.c, sort_by_parameter_order=True),
+            rows
+        ).all()
+    else:
+        db.execute(insert(todos_table), rows)
+        ids = [row["id"] for row in rows]
+        by_id = {
+            row.id: row
+            for row in db.execute(select(todos_table).where(todos_table.c.id.in_(ids)))
+        }
+        todos = [by_id[todo_id] for todo_id in ids]
+    
+    with todo_counter.writing():
+        commit_without_expiring(db)
+        todo_counter.adjust(str(user.id), len(todos))
+    
+    todo_page_cache.invalidate(str(user.id))
+    todo_events.publish(str(user.id), "created", [row["id"] for row in rows], change_seq)
+    
+    return todos
+
+
+def _todo_rows(user: User, todos_data: List[TodoCreate], change_seq: int) -> List[Dict[str, Any]]:
+    """Build INSERT parameters for new todos of a user."""
+    return [
+        {
+            "id": uuid.uuid4(),
+            "user_id": user.id,
+            "title": todo_data.title,
+            "description": todo_data.description,
+            "priority": todo_data.priority,
+            "priority_rank": priority_rank(todo_data.priority),
+            "due_date": todo_data.due_date,
+            "is_completed": False,
+            "change_seq": change_seq
+        }
+        for todo_data in todos_data
+    ]
+
+
+def _insert_todos(db: Session, user: User, todos_data: List[TodoCreate]) -> int:
+    """
+    Insert todos in one transaction without reading them back.
+    
+    Args:
+        db: Database session
+        user: User who owns the todos
+        todos_data: Validated todo creation data
+        
+    Returns:
+        Number of todos created
+    """
+    # RETURNING makes SQLAlchemy batch the rows into multi-row VALUES
+    # statements, which SQLite inserts faster than row-by-row executemany;
+    # only the id is returned to keep result processing cheap
+    todos_table = Todo.__table__
+    change_seq = _bump_todos_version(db, user.id)
+    rows = _todo_rows(user, todos_data, change_seq)
+    if db.get_bind().dialect.insert_executemany_returning:
+        db.execute(insert(todos_table).returning(todos_table.c.id), rows).all()
+    else:
+        db.execute(insert(todos_table), rows)
+    
+    with todo_counter.writing():
+        commit_without_expiring(db)
+        todo_counter.adjust(str(user.id), len(todos_data))
+    
+    todo_page_cache.invalidate(str(user.id))
+    todo_events.publish(str(user.id), "created", [row["id"] for row in rows], change_seq)
+    
+    return len(todos_data)
+
+
+def import_todos(
+    db: Session,
+    user: User,
+    records: Iterable[Tuple[int, Any]],
+    chunk_size: Optional[int] = None,
+    max_errors: int = 100
+) -> Dict[str, Any]:
+    """
+    Validate and create todos from a stream of parsed records.
+    
+    Records are validated one by one with TodoCreate and inserted in
+    transactions of chunk_size todos, so memory use is
+    bounded by one chunk whatever the size of the input. Chunks already
+    committed are kept if a later chunk fails.
+    
+    Args:
+        db: Database session
+        user: User who owns the todos
+        records: (line number, record) pairs; a record of None means the
+            line could not be parsed
+        chunk_size: Todos per transaction (defaults to settings.TODO_IMPORT_CHUNK_SIZE)
+        max_errors: Maximum number of rejected records to list
+        
+    Returns:
+        Dictionary with imported, failed, errors and errors_truncated
+    """
+    if chunk_size is None:
+        chunk_size = settings.TODO_IMPORT_CHUNK_SIZE
+    
+    imported = 0
+    failed = 0
+    errors = []
+    chunk = []
+    
+    for line, record in records:
+        messages = None
+        if record is None:
+            messages = ["Invalid JSON"]
+        elif not isinstance(record, dict):
+            messages = ["Record must be a JSON object"]
+        else:
+            try:
+                chunk.append(TodoCreate.model_validate(record))
+            except ValidationError as e:
+                messages = [
+                    f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+                    for error in e.errors()
+                ]
+        
+        if messages:
+            failed += 1
+            if len(errors) < max_errors:
+                errors.append({"line": line, "errors": messages})
+        
+        if len(chunk) >= chunk_size:
+            imported += _insert_todos(db, user, chunk)
+            chunk = []
+    
+    if chunk:
+        imported += _insert_todos(db, user, chunk)
+    
+    return {
+        "imported": imported,
+        "failed": failed,
+        "errors": errors,
+        "errors_truncated": failed > len(errors)
+    }
+
+
+def get_todo_by_id(
+    db: Session,
+    todo_id: str,
+    user_id: str,
+    fields: Optional[List[str]] = None
+) -> Optional[Todo]:
     """
     Get a todo by ID, ensuring it belongs to the user.
     
@@ -44,89 +245,508 @@ def get_todo_by_id(db: Session, todo_id: str, user_id: str) -> Optional[Todo]:
         db: Database session
         todo_id: Todo ID to retrieve
         user_id: User ID for authorization check
+        fields: Todo attributes to load (optional, default: all)
         
     Returns:
         Todo object if found and belongs to user, None otherwise
     """
-    return db.query(Todo).filter(
+    query = db.query(Todo).filter(
         Todo.id == todo_id,
         Todo.user_id == user_id
-    ).first()
+    )
+    
+    if fields is not None:
+        query = query.options(_load_fields(fields))
+    
+    return query.first()
 
 
-def update_todo(
+def update_todo_by_id(
     db: Session,
-    todo: Todo,
+    todo_id: str,
+    user_id: str,
     update_data: TodoUpdate
-) -> Optional[Todo]:
+) -> Optional[Row]:
     """
-    Update a todo with new data.
+    Update a todo owned by a user in a single statement.
+    
+    Runs UPDATE ... WHERE id = :id AND user_id = :uid RETURNING *, so the
+    ownership check, the write and reading back the new row take one round
+    trip. Dialects without UPDATE ... RETURNING read the row back with a
+    second SELECT.
     
-    If is_completed is set to True, the todo is automatically deleted
-    and None is returned (as per requirements).
+    is_completed is not written here: completing a todo deletes it, which
+    is done with delete_todo_by_id().
     
     Args:
         db: Database session
-        todo: Todo object to update
+        todo_id: Todo ID to update
+        user_id: User ID for authorization check
         update_data: TodoUpdate schema with new values
         
     Returns:
-        Updated Todo object, or None if todo was completed and deleted
+        Updated todo row, or None if not found or not owned by the user
         
     Raises:
         ValueError: If no fields provided for update
     """
     # Check if at least one field is being updated
-    update_dict = update_data.model_dump(exclude_unset=True)
+    values = update_data.model_dump(exclude_unset=True)
     
-    if not update_dict:
+    if not values:
         raise ValueError("At least one field must be provided for update")
     
-    # Check if marking as completed (auto-delete)
-    if update_dict.get('is_completed') == True:
-        # Delete the todo instead of updating
-        db.delete(todo)
-        db.commit()
-        return None  # Signal that todo was deleted
+    values.pop('is_completed', None)
+    if 'priority' in values:
+        values['priority_rank'] = priority_rank(values['priority'])
+    
+    todos_table = Todo.__table__
+    conditions = (
+        todos_table.c.id == todo_id,
+        todos_table.c.user_id == user_id
+    )
+    
+    # Nothing to write (only is_completed=False was sent)
+    if not values:
+        return db.execute(select(todos_table).where(*conditions)).first()
+    
+    values['change_seq'] = _bump_todos_version(db, user_id)
+    
+    # updated_at is set by the column's onupdate
+    stmt = update(todos_table).where(*conditions).values(**values)
+    
+    if db.get_bind().dialect.update_returning:
+        todo = db.execute(stmt.returning(*todos_table.c)).first()
+    else:
+        result = db.execute(stmt)
+        todo = None
+        if result.rowcount:
+            todo = db.execute(select(todos_table).where(*conditions)).first()
     
-    # Update fields (excluding is_completed since we handle it above)
-    for field, value in update_dict.items():
-        if field != 'is_completed':  # Skip is_completed
-            setattr(todo, field, value)
+    if todo is None:
+        # Not found: undo the version bump
+        db.rollback()
+        return None
     
-    # Commit changes (updated_at will be automatically updated)
     db.commit()
-    db.refresh(todo)
+    
+    todo_page_cache.invalidate(str(user_id))
+    todo_events.publish(str(user_id), "updated", [todo.id], values['change_seq'])
     
     return todo
 
 
-def complete_and_delete_todo(db: Session, todo: Todo) -> None:
+def delete_todo_by_id(db: Session, todo_id: str, user_id: str, completed: bool = False) -> bool:
     """
-    Mark a todo as completed and delete it (as per requirements).
+    Delete a todo owned by a user in a single statement (hard delete).
     
-    This is a non-reversible operation.
+    A tombstone is recorded in the same transaction for delta sync.
     
     Args:
         db: Database session
-        todo: Todo object to complete and delete
+        todo_id: Todo ID to delete
+        user_id: User ID for authorization check
+        completed: True if the todo is deleted because it was completed
+            (only changes the published event type)
+        
+    Returns:
+        True if the todo was deleted, False if not found or not owned by the user
     """
-    # Simply delete the todo
-    # No need to mark as completed first since it's being deleted
-    db.delete(todo)
-    db.commit()
+    change_seq = _bump_todos_version(db, user_id)
+    
+    todos_table = Todo.__table__
+    result = db.execute(
+        delete(todos_table).where(
+            todos_table.c.id == todo_id,
+            todos_table.c.user_id == user_id
+        )
+    )
+    
+    if not result.rowcount:
+        # Not found: undo the version bump
+        db.rollback()
+        return False
+    
+    _add_tombstones(db, user_id, [todo_id], change_seq)
+    with todo_counter.writing():
+        db.commit()
+        todo_counter.adjust(str(user_id), -1)
+    
+    todo_page_cache.invalidate(str(user_id))
+    todo_events.publish(str(user_id), "completed" if completed else "deleted", [todo_id], change_seq)
+    
+    return True
+
+
+def delete_todos_by_ids(
+    db: Session,
+    user_id: str,
+    todo_ids: List[str],
+    completed: bool = False
+) -> List[str]:
+    """
+    Delete many todos of a user in one statement (hard delete).
+    
+    Runs a single DELETE ... WHERE user_id = :uid AND id IN (...) RETURNING id,
+    so todos of other users are never touched. Dialects without
+    DELETE ... RETURNING select the matching ids first, in the same
+    transaction. Tombstones for the deleted todos are recorded in the same
+    transaction.
+    
+    Args:
+        db: Database session
+        user_id: User ID for authorization check
+        todo_ids: IDs of the todos to delete
+        completed: True if the todos are deleted because they were completed
+            (only changes the published event type)
+        
+    Returns:
+        IDs of the todos that were actually deleted
+    """
+    change_seq = _bump_todos_version(db, user_id)
+    
+    todos_table = Todo.__table__
+    conditions = (
+        todos_table.c.user_id == user_id,
+        todos_table.c.id.in_(todo_ids)
+    )
+    
+    if db.get_bind().dialect.delete_returning:
+        deleted_ids = db.execute(
+            delete(todos_table).where(*conditions).returning(todos_table.c.id)
+        ).scalars().all()
+    else:
+        deleted_ids = db.execute(
+            select(todos_table.c.id).where(*conditions)
+        ).scalars().all()
+        db.execute(delete(todos_table).where(*conditions))
+    
+    if not deleted_ids:
+        # Nothing deleted: undo the version bump
+        db.rollback()
+        return []
+    
+    _add_tombstones(db, user_id, deleted_ids, change_seq)
+    with todo_counter.writing():
+        db.commit()
+        todo_counter.adjust(str(user_id), -len(deleted_ids))
+    
+    todo_page_cache.invalidate(str(user_id))
+    todo_events.publish(str(user_id), "completed" if completed else "deleted", deleted_ids, change_seq)
+    
+    return [str(todo_id) for todo_id in deleted_ids]
+
+
+def iter_user_todos(
+    db: Session,
+    user_id: str,
+    batch_size: int = 500
+) -> Iterator[List[Row]]:
+    """
+    Stream all uncompleted todos of a user, oldest first, in batches.
+    
+    Each batch is its own keyset query seeking past the last (created_at,
+    id) of the previous one, read completely, and its transaction is ended
+    before the batch is yielded. No read stays open while the caller sends
+    a batch over the network: with SQLite's rollback journal an open read
+    blocks every writer. Memory use does not depend on the number of todos,
+    and the order follows ix_todos_user_completed_created, so each batch is
+    an index range read.
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        batch_size: Number of rows per batch
+        
+    Yields:
+        Lists of todo rows
+    """
+    todos_table = Todo.__table__
+    # Select the sort key as stored, so the next seek compares exactly
+    sort_key = type_coerce(todos_table.c.created_at, String).label("sort_key")
+    last = None
+    
+    while True:
+        query = (
+            select(todos_table, sort_key)
+            .where(todos_table.c.user_id == user_id, todos_table.c.is_completed == False)
+            .order_by(todos_table.c.created_at, todos_table.c.id)
+            .limit(batch_size)
+        )
+        if last is not None:
+            key, last_id = literal(last.sort_key, String), literal(last.id, GUID)
+            query = query.where(
+                todos_table.c.created_at >= key,
+                or_(todos_table.c.created_at > key, todos_table.c.id > last_id)
+            )
+        
+        batch = db.execute(query).all()
+        db.rollback()  # end the read transaction before the batch goes out
+        
+        if batch:
+            yield batch
+        if len(batch) < batch_size:
+            return
+        last = batch[-1]
+
+
+def get_todo_changes(
+    db: Session,
+    user: User,
+    cursor: Optional[str] = None,
+    limit: int = 500
+) -> Tuple[List[Row], List[str], str, bool]:
+    """
+    Get the todos created/updated and deleted since a sync cursor.
+    
+    Every write stamps the todos it touches (todos.change_seq) or the
+    tombstones it leaves (todo_tombstones.change_seq) with the user's new
+    todos_version. Changes are returned in (sequence, upserts before
+    deletions, id) order, read through (user_id, change_seq) indexes, so a
+    sync costs O(changes) rather than O(todos).
+    
+    Tombstones are purged after TODO_TOMBSTONE_RETENTION_DAYS, so a cursor
+    records when its holder was last caught up; past the horizon the
+    deletions it still needs may be gone and the client must resync.
+    
+    Args:
+        db: Database session
+        user: User whose todos are synced
+        cursor: Cursor from a previous call (None for a full sync)
+        limit: Maximum number of changes (upserts plus deletions) to return
+        
+    Returns:
+        Tuple of (upserted todo rows, deleted todo IDs, cursor for the next
+        call, whether more changes are waiting)
+        
+    Raises:
+        ChangesCursorExpired: If the cursor is older than the retention horizon
+        ValueError: If the cursor is invalid
+    """
+    now = int(time.time())
+    
+    # Position: (sequence, 0 = upsert / 1 = deletion, todo id). synced_at:
+    # when the client was last caught up, or when this sync started; every
+    # deletion it has yet to see happened after that
+    if cursor:
+        position, synced_at = _decode_changes_cursor(cursor)
+        retention_days = settings.TODO_TOMBSTONE_RETENTION_DAYS
+        if retention_days > 0 and now - synced_at > retention_days * 86400:
+            raise ChangesCursorExpired("Sync cursor expired, start a full sync without since")
+    else:
+        position, synced_at = (-1, 1, ""), now
+    seq, kind, last_id = position
+    
+    # Read first: every change at or below this version is already
+    # committed, so the queries below see it
+    todos_version = get_todos_version(db, user.id)
+    
+    todos_table = Todo.__table__
+    after = todos_table.c.change_seq > seq
+    if kind == 0:
+        after = or_(after, and_(
+            todos_table.c.change_seq == seq,
+            todos_table.c.id > literal(last_id, GUID)
+        ))
+    upserts = db.execute(
+        select(todos_table)
+        .where(todos_table.c.user_id == user.id, after)
+        .order_by(todos_table.c.change_seq, todos_table.c.id)
+        .limit(limit + 1)
+    ).all()
+    
+    tombstones_table = TodoTombstone.__table__
+    after = tombstones_table.c.change_seq > seq
+    if kind == 0:
+        after = tombstones_table.c.change_seq >= seq
+    elif last_id:
+        after = or_(after, and_(
+            tombstones_table.c.change_seq == seq,
+            tombstones_table.c.todo_id > literal(last_id, GUID)
+        ))
+    deletions = db.execute(
+        select(tombstones_table.c.change_seq, tombstones_table.c.todo_id)
+        .where(tombstones_table.c.user_id == user.id, after)
+        .order_by(tombstones_table.c.change_seq, tombstones_table.c.todo_id)
+        .limit(limit + 1)
+    ).all()
+    
+    changes = sorted(
+        [((todo.change_seq, 0, str(todo.id)), todo) for todo in upserts]
+        + [((row.change_seq, 1, str(row.todo_id)), None) for row in deletions],
+        key=lambda change: change[0]
+    )
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+    
+    if changes:
+        position = max(position, changes[-1][0])
+    if not has_more:
+        # Caught up: skip straight to the version read above, which every
+        # returned change is at or below
+        position = max(position, (todos_version, 1, ""))
+        synced_at = now
+    
+    todos = [todo for _, todo in changes if todo is not None]
+    deleted_ids = [key[2] for key, todo in changes if todo is None]
+    
+    return todos, deleted_ids, _encode_changes_cursor(position, synced_at), has_more
+
+
+def _encode_changes_cursor(position: Tuple[int, int, str], synced_at: int) -> str:
+    """
+    Build a delta sync cursor.
+    
+    Args:
+        position: (sequence, kind, todo ID) of the last change seen
+        synced_at: Unix time the client was last caught up
+        
+    Returns:
+        Opaque cursor string
+    """
+    seq, kind, todo_id = position
+    return encode_cursor({"seq": seq, "k": kind, "id": todo_id, "t": synced_at})
+
+
+def _decode_changes_cursor(cursor: str) -> Tuple[Tuple[int, int, str], int]:
+    """
+    Decode a delta sync cursor.
+    
+    Args:
+        cursor: Cursor string from a previous call
+        
+    Returns:
+        ((sequence, kind, todo ID) of the last change seen, Unix time the
+        client was last caught up)
+        
+    Raises:
+        ChangesCursorExpired: If the cursor predates sync timestamps
+        ValueError: If the cursor is invalid
+    """
+    data = decode_cursor(cursor)
+    
+    seq = data.get("seq")
+    kind = data.get("k")
+    todo_id = data.get("id")
+    synced_at = data.get("t")
+    if (
+        not isinstance(seq, int)
+        or kind not in (0, 1)
+        or not isinstance(todo_id, str)
+        or (kind == 0 and not todo_id)
+    ):
+        raise ValueError("Invalid cursor")
+    if not isinstance(synced_at, int):
+        # Issued before cursors were timestamped: its age is unknown
+        raise ChangesCursorExpired("Sync cursor expired, start a full sync without since")
+    
+    if todo_id:
+        try:
+            todo_id = str(uuid.UUID(todo_id))
+        except ValueError as e:
+            raise ValueError("Invalid cursor") from e
+    
+    return (seq, kind, todo_id), synced_at
+
+
+def get_todos_version(db: Session, user_id: Any) -> int:
+    """
+    Get a user's todos_version (the validator for todo ETags).
+    
+    Args:
+        db: Database session
+        user_id: User ID
+        
+    Returns:
+        The user's current todos_version
+    """
+    users_table = User.__table__
+    return db.execute(
+        select(users_table.c.todos_version).where(users_table.c.id == user_id)
+    ).scalar_one()
+
+
+def _bump_todos_version(db: Session, user_id: Any) -> int:
+    """
+    Increment the user's todos_version in the current transaction.
+    
+    Called first by every write to a user's todos, so the version (the
+    ETag validator for todo GETs) changes atomically with the data it
+    describes. The new value is the change sequence number stamped on the
+    written todos and tombstones. Bumping first also takes the user's row
+    lock (the write lock on SQLite) up front, so concurrent writers of the
+    same user commit in sequence order and delta sync never skips a change.
+    
+    Args:
+        db: Database session
+        user_id: ID of the user whose todos changed
+        
+    Returns:
+        The new todos_version
+    """
+    users_table = User.__table__
+    stmt = (
+        update(users_table)
+        .where(users_table.c.id == user_id)
+        # Keep updated_at: the profile itself did not change
+        .values(
+            todos_version=users_table.c.todos_version + 1,
+            updated_at=users_table.c.updated_at
+        )
+    )
+    
+    if db.get_bind().dialect.update_returning:
+        return db.execute(stmt.returning(users_table.c.todos_version)).scalar_one()
+    
+    db.execute(stmt)
+    return db.execute(
+        select(users_table.c.todos_version).where(users_table.c.id == user_id)
+    ).scalar_one()
 
 
-def delete_todo(db: Session, todo: Todo) -> None:
+def _add_tombstones(db: Session, user_id: Any, todo_ids: List[Any], change_seq: int) -> None:
     """
-    Delete a todo (hard delete).
+    Record deleted todos for delta sync (caller commits).
     
     Args:
         db: Database session
-        todo: Todo object to delete
+        user_id: ID of the user who owned the todos
+        todo_ids: IDs of the deleted todos
+        change_seq: Version of the deleting transaction
     """
-    db.delete(todo)
+    db.execute(insert(TodoTombstone.__table__), [
+        {"todo_id": todo_id, "user_id": user_id, "change_seq": change_seq}
+        for todo_id in todo_ids
+    ])
+
+
+def purge_todo_tombstones(db: Session, retention_days: Optional[int] = None) -> int:
+    """
+    Delete tombstones older than the retention horizon.
+    
+    get_todo_changes rejects cursors older than the same horizon, so no
+    client still able to sync incrementally needs the purged rows.
+    
+    Args:
+        db: Database session
+        retention_days: Days to keep tombstones (default:
+            TODO_TOMBSTONE_RETENTION_DAYS; 0 keeps them forever)
+        
+    Returns:
+        Number of tombstones deleted
+    """
+    if retention_days is None:
+        retention_days = settings.TODO_TOMBSTONE_RETENTION_DAYS
+    if retention_days <= 0:
+        return 0
+    
+    cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+    tombstones_table = TodoTombstone.__table__
+    result = db.execute(
+        delete(tombstones_table).where(tombstones_table.c.deleted_at < cutoff)
+    )
     db.commit()
+    return result.rowcount
 
 
 def get_user_todos(
@@ -136,22 +756,54 @@ def get_user_todos(
     page_size: int = 20,
     only_uncompleted: bool = True,
     sort_by: SortField = SortField.CREATED_AT,
-    sort_order: SortOrder = SortOrder.DESC
-) -> Tuple[List[Todo], int]:
+    sort_order: SortOrder = SortOrder.DESC,
+    cursor: Optional[str] = None,
+    count_strategy: Optional[CountStrategy] = None,
+    search: Optional[str] = None,
+    fields: Optional[List[str]] = None
+) -> Tuple[List[Todo], Optional[int], Optional[str]]:
     """
     Get paginated and sorted todos for a user.
     
+    Supports two pagination modes:
+    - Offset mode (default): skips (page - 1) * page_size rows
+    - Keyset mode: if a cursor is given, seeks directly past the last row
+      of the previous page, so deep pages cost the same as the first one
+    
+    Ties on the sort column are broken by id so paging is stable.
+    
+    If search is given, only todos whose title or description contain all
+    of its words (as word prefixes) are returned, looked up through the
+    full-text index. Results can then be sorted by relevance.
+    
+    The total is computed according to count_strategy
+    (defaults to settings.TODO_COUNT_STRATEGY):
+    - exact: separate COUNT query
+    - window: COUNT(*) OVER() computed by the page query itself
+    - cached: per-user counter maintained by the write paths
+      (counts all todos, so exact is used instead when searching)
+    - none: not computed at all (total is None)
+    
     Args:
         db: Database session
         user_id: User ID
-        page: Page number (1-based)
+        page: Page number (1-based, ignored when cursor is given)
         page_size: Number of items per page
         only_uncompleted: If True, only return uncompleted todos
-        sort_by: Field to sort by (created_at, due_date, priority)
+        sort_by: Field to sort by (created_at, due_date, priority, relevance)
         sort_order: Sort order (asc or desc)
+        cursor: Opaque cursor from a previous page (optional)
+        count_strategy: How to compute the total (optional)
+        search: Full-text search query (optional)
+        fields: Todo attributes to load (optional, default: all); the
+            other columns are left out of the SELECT
         
     Returns:
-        Tuple of (list of todos, total count)
+        Tuple of (list of todos, total count or None, cursor for the next page or None)
+        
+    Raises:
+        ValueError: If the cursor is invalid or was issued for another sort,
+            the search has no words, or relevance is requested without a search
     """
     # Base query
     query = db.query(Todo).filter(Todo.user_id == user_id)
@@ -160,39 +812,251 @@ def get_user_todos(
     if only_uncompleted:
         query = query.filter(Todo.is_completed == False)
     
-    # Apply sorting
-    if sort_by == SortField.CREATED_AT:
-        sort_column = Todo.created_at
-    elif sort_by == SortField.DUE_DATE:
-        sort_column = Todo.due_date
+    # Full-text search
+    rank = None
+    if search is not None:
+        query, rank = _apply_search(db, query, search)
+    elif sort_by == SortField.RELEVANCE:
+        raise ValueError("Sorting by relevance requires a search query")
+    
+    base_query = query
+    
+    # Validate the cursor before doing any counting work
+    if cursor:
+        sort_key, last_id = _decode_todo_cursor(cursor, sort_by, sort_order)
+    
+    if count_strategy is None:
+        count_strategy = CountStrategy(settings.TODO_COUNT_STRATEGY)
+    if search is not None and count_strategy == CountStrategy.CACHED:
+        count_strategy = CountStrategy.EXACT
+    
+    # Get total count before pagination
+    total = None
+    if count_strategy == CountStrategy.EXACT:
+        total = query.count()
+    elif count_strategy == CountStrategy.CACHED:
+        total = todo_counter.get(str(user_id))
+        if total is None:
+            marker = todo_counter.snapshot()
+            total = query.count()
+            todo_counter.seed(str(user_id), total, marker)
+    
+    # Counted in the page query itself: a window over the filtered rows, or a
+    # scalar subquery when the seek predicate would hide earlier pages
+    count_column = None
+    if count_strategy == CountStrategy.WINDOW:
+        if cursor:
+            count_column = base_query.with_entities(func.count()).scalar_subquery()
+        else:
+            count_column = func.count().over()
+    
+    sort_column = rank if sort_by == SortField.RELEVANCE else _get_sort_column(sort_by)
+    descending = sort_order == SortOrder.DESC
+    
+    # Seek past the previous page (keyset pagination)
+    if cursor:
+        key = literal(sort_key, String)
+        last = literal(last_id, GUID)
+        if descending:
+            query = query.filter(
+                sort_column <= key,
+                or_(sort_column < key, Todo.id < last)
+            )
+        else:
+            query = query.filter(
+                sort_column >= key,
+                or_(sort_column > key, Todo.id > last)
+            )
+    
+    # Apply sort order (id breaks ties so paging is stable)
+    if descending:
+        query = query.order_by(sort_column.desc(), Todo.id.desc())
+    else:
+        query = query.order_by(sort_column.asc(), Todo.id.asc())
+    
+    if fields is not None:
+        query = query.options(_load_fields(fields))
+    
+    # Select the sort key as stored, so the next cursor compares exactly
+    query = query.add_columns(type_coerce(sort_column, String).label("sort_key"))
+    if count_column is not None:
+        query = query.add_columns(count_column.label("total"))
+    
+    # Apply pagination (one extra row tells us whether a next page exists)
+    if not cursor:
+        query = query.offset((page - 1) * page_size)
+    rows = query.limit(page_size + 1).all()
+    
+    if count_column is not None:
+        # An empty page (past the end) has no row to carry the count
+        total = rows[0].total if rows else base_query.count()
+    
+    next_cursor = None
+    if len(rows) > page_size:
+        rows = rows[:page_size]
+        last_todo, last_key = rows[-1][:2]
+        next_cursor = _encode_todo_cursor(sort_by, sort_order, last_key, last_todo.id)
+    
+    todos = [row[0] for row in rows]
+    
+    return todos, total, next_cursor
+
+
+def _load_fields(fields: List[str]):
+    """
+    Build a loader option restricting a todo query to some columns.
+    
+    Args:
+        fields: Todo attribute names (the primary key is always loaded)
+        
+    Returns:
+        load_only() option; unlisted columns (e.g. description) are deferred
+    """
+    return load_only(*(getattr(Todo, field) for field in fields))
+
+
+def _apply_search(db: Session, query: Query, search: str) -> Tuple[Query, Any]:
+    """
+    Restrict a todo query to full-text search matches.
+    
+    Every word of the search must match a word prefix in the title or
+    description. Uses the FTS5 table on SQLite and the tsvector GIN index
+    on PostgreSQL (both created by app.migrations); other databases fall
+    back to substring matching.
+    
+    Args:
+        db: Database session
+        query: Todo query to restrict
+        search: Search text as typed by the user
+        
+    Returns:
+        Tuple of (restricted query, relevance expression, higher is better)
+        
+    Raises:
+        ValueError: If the search contains no words
+    """
+    # Words only, so user input can never break the query syntax
+    terms = re.findall(r"\w+", search)
+    if not terms:
+        raise ValueError("Search query must contain at least one word")
+    
+    dialect = db.get_bind().dialect.name
+    
+    if dialect == "sqlite":
+        fts = table(TODO_FTS_TABLE, column("rowid"), column(TODO_FTS_TABLE))
+        fts_keys = table(TODO_FTS_KEYS_TABLE, column("rowid"), column("todo_id", GUID))
+        # bm25() is lower for better matches; title matches weigh double.
+        # LIMIT -1 keeps SQLite from flattening the subquery, so the plan
+        # starts from the FTS index instead of probing it once per todo
+        matches = select(
+            fts_keys.c.todo_id,
+            (-func.bm25(literal_column(TODO_FTS_TABLE), 2.0, 1.0, type_=Float)).label("rank")
+        ).select_from(
+            fts.join(fts_keys, fts_keys.c.rowid == fts.c.rowid)
+        ).where(
+            fts.c[TODO_FTS_TABLE].match(" ".join(f'"{term}"*' for term in terms))
+        ).limit(-1).subquery("matches")
+        query = query.join(matches, matches.c.todo_id == Todo.id)
+        rank = matches.c.rank
+    elif dialect == "postgresql":
+        document = literal_column(TODO_TSVECTOR_SQL)
+        tsquery = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+        query = query.filter(document.op("@@")(tsquery))
+        rank = func.ts_rank(document, tsquery, type_=Float)
+    else:
+        for term in terms:
+            pattern = f"%{term}%"
+            query = query.filter(or_(Todo.title.ilike(pattern), Todo.description.ilike(pattern)))
+        rank = literal(0.0, Float)
+    
+    return query, rank
+
+
+def _get_sort_column(sort_by: SortField):
+    """
+    Get the column expression used to sort todos.
+    
+    Args:
+        sort_by: Field to sort by
+        
+    Returns:
+        SQLAlchemy column expression
+    """
+    if sort_by == SortField.DUE_DATE:
+        return Todo.due_date
     elif sort_by == SortField.PRIORITY:
-        # Custom sorting for priority: HIGH > MEDIUM > LOW > NULL
+        # Persisted rank: HIGH (3) > MEDIUM (2) > LOW (1) > NULL (0)
         # When ascending: NULL, LOW, MEDIUM, HIGH
         # When descending: HIGH, MEDIUM, LOW, NULL
-        priority_order = case(
-            (Todo.priority == PriorityLevel.HIGH, 3),
-            (Todo.priority == PriorityLevel.MEDIUM, 2),
-            (Todo.priority == PriorityLevel.LOW, 1),
-            else_=0  # NULL values
-        )
-        sort_column = priority_order
+        return Todo.priority_rank
     else:
-        sort_column = Todo.created_at
+        return Todo.created_at
+
+
+def _encode_todo_cursor(
+    sort_by: SortField,
+    sort_order: SortOrder,
+    sort_key: Any,
+    todo_id: Any
+) -> str:
+    """
+    Build the cursor pointing just past a todo.
     
-    # Apply sort order
-    if sort_order == SortOrder.DESC:
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
+    Args:
+        sort_by: Field the page was sorted by
+        sort_order: Sort order of the page
+        sort_key: Sort column value of the todo, as stored in the database
+        todo_id: ID of the todo
+        
+    Returns:
+        Opaque cursor string
+    """
+    if not isinstance(sort_key, (str, int, float)):
+        sort_key = str(sort_key)
     
-    # Get total count before pagination
-    total = query.count()
+    return encode_cursor({
+        "s": sort_by.value,
+        "o": sort_order.value,
+        "k": sort_key,
+        "id": str(todo_id)
+    })
+
+
+def _decode_todo_cursor(
+    cursor: str,
+    sort_by: SortField,
+    sort_order: SortOrder
+) -> Tuple[Any, str]:
+    """
+    Decode a cursor and check it matches the requested sort.
+    
+    Args:
+        cursor: Cursor string from a previous page
+        sort_by: Field to sort by
+        sort_order: Sort order
+        
+    Returns:
+        Tuple of (sort key, todo ID)
+        
+    Raises:
+        ValueError: If the cursor is invalid or was issued for another sort
+    """
+    data = decode_cursor(cursor)
+    
+    if data.get("s") != sort_by.value or data.get("o") != sort_order.value:
+        raise ValueError("Cursor does not match the requested sort")
+    
+    sort_key = data.get("k")
+    todo_id = data.get("id")
+    if not isinstance(sort_key, (str, int, float)) or not isinstance(todo_id, str):
+        raise ValueError("Invalid cursor")
     
-    # Apply pagination
-    offset = (page - 1) * page_size
-    todos = query.offset(offset).limit(page_size).all()
+    try:
+        todo_id = str(uuid.UUID(todo_id))
+    except ValueError as e:
+        raise ValueError("Invalid cursor") from e
     
-    return todos, total
+    return sort_key, todo_id
 
 
 def calculate_total_pages(total: int, page_size: int) -> int:
@@ -0,0 +1,69 @@
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from datetime import datetime
+import time
+from app.config import settings
+from app.models.revoked_token import RevokedToken
+from app.utils.token_blacklist import token_blacklist
+
+
+def revoke_token(db: Session, token: str, expires_at: datetime) -> None:
+    """
+    Revoke an access token in every worker process.
+    
+    The token is blacklisted in this worker at once and recorded in the
+    revoked_tokens table, from which the other workers pick it up on their
+    next sync (and every worker reloads it after a restart). Expired rows
+    are purged on the way.
+    
+    Args:
+        db: Database session
+        token: JWT token string to revoke
+        expires_at: When the token expires
+    """
+    key = token_blacklist.digest(token)
+    expiry = int(expires_at.timestamp())
+    token_blacklist.add_digest(key, expiry)
+    
+    db.query(RevokedToken).filter(
+        RevokedToken.expires_at <= int(time.time())
+    ).delete(synchronize_session=False)
+    db.add(RevokedToken(token_digest=key, expires_at=expiry))
+    
+    try:
+        db.commit()
+    except IntegrityError:
+        # Revoked already (e.g. concurrent logouts with the same token)
+        db.rollback()
+
+
+def sync_revoked_tokens(db: Session) -> int:
+    """
+    Merge tokens revoked since the last sync into the local blacklist.
+    
+    Reads the rows past token_blacklist.synced_id, a primary key range
+    lookup. Ids are assigned at insert but become visible at commit, so
+    with concurrent writers a lower id can commit after a higher one was
+    synced. Each sync therefore re-reads the last
+    TOKEN_REVOCATION_SYNC_OVERLAP ids below the watermark too; merging a
+    token again is a no-op.
+    
+    Args:
+        db: Database session
+    
+    Returns:
+        Number of revoked tokens read
+    """
+    rows = db.query(
+        RevokedToken.id, RevokedToken.token_digest, RevokedToken.expires_at
+    ).filter(
+        RevokedToken.id > token_blacklist.synced_id - settings.TOKEN_REVOCATION_SYNC_OVERLAP
+    ).order_by(RevokedToken.id).all()
+    
+    if rows:
+        now = time.time()
+        token_blacklist.merge(
+            ((row.token_digest, row.expires_at) for row in rows if row.expires_at > now),
+            rows[-1].id
+        )
+    return len(rows)
@@ -1,10 +1,14 @@
 from sqlalchemy.orm import Session
 from typing import Optional
+from app.database import commit_without_expiring
 from app.models.user import User
 from app.models.password_reset import PasswordResetToken
 from app.schemas.user import UserUpdate
 from app.utils.security import hash_password
 from app.services.auth import get_user_by_username
+from app.utils.todo_counter import todo_counter
+from app.utils.todo_page_cache import todo_page_cache
+from app.utils.principal_cache import principal_cache
 
 
 def update_user_profile(
@@ -15,6 +19,9 @@ def update_user_profile(
     """
     Update user profile (username and/or password).
     
+    Changing the password bumps the user's token_version, which revokes
+    every access token issued before.
+    
     Args:
         db: Database session
         user: User object to update
@@ -46,10 +53,14 @@ def update_user_profile(
     if update_data.password is not None:
         # Hash the new password
         user.password_hash = hash_password(update_data.password)
+        
+        # Log out everywhere
+        user.token_version += 1
     
-    # Commit changes (updated_at will be automatically updated by SQLAlchemy)
-    db.commit()
-    db.refresh(user)
+    # Commit changes (updated_at comes back through UPDATE ... RETURNING)
+    commit_without_expiring(db)
+    
+    principal_cache.invalidate(str(user.id))
     
     return user
 
@@ -58,6 +69,8 @@ def deactivate_user(db: Session, user: User) -> User:
     """
     Deactivate a user account (soft delete).
     
+    Also bumps the user's token_version, revoking their access tokens.
+    
     Args:
         db: Database session
         user: User object to deactivate
@@ -66,8 +79,10 @@ def deactivate_user(db: Session, user: User) -> User:
         Updated User object with is_active=False
     """
     user.is_active = False
-    db.commit()
-    db.refresh(user)
+    user.token_version += 1
+    commit_without_expiring(db)
+    
+    principal_cache.invalidate(str(user.id))
     
     return user
 
@@ -85,6 +100,7 @@ def delete_user(db: Session, user: User) -> None:
     """
     # Import here to avoid circular dependency
     from app.models.todo import Todo
+    from app.models.todo_tombstone import TodoTombstone
     
     # Manually delete related records
     # Password reset tokens
@@ -97,8 +113,18 @@ def delete_user(db: Session, user: User) -> None:
         Todo.user_id == user.id
     ).delete(synchronize_session=False)
     
+    # Delta sync tombstones
+    db.query(TodoTombstone).filter(
+        TodoTombstone.user_id == user.id
+    ).delete(synchronize_session=False)
+    
     # Delete the user
     db.delete(user)
     
     # Commit all changes
-    db.commit()
+    with todo_counter.writing():
+        db.commit()
+        todo_counter.invalidate(str(user.id))
+    
+    todo_page_cache.invalidate(str(user.id))
+    principal_cache.invalidate(str(user.id))
@@ -1,6 +1,7 @@
 from app.utils.security import (
     hash_password,
     verify_password,
+    password_needs_rehash,
     create_access_token,
     decode_access_token,
     create_token_for_user,
@@ -12,6 +13,7 @@ from app.utils.token_blacklist import token_blacklist
 __all__ = [
     "hash_password",
     "verify_password",
+    "password_needs_rehash",
     "create_access_token",
     "decode_access_token",
     "create_token_for_user",
@@ -0,0 +1,51 @@
+from typing import Any, Optional
+import hashlib
+
+
+def make_etag(version: int, *parts: Any) -> str:
+    """
+    Build a weak ETag for a view of a user's todos.
+    
+    The version is the user's todos_version, which changes on every write
+    to their todos, so the tag can be computed before (and instead of)
+    querying and serializing the response. The other parts identify the
+    view (user, query parameters, todo ID).
+    
+    Args:
+        version: User's todos_version
+        *parts: Values identifying the requested view
+    
+    Returns:
+        Weak ETag header value, e.g. W/"12-1a2b3c4d5e6f7a8b"
+    """
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode(),
+        digest_size=8
+    ).hexdigest()
+    
+    return f'W/"{version}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison).
+    
+    "*" matches any current representation (RFC 9110, section 13.1.2).
+    
+    Args:
+        if_none_match: If-None-Match header value (None if absent)
+        etag: Current ETag of the resource
+    
+    Returns:
+        True if the client's copy is current and 304 can be returned
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    
+    opaque_tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque_tag
+        for candidate in if_none_match.split(",")
+    )
@@ -0,0 +1,156 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Tuple
+import math
+import time
+from app.config import settings
+
+
+class LoginThrottled(Exception):
+    """Raised when a login is attempted during a backoff; maps to 429."""
+    
+    def __init__(self, retry_after: float):
+        super().__init__(
+            f"Too many failed login attempts, try again in {math.ceil(retry_after)} seconds"
+        )
+        self.retry_after = retry_after
+
+
+class LoginThrottle:
+    """
+    Failed login tracking with exponential backoff, per username and per client IP.
+    
+    Every failed password check costs a full bcrypt verification, so a
+    credential stuffing run is a CPU attack as much as a guessing one.
+    After `user_attempts` failures for a username (or `ip_attempts` from
+    one IP), each further failure blocks logins for that username (or
+    from that IP) for base_delay * 2^n seconds, up to max_delay. check()
+    rejects blocked logins before the user lookup and bcrypt.
+    
+    Failures are forgotten reset_seconds after the last one, and a
+    successful login clears the username's record. Attempts rejected
+    while blocked are not counted, so the backoff cannot be driven
+    higher than max_delay, which bounds how long an attacker can lock
+    out a username. Records are kept in least recently failed order and
+    evicted beyond max_entries.
+    """
+    
+    def __init__(
+        self,
+        user_attempts: int = 5,
+        ip_attempts: int = 20,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        reset_seconds: float = 900.0,
+        max_entries: int = 100000
+    ):
+        # key -> [failures, last failure, blocked until] (monotonic seconds)
+        self._records: "OrderedDict[Tuple[str, str], List[float]]" = OrderedDict()
+        self._lock = Lock()
+        self._user_attempts = user_attempts
+        self._ip_attempts = ip_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._reset_seconds = reset_seconds
+        self._max_entries = max_entries
+        self._failures = 0
+        self._throttled = 0
+    
+    def check(self, username: str, client_ip: str) -> None:
+        """
+        Reject a login attempt if its username or client IP is backing off.
+        
+        Args:
+            username: Username being logged in to
+            client_ip: Client IP address
+        
+        Raises:
+            LoginThrottled: If either is blocked, with the seconds left
+        """
+        now = time.monotonic()
+        retry_after = 0.0
+        
+        with self._lock:
+            for key in (("user", username), ("ip", client_ip)):
+                record = self._records.get(key)
+                if record is not None and record[2] > now:
+                    retry_after = max(retry_after, record[2] - now)
+            if retry_after:
+                self._throttled += 1
+        
+        if retry_after:
+            raise LoginThrottled(retry_after)
+    
+    def record_failure(self, username: str, client_ip: str) -> None:
+        """
+        Count a failed login for its username and client IP, starting or extending a backoff.
+        
+        Args:
+            username: Username that failed to log in
+            client_ip: Client IP address
+        """
+        now = time.monotonic()
+        
+        with self._lock:
+            self._failures += 1
+            for key, free_attempts in (
+                (("user", username), self._user_attempts),
+                (("ip", client_ip), self._ip_attempts)
+            ):
+                record = self._records.get(key)
+                if record is None or now - record[1] > self._reset_seconds:
+                    record = self._records[key] = [0, now, 0.0]
+                else:
+                    self._records.move_to_end(key)
+                
+                record[0] += 1
+                record[1] = now
+                if record[0] > free_attempts:
+                    delay = self._base_delay * 2 ** min(record[0] - free_attempts - 1, 32)
+                    record[2] = now + min(delay, self._max_delay)
+            
+            while len(self._records) > self._max_entries:
+                self._records.popitem(last=False)
+    
+    def record_success(self, username: str) -> None:
+        """
+        Clear a username's failures after a successful login.
+        
+        The client IP's failures are kept: one known password must not
+        reset the count for an IP that is guessing others.
+        
+        Args:
+            username: Username that logged in
+        """
+        with self._lock:
+            self._records.pop(("user", username), None)
+    
+    def clear(self) -> None:
+        """Clear all records and counters (useful for testing)."""
+        with self._lock:
+            self._records.clear()
+            self._failures = self._throttled = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get throttle counters.
+        
+        Returns:
+            Dictionary with failures, throttled (attempts rejected) and entries
+        """
+        with self._lock:
+            return {
+                "failures": self._failures,
+                "throttled": self._throttled,
+                "entries": len(self._records)
+            }
+
+
+# Global throttle instance
+login_throttle = LoginThrottle(
+    user_attempts=settings.LOGIN_THROTTLE_USER_ATTEMPTS,
+    ip_attempts=settings.LOGIN_THROTTLE_IP_ATTEMPTS,
+    max_delay=settings.LOGIN_THROTTLE_MAX_DELAY_SECONDS,
+    reset_seconds=settings.LOGIN_THROTTLE_RESET_SECONDS,
+    max_entries=settings.LOGIN_THROTTLE_MAX_ENTRIES
+)
@@ -0,0 +1,47 @@
+import base64
+import json
+from typing import Any, Dict
+
+
+def encode_cursor(data: Dict[str, Any]) -> str:
+    """
+    Encode keyset pagination state into an opaque cursor string.
+
+    Args:
+        data: JSON-serializable pagination state
+
+    Returns:
+        URL-safe cursor string
+
+    Example:
+        >>> cursor = encode_cursor({"k": "2024-01-15 10:30:00", "id": "550e8400-..."})
+        >>> decode_cursor(cursor)["k"]
+        '2024-01-15 10:30:00'
+    """
+    raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """
+    Decode a cursor string produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous response
+
+    Returns:
+        Decoded pagination state
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+    if not isinstance(data, dict):
+        raise ValueError("Invalid cursor")
+
+    return data
@@ -0,0 +1,200 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from typing import Any, Callable, Dict, Optional
+import multiprocessing
+import os
+import time
+import bcrypt
+from app.config import settings
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when too many password hashes are pending; maps to 503."""
+
+
+def _hashpw(password: bytes, rounds: int) -> bytes:
+    """Hash a password (runs in a worker process)."""
+    return bcrypt.hashpw(password, bcrypt.gensalt(rounds=rounds))
+
+
+def _checkpw(password: bytes, hashed: bytes) -> bool:
+    """Check a password against a hash (runs in a worker process)."""
+    return bcrypt.checkpw(password, hashed)
+
+
+class PasswordHasher:
+    """
+    Bounded process pool for bcrypt hashing and verification.
+    
+    bcrypt is deliberately slow CPU work. Run in request threads it would
+    occupy the shared AnyIO thread pool and, holding the CPU, slow every
+    other request. Here it runs in worker processes spread over the cores,
+    at most `workers` at a time.
+    
+    At most max_pending jobs (running plus queued) are admitted; beyond
+    that, submit fails fast with PasswordHasherBusy instead of queueing, so
+    an auth burst can only hold max_pending request threads. Callers wait
+    in sync handlers, i.e. in AnyIO's thread pool (40 threads by default,
+    shared by every sync endpoint and dependency), so max_pending must stay
+    well below that size or a login burst starves the rest of the API.
+    
+    The pool is started on first use, with the spawn start method (forking
+    a threaded server process is unsafe).
+    
+    New hashes use the bcrypt cost in `rounds`, set from configuration or
+    measured on this hardware by calibrate().
+    """
+    
+    def __init__(self, workers: int = 0, max_pending: int = 8, rounds: int = 12):
+        self.rounds = rounds
+        self._workers = workers or os.cpu_count() or 1
+        self._max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = Lock()
+        self._in_flight = 0
+        self._peak_in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+    
+    def hash(self, password: bytes, rounds: Optional[int] = None) -> bytes:
+        """
+        Hash a password with a new salt.
+        
+        Args:
+            password: Password bytes
+            rounds: bcrypt cost factor (default: the current policy, `rounds`)
+        
+        Returns:
+            bcrypt hash
+        
+        Raises:
+            PasswordHasherBusy: If max_pending jobs are already pending
+        """
+        return self._run(_hashpw, password, rounds or self.rounds)
+    
+    def check(self, password: bytes, hashed: bytes) -> bool:
+        """
+        Check a password against a bcrypt hash.
+        
+        Args:
+            password: Password bytes
+            hashed: bcrypt hash
+        
+        Returns:
+            True if the password matches
+        
+        Raises:
+            PasswordHasherBusy: If max_pending jobs are already pending
+        """
+        return self._run(_checkpw, password, hashed)
+    
+    def needs_rehash(self, hashed: bytes) -> bool:
+        """
+        Check whether a hash is weaker than the current policy.
+        
+        Hashes are only ever upgraded: one made at a higher cost than
+        `rounds` is kept, so a lowered setting cannot weaken stored hashes.
+        
+        Args:
+            hashed: bcrypt hash
+        
+        Returns:
+            True if the hash is not $2b$ or its cost is below `rounds`
+        """
+        parts = hashed.split(b"$")
+        if len(parts) != 4 or parts[1] != b"2b" or not parts[2].isdigit():
+            return True
+        return int(parts[2]) < self.rounds
+    
+    def calibrate(self, target_ms: float, min_rounds: int = 10, max_rounds: int = 16) -> int:
+        """
+        Set `rounds` to the highest cost whose hash fits a latency budget.
+        
+        Times one hash at min_rounds in the pool (after a warm-up hash that
+        also starts the workers), then doubles the estimate per extra round,
+        as bcrypt's cost is exponential.
+        
+        Args:
+            target_ms: Latency budget for one hash, in milliseconds
+            min_rounds: Lowest cost to pick, even if it exceeds the budget
+            max_rounds: Highest cost to pick
+        
+        Returns:
+            The chosen cost
+        """
+        self.hash(b"calibration", min_rounds)
+        
+        started = time.perf_counter()
+        self.hash(b"calibration", min_rounds)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        rounds = min_rounds
+        while rounds < max_rounds and elapsed_ms * 2 <= target_ms:
+            rounds += 1
+            elapsed_ms *= 2
+        
+        self.rounds = rounds
+        return rounds
+    
+    def shutdown(self) -> None:
+        """Stop the worker processes (they restart on next use)."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get pool counters.
+        
+        Returns:
+            Dictionary with rounds, workers, max_pending, in_flight,
+            peak_in_flight, completed and rejected
+        """
+        with self._lock:
+            return {
+                "rounds": self.rounds,
+                "workers": self._workers,
+                "max_pending": self._max_pending,
+                "in_flight": self._in_flight,
+                "peak_in_flight": self._peak_in_flight,
+                "completed": self._completed,
+                "rejected": self._rejected
+            }
+    
+    def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run a job in the pool and wait for it, if admitted."""
+        with self._lock:
+            if self._in_flight >= self._max_pending:
+                self._rejected += 1
+                raise PasswordHasherBusy("Too many password operations in progress")
+            self._in_flight += 1
+            self._peak_in_flight = max(self._peak_in_flight, self._in_flight)
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            executor = self._executor
+        
+        try:
+            return executor.submit(fn, *args).result()
+        except BrokenProcessPool:
+            # A worker died: start a fresh pool on the next call
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._completed += 1
+
+
+# Global hasher instance
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    rounds=settings.PASSWORD_HASH_ROUNDS
+)
@@ -0,0 +1,135 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Optional, Tuple
+import time
+import uuid
+from app.config import settings
+
+
+class Principal:
+    """
+    Lightweight authenticated user: just what authorization needs.
+    
+    Has the same id, username, is_active and token_version attributes as
+    User, so it can be passed to services that only read those.
+    """
+    
+    __slots__ = ("id", "username", "is_active", "token_version")
+    
+    def __init__(self, id: uuid.UUID, username: str, is_active: bool, token_version: int):
+        self.id = id
+        self.username = username
+        self.is_active = is_active
+        self.token_version = token_version
+    
+    def __repr__(self):
+        return (
+            f"<Principal(id={self.id}, username='{self.username}', "
+            f"active={self.is_active}, token_version={self.token_version})>"
+        )
+
+
+class PrincipalCache:
+    """
+    In-memory cache of authenticated principals by user ID.
+    
+    Lets get_current_principal skip the user SELECT on most requests: with
+    each principal's token_version cached, checking a token is memory-only.
+    The user services invalidate a user's entry when their username, active
+    status or token_version changes or the account is deleted. Eviction is least recently
+    used (max_entries), with a time to live per entry that bounds staleness
+    across workers, which don't see each other's invalidations.
+    max_entries=0 disables caching.
+    """
+    
+    def __init__(self, max_entries: int = 10000, ttl_seconds: float = 30):
+        self._entries: "OrderedDict[str, Tuple[float, Principal]]" = OrderedDict()
+        self._lock = Lock()
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+    
+    def get(self, user_id: str) -> Optional[Principal]:
+        """
+        Get a cached principal.
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            Cached Principal, or None on a miss (absent or expired)
+        """
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[user_id]
+                    self._evictions += 1
+                self._misses += 1
+                return None
+            
+            self._entries.move_to_end(user_id)
+            self._hits += 1
+            return entry[1]
+    
+    def put(self, user_id: str, principal: Principal) -> None:
+        """
+        Cache a principal, evicting the least recently used one if full.
+        
+        Args:
+            user_id: User ID
+            principal: Principal loaded from the database
+        """
+        if self._max_entries <= 0:
+            return
+        
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self._ttl_seconds, principal)
+            self._entries.move_to_end(user_id)
+            
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+    
+    def invalidate(self, user_id: str) -> None:
+        """
+        Drop a user's cached principal.
+        
+        Args:
+            user_id: User ID
+        """
+        with self._lock:
+            self._entries.pop(user_id, None)
+            self._invalidations += 1
+    
+    def clear(self) -> None:
+        """Clear all cached principals and counters (useful for testing)."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with hits, misses, evictions, invalidations and entries
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries)
+            }
+
+
+# Global cache instance
+principal_cache = PrincipalCache(
+    max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
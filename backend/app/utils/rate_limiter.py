@@ -0,0 +1,212 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+import math
+import time
+import orjson
+from app.config import settings
+from app.utils.security import decode_access_token
+
+
+class RateLimitPolicy:
+    """
+    Token bucket parameters: `limit` requests per `window` seconds.
+    
+    A client may burst up to `limit` requests, then gets one more every
+    window / limit seconds.
+    """
+    
+    __slots__ = ("name", "limit", "window", "rate", "headers")
+    
+    def __init__(self, name: str, limit: int, window: float = 60):
+        self.name = name
+        self.limit = limit
+        self.window = window
+        self.rate = limit / window
+        # Constant RateLimit-* headers, encoded once
+        self.headers = [
+            (b"ratelimit-limit", str(limit).encode()),
+            (b"ratelimit-policy", f"{limit};w={window:g}".encode()),
+        ]
+    
+    def __repr__(self):
+        return f"<RateLimitPolicy(name='{self.name}', limit={self.limit}, window={self.window})>"
+
+
+class TokenBucketStore:
+    """
+    Sharded in-memory token buckets, keyed by (policy name, client).
+    
+    A bucket is [tokens, last update, policy] and is refilled lazily when
+    taken from, so a check is O(1). Each shard has its own lock and keeps its
+    buckets in least recently used order: a check evicts buckets from the
+    front that have refilled completely (they are the same as no bucket),
+    and the least recently used one beyond max_entries.
+    """
+    
+    def __init__(self, max_entries: int = 100000, shards: int = 16):
+        self._shards: List["OrderedDict[Tuple[str, str], list]"] = [
+            OrderedDict() for _ in range(shards)
+        ]
+        self._locks = [Lock() for _ in range(shards)]
+        self._max_per_shard = max(1, max_entries // shards)
+        self._limited = 0
+    
+    def take(self, policy: RateLimitPolicy, client: str) -> Tuple[bool, int, float]:
+        """
+        Take a token from a client's bucket.
+        
+        Args:
+            policy: Bucket parameters
+            client: Client identity (user ID or IP address)
+        
+        Returns:
+            (allowed, tokens remaining, seconds until the next token if
+            none remain, else until the bucket is full)
+        """
+        key = (policy.name, client)
+        index = hash(key) % len(self._shards)
+        buckets = self._shards[index]
+        now = time.monotonic()
+        
+        with self._locks[index]:
+            bucket = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = [float(policy.limit), now, policy]
+            else:
+                buckets.move_to_end(key)
+                bucket[0] = min(policy.limit, bucket[0] + (now - bucket[1]) * policy.rate)
+                bucket[1] = now
+            
+            allowed = bucket[0] >= 1
+            if allowed:
+                bucket[0] -= 1
+            else:
+                self._limited += 1
+            tokens = bucket[0]
+            
+            self._evict(buckets, now)
+        
+        if allowed:
+            return True, int(tokens), (policy.limit - tokens) / policy.rate
+        return False, 0, (1 - tokens) / policy.rate
+    
+    def clear(self) -> None:
+        """Drop all buckets and counters (useful for testing)."""
+        for lock, buckets in zip(self._locks, self._shards):
+            with lock:
+                buckets.clear()
+        self._limited = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get store counters.
+        
+        Returns:
+            Dictionary with buckets and limited (requests rejected)
+        """
+        return {
+            "buckets": sum(len(buckets) for buckets in self._shards),
+            "limited": self._limited
+        }
+    
+    def _evict(self, buckets: "OrderedDict[Tuple[str, str], list]", now: float) -> None:
+        """Evict full or excess buckets from the front (caller holds the lock)."""
+        while buckets:
+            key = next(iter(buckets))
+            tokens, updated, policy = buckets[key]
+            if len(buckets) <= self._max_per_shard and tokens + (now - updated) * policy.rate < policy.limit:
+                break
+            del buckets[key]
+
+
+# Policies: anonymous credential endpoints per client IP, heavy endpoints
+# and everything else under /api per user (per IP without a valid token)
+AUTH_POLICY = RateLimitPolicy("auth", settings.RATE_LIMIT_AUTH_PER_MINUTE)
+BULK_POLICY = RateLimitPolicy("bulk", settings.RATE_LIMIT_BULK_PER_MINUTE)
+API_POLICY = RateLimitPolicy("api", settings.RATE_LIMIT_PER_MINUTE)
+
+# (method, exact path) routes with their own policy; other /api paths use API_POLICY
+ROUTE_POLICIES: Dict[Tuple[str, str], RateLimitPolicy] = {
+    ("POST", "/api/auth/login"): AUTH_POLICY,
+    ("POST", "/api/auth/register"): AUTH_POLICY,
+    ("POST", "/api/auth/request-password-reset"): AUTH_POLICY,
+    ("POST", "/api/auth/reset-password"): AUTH_POLICY,
+    ("POST", "/api/todos/import"): BULK_POLICY,
+    ("POST", "/api/todos/batch"): BULK_POLICY,
+    ("POST", "/api/todos/batch/complete"): BULK_POLICY,
+    ("POST", "/api/todos/batch/delete"): BULK_POLICY,
+    ("GET", "/api/todos/export"): BULK_POLICY,
+}
+
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware that applies token bucket rate limits before routing.
+    
+    Over-limit requests get 429 with Retry-After straight from here, so
+    they never reach a database session or a handler. Responses to limited
+    routes carry RateLimit-Limit, RateLimit-Remaining, RateLimit-Reset and
+    RateLimit-Policy headers (IETF draft "RateLimit header fields").
+    
+    Requests outside /api (health checks, docs) are not limited. Per-user
+    policies identify the user by the bearer token's verified subject; the
+    decoded claims are cached, so the auth dependency reuses the work.
+    """
+    
+    def __init__(self, app, store: Optional[TokenBucketStore] = None):
+        self.app = app
+        self.store = store or rate_limit_store
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith("/api/"):
+            await self.app(scope, receive, send)
+            return
+        
+        policy = ROUTE_POLICIES.get((scope["method"], scope["path"].rstrip("/")), API_POLICY)
+        client = self._client(scope, per_user=policy is not AUTH_POLICY)
+        allowed, remaining, reset = self.store.take(policy, client)
+        
+        headers = policy.headers + [
+            (b"ratelimit-remaining", b"%d" % remaining),
+            (b"ratelimit-reset", b"%d" % math.ceil(reset)),
+        ]
+        
+        if not allowed:
+            body = orjson.dumps({"detail": "Too many requests, try again later"})
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": headers + [
+                    (b"retry-after", b"%d" % math.ceil(reset)),
+                    (b"content-type", b"application/json"),
+                    (b"content-length", b"%d" % len(body)),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+        
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + headers
+            await send(message)
+        
+        await self.app(scope, receive, send_with_headers)
+    
+    @staticmethod
+    def _client(scope, per_user: bool) -> str:
+        """Get the rate limit identity: user ID from a valid token, else client IP."""
+        if per_user:
+            for name, value in scope["headers"]:
+                if name == b"authorization":
+                    if value[:7].lower() == b"bearer ":
+                        payload = decode_access_token(value[7:].decode("latin-1"))
+                        if payload and payload.get("sub"):
+                            return "user:" + payload["sub"]
+                    break
+        client = scope.get("client")
+        return "ip:" + (client[0] if client else "unknown")
+
+
+# Global bucket store instance
+rate_limit_store = TokenBucketStore(max_entries=settings.RATE_LIMIT_MAX_BUCKETS)
@@ -1,20 +1,29 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, Any
 from jose import JWTError, jwt
-import bcrypt
+import secrets
 from app.config import settings
+from app.utils.token_cache import decoded_token_cache
+from app.utils.password_hasher import password_hasher
 
 
 def hash_password(password: str) -> str:
     """
     Hash a plain text password using bcrypt.
     
+    Runs in the password hasher's process pool; the calling thread waits.
+    The bcrypt cost is the hasher's current policy (PASSWORD_HASH_ROUNDS,
+    or calibrated at startup).
+    
     Args:
         password: Plain text password to hash
         
     Returns:
         Hashed password string
         
+    Raises:
+        PasswordHasherBusy: If too many password operations are pending
+        
     Example:
         >>> hashed = hash_password("mypassword123")
         >>> print(hashed)
@@ -23,9 +32,8 @@ def hash_password(password: str) -> str:
     # Convert password to bytes
     password_bytes = password.encode('utf-8')
     
-    # Generate salt and hash password (12 rounds)
-    salt = bcrypt.gensalt(rounds=12)
-    hashed = bcrypt.hashpw(password_bytes, salt)
+    # Generate salt and hash password
+    hashed = password_hasher.hash(password_bytes)
     
     # Return as string
     return hashed.decode('utf-8')
@@ -35,6 +43,8 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a plain text password against a hashed password.
     
+    Runs in the password hasher's process pool; the calling thread waits.
+    
     Args:
         plain_password: Plain text password to verify
         hashed_password: Hashed password from database
@@ -42,6 +52,9 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
         
+    Raises:
+        PasswordHasherBusy: If too many password operations are pending
+        
     Example:
         >>> hashed = hash_password("mypassword123")
         >>> verify_password("mypassword123", hashed)
@@ -54,7 +67,20 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     hashed_bytes = hashed_password.encode('utf-8')
     
     # Check password
-    return bcrypt.checkpw(password_bytes, hashed_bytes)
+    return password_hasher.check(password_bytes, hashed_bytes)
+
+
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash should be replaced with one made under the current policy.
+    
+    Args:
+        hashed_password: Hashed password from database
+        
+    Returns:
+        True if the hash's algorithm or cost differs from the current policy
+    """
+    return password_hasher.needs_rehash(hashed_password.encode('utf-8'))
 
 
 def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
@@ -81,8 +107,10 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     
-    # Add expiration to token payload
-    to_encode.update({"exp": expire})
+    # Add expiration and a unique ID to token payload (without the ID, two
+    # tokens issued for a user in the same second would be identical, so
+    # blacklisting the old one on refresh would also revoke the new one)
+    to_encode.update({"exp": expire, "jti": secrets.token_urlsafe(12)})
     
     # Encode and return token
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
@@ -93,6 +121,9 @@ def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
     """
     Decode and validate a JWT access token.
     
+    Verified claims are cached by token digest until the token expires, so
+    repeated decodes of the same token skip signature verification.
+    
     Args:
         token: JWT token string to decode
         
@@ -105,20 +136,29 @@ def decode_access_token(token: str) -> Optional[Dict[str, Any]]:
         >>> print(payload["sub"])
         user123
     """
+    key = decoded_token_cache.digest(token)
+    payload = decoded_token_cache.get(key)
+    if payload is not None:
+        return payload
+    
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
+    
+    decoded_token_cache.put(key, payload)
+    return payload
 
 
-def create_token_for_user(user_id: str, username: str) -> str:
+def create_token_for_user(user_id: str, username: str, token_version: int = 0) -> str:
     """
     Create an access token for a specific user.
     
     Args:
         user_id: User's unique identifier (UUID as string)
         username: User's username
+        token_version: User's current token_version; the token is rejected
+            once the user's token_version moves past it
         
     Returns:
         JWT token string
@@ -131,7 +171,8 @@ def create_token_for_user(user_id: str, username: str) -> str:
     """
     token_data = {
         "sub": user_id,  # 'sub' is the standard JWT claim for subject (user ID)
-        "username": username
+        "username": username,
+        "ver": token_version
     }
     return create_access_token(token_data)
 
@@ -0,0 +1,218 @@
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+import csv
+import io
+import orjson
+
+# Column order of CSV exports (same fields as TodoResponse)
+TODO_EXPORT_FIELDS = [
+    "id", "user_id", "title", "description", "priority",
+    "due_date", "is_completed", "created_at", "updated_at"
+]
+
+
+def todo_to_dict(todo: Any) -> Dict[str, Any]:
+    """
+    Convert a todo to its JSON response shape (matches TodoResponse).
+    
+    Reads attributes directly, so it works for ORM objects and Core rows
+    alike. Values come straight from the database and are not re-validated;
+    dates and datetimes are left for the JSON encoder (orjson) to render.
+    
+    Args:
+        todo: Todo ORM object or row with todo columns
+    
+    Returns:
+        Dictionary ready to be rendered as JSON
+    """
+    priority = todo.priority
+    
+    return {
+        "id": str(todo.id),
+        "user_id": str(todo.user_id),
+        "title": todo.title,
+        "description": todo.description,
+        "priority": priority.value if priority is not None else None,
+        "due_date": todo.due_date,
+        "is_completed": todo.is_completed,
+        "created_at": todo.created_at,
+        "updated_at": todo.updated_at
+    }
+
+
+# How each field of TodoResponse is rendered, for partial responses
+TODO_FIELD_RENDERERS = {
+    "id": lambda todo: str(todo.id),
+    "user_id": lambda todo: str(todo.user_id),
+    "title": lambda todo: todo.title,
+    "description": lambda todo: todo.description,
+    "priority": lambda todo: todo.priority.value if todo.priority is not None else None,
+    "due_date": lambda todo: todo.due_date,
+    "is_completed": lambda todo: todo.is_completed,
+    "created_at": lambda todo: todo.created_at,
+    "updated_at": lambda todo: todo.updated_at
+}
+
+
+def parse_todo_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """
+    Parse a comma-separated list of todo fields (the ?fields= parameter).
+    
+    The id is always included. Duplicates are dropped and the order
+    follows TodoResponse, so equal selections give equal results.
+    
+    Args:
+        fields: Field names separated by commas, or None for all fields
+    
+    Returns:
+        List of field names, or None if all fields are wanted
+    
+    Raises:
+        ValueError: If a field name is unknown
+    """
+    if fields is None:
+        return None
+    
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - TODO_FIELD_RENDERERS.keys()
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    
+    requested.add("id")
+    return [field for field in TODO_FIELD_RENDERERS if field in requested]
+
+
+def todo_to_partial_dict(todo: Any, fields: List[str]) -> Dict[str, Any]:
+    """
+    Convert a todo to its JSON response shape, keeping only some fields.
+    
+    Only the requested attributes are read, so columns deferred with
+    load_only() are never loaded.
+    
+    Args:
+        todo: Todo ORM object or row with (at least) the requested columns
+        fields: Field names, as returned by parse_todo_fields()
+    
+    Returns:
+        Dictionary ready to be rendered as JSON
+    """
+    return {field: TODO_FIELD_RENDERERS[field](todo) for field in fields}
+
+
+def user_to_dict(user: Any) -> Dict[str, Any]:
+    """
+    Convert a user to its JSON response shape (matches UserResponse).
+    
+    Never includes the password hash.
+    
+    Args:
+        user: User ORM object or row with user columns
+    
+    Returns:
+        Dictionary ready to be rendered as JSON
+    """
+    return {
+        "id": str(user.id),
+        "username": user.username,
+        "is_active": user.is_active,
+        "created_at": user.created_at,
+        "updated_at": user.updated_at
+    }
+
+
+def todos_to_ndjson(batches: Iterable[Iterable[Any]]) -> Iterator[bytes]:
+    """
+    Render batches of todos as NDJSON, one chunk per batch.
+    
+    Args:
+        batches: Iterable of todo batches (ORM objects or rows)
+    
+    Yields:
+        Encoded lines, one JSON object per todo
+    """
+    for batch in batches:
+        yield b"".join(orjson.dumps(todo_to_dict(todo)) + b"\n" for todo in batch)
+
+
+def todos_to_csv(batches: Iterable[Iterable[Any]]) -> Iterator[bytes]:
+    """
+    Render batches of todos as CSV with a header row, one chunk per batch.
+    
+    Dates and datetimes use ISO 8601, like the JSON responses; missing
+    values are empty cells.
+    
+    Args:
+        batches: Iterable of todo batches (ORM objects or rows)
+    
+    Yields:
+        Encoded CSV text
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    
+    writer.writerow(TODO_EXPORT_FIELDS)
+    yield buffer.getvalue().encode()
+    
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        for todo in batch:
+            todo_dict = todo_to_dict(todo)
+            writer.writerow([
+                _csv_value(todo_dict[field]) for field in TODO_EXPORT_FIELDS
+            ])
+        yield buffer.getvalue().encode()
+
+
+def _csv_value(value: Any) -> Any:
+    """Format one value for a CSV cell."""
+    if value is None:
+        return ""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return value
+
+
+def parse_ndjson(file: BinaryIO) -> Iterator[Tuple[int, Any]]:
+    """
+    Read records from an NDJSON file, one line at a time.
+    
+    Blank lines are skipped. Lines that are not valid JSON are yielded
+    with None as the record, so the caller can report them.
+    
+    Args:
+        file: Binary file object positioned at the start
+    
+    Yields:
+        Tuples of (line number, decoded JSON value or None)
+    """
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, orjson.loads(line)
+        except orjson.JSONDecodeError:
+            yield line_number, None
+
+
+def parse_csv(file: BinaryIO) -> Iterator[Tuple[int, Dict[str, str]]]:
+    """
+    Read records from a CSV file with a header row, one row at a time.
+    
+    Empty cells and cells without a header are left out of the record, so
+    optional fields can be blank. Undecodable bytes are replaced rather
+    than aborting the whole file.
+    
+    Args:
+        file: Binary file object positioned at the start (UTF-8, optional BOM)
+    
+    Yields:
+        Tuples of (line number where the row ends, record)
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", errors="replace", newline="")
+    reader = csv.DictReader(text)
+    
+    for row in reader:
+        yield reader.line_num, {
+            key: value for key, value in row.items()
+            if isinstance(key, str) and value not in (None, "")
+        }
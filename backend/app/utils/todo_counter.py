@@ -0,0 +1,130 @@
+from collections import OrderedDict
+from contextlib import contextmanager
+from threading import Lock
+from typing import Iterator, Optional
+
+
+class TodoCounter:
+    """
+    In-memory per-user todo counts for the "cached" count strategy.
+
+    Counts are seeded lazily from a COUNT query and then kept up to date
+    by the todo/user services on every create and delete. Least recently
+    used entries are evicted once max_users is reached.
+
+    Writers commit and adjust() inside writing(), and a seed is dropped if
+    any write started, ended or was in progress between its snapshot() and
+    seed(): a COUNT that ran after a commit but before that commit's
+    adjust() would otherwise count the same todos twice.
+
+    Counts are per process: with several workers, a worker only sees the
+    writes it handled itself, so this trades exactness for latency.
+    """
+
+    def __init__(self, max_users: int = 100_000):
+        self._counts: "OrderedDict[str, int]" = OrderedDict()
+        self._lock = Lock()
+        self._max_users = max_users
+        self._writes = 0
+        self._open_writes = 0
+
+    def get(self, user_id: str) -> Optional[int]:
+        """
+        Get the cached todo count for a user.
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Cached count, or None if the user is not cached
+        """
+        with self._lock:
+            count = self._counts.get(user_id)
+            if count is not None:
+                self._counts.move_to_end(user_id)
+            return count
+
+    def snapshot(self) -> int:
+        """
+        Get a marker to pass to seed() before running a COUNT query.
+
+        Returns:
+            Current write marker
+        """
+        with self._lock:
+            return self._writes
+
+    def seed(self, user_id: str, count: int, marker: int) -> None:
+        """
+        Cache a freshly counted value for a user.
+
+        The value is dropped if any write happened since the marker was
+        taken or is still in progress, because the count may already be out
+        of date or not match the adjustments still to come.
+
+        Args:
+            user_id: User ID
+            count: Counted number of todos
+            marker: Value returned by snapshot() before counting
+        """
+        with self._lock:
+            if marker != self._writes or self._open_writes:
+                return
+            self._counts[user_id] = count
+            self._counts.move_to_end(user_id)
+            while len(self._counts) > self._max_users:
+                self._counts.popitem(last=False)
+
+    @contextmanager
+    def writing(self) -> Iterator[None]:
+        """
+        Mark a todo write in progress, from before its commit to after its adjust().
+
+        Example:
+            >>> with todo_counter.writing():
+            ...     db.commit()
+            ...     todo_counter.adjust(user_id, 1)
+        """
+        with self._lock:
+            self._writes += 1
+            self._open_writes += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._writes += 1
+                self._open_writes -= 1
+
+    def adjust(self, user_id: str, delta: int) -> None:
+        """
+        Apply a change to a user's cached count (no-op if not cached).
+
+        Args:
+            user_id: User ID
+            delta: Number of todos added (positive) or removed (negative)
+        """
+        with self._lock:
+            self._writes += 1
+            if user_id in self._counts:
+                self._counts[user_id] = max(self._counts[user_id] + delta, 0)
+
+    def invalidate(self, user_id: str) -> None:
+        """
+        Drop a user's cached count.
+
+        Args:
+            user_id: User ID
+        """
+        with self._lock:
+            self._writes += 1
+            self._counts.pop(user_id, None)
+
+    def clear(self) -> None:
+        """Clear all cached counts (useful for testing)."""
+        with self._lock:
+            self._writes += 1
+            self._counts.clear()
+
+
+# Global counter instance
+todo_counter = TodoCounter()
@@ -0,0 +1,126 @@
+from threading import Lock
+from typing import Any, Dict, List, Optional, Set
+import asyncio
+from app.config import settings
+
+
+class TodoEventHub:
+    """
+    In-process publish/subscribe hub for todo change events.
+    
+    Each open event stream (GET /api/todos/events) subscribes a bounded
+    asyncio queue for its user. The todo services publish one event per
+    committed write, from whatever thread they run in; delivery is handed
+    to the event loop with call_soon_threadsafe, so publishers never block
+    and idle subscribers cost nothing but their queue.
+    
+    A subscriber that falls queue_size events behind has its queue replaced
+    by a single "resync" event (the client should refetch instead of
+    replaying).
+    
+    Subscribers are per process: a client only sees writes handled by the
+    worker holding its stream. Clients catch up on anything missed with
+    GET /api/todos/changes.
+    """
+    
+    def __init__(self, queue_size: int = 100):
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._lock = Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue_size = queue_size
+        self._published = 0
+        self._overflows = 0
+    
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        """
+        Open a subscription to a user's events (call from the event loop).
+        
+        Args:
+            user_id: User ID
+        
+        Returns:
+            Queue receiving the user's events, pass it to unsubscribe()
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+    
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue) -> None:
+        """
+        Close a subscription.
+        
+        Args:
+            user_id: User ID
+            queue: Queue returned by subscribe()
+        """
+        with self._lock:
+            queues = self._subscribers.get(user_id)
+            if queues is None:
+                return
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[user_id]
+    
+    def publish(self, user_id: str, event_type: str, todo_ids: List[Any], version: int) -> None:
+        """
+        Publish a change to a user's todos (thread-safe, never blocks).
+        
+        Args:
+            user_id: ID of the user whose todos changed
+            event_type: created, updated, completed or deleted
+            todo_ids: IDs of the todos written
+            version: The user's todos_version after the write
+        """
+        with self._lock:
+            if user_id not in self._subscribers or self._loop is None:
+                return
+            loop = self._loop
+            self._published += 1
+        
+        event = {
+            "type": event_type,
+            "ids": [str(todo_id) for todo_id in todo_ids],
+            "version": version
+        }
+        try:
+            loop.call_soon_threadsafe(self._deliver, user_id, event)
+        except RuntimeError:
+            # Event loop already closed (shutdown)
+            pass
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get hub counters.
+        
+        Returns:
+            Dictionary with connections, users, published and overflows
+        """
+        with self._lock:
+            return {
+                "connections": sum(len(queues) for queues in self._subscribers.values()),
+                "users": len(self._subscribers),
+                "published": self._published,
+                "overflows": self._overflows
+            }
+    
+    def _deliver(self, user_id: str, event: Dict[str, Any]) -> None:
+        """Put an event on the user's queues (runs on the event loop)."""
+        with self._lock:
+            queues = list(self._subscribers.get(user_id, ()))
+        
+        for queue in queues:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Slow client: drop its backlog, tell it to refetch
+                while not queue.empty():
+                    queue.get_nowait()
+                queue.put_nowait({"type": "resync", "ids": [], "version": event["version"]})
+                with self._lock:
+                    self._overflows += 1
+
+
+# Global hub instance
+todo_events = TodoEventHub(queue_size=settings.TODO_EVENTS_QUEUE_SIZE)
@@ -0,0 +1,139 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Dict, Hashable, Optional, Set, Tuple
+import time
+from app.config import settings
+
+
+class TodoPageCache:
+    """
+    In-memory read-through cache of rendered todo list pages.
+    
+    Entries are response bodies keyed by user and by the page's request
+    parameters (including the user's todos_version, so a page is never
+    served for a newer version of the data). The todo/user services drop
+    all of a user's entries on every write to their todos.
+    
+    Eviction is least recently used, bounded by total body size
+    (max_bytes), with a time to live per entry. max_bytes=0 disables
+    caching.
+    
+    Entries are per process; since keys carry the version, other workers'
+    writes can leave unused entries behind but never stale hits.
+    """
+    
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024, ttl_seconds: float = 60):
+        self._entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, bytes]]" = OrderedDict()
+        self._keys_by_user: Dict[str, Set[Hashable]] = {}
+        self._lock = Lock()
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+    
+    def get(self, user_id: str, key: Hashable) -> Optional[bytes]:
+        """
+        Get a cached page body.
+        
+        Args:
+            user_id: User ID
+            key: Page parameters
+        
+        Returns:
+            Cached body, or None on a miss (absent or expired)
+        """
+        with self._lock:
+            entry = self._entries.get((user_id, key))
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    self._remove(user_id, key)
+                    self._evictions += 1
+                self._misses += 1
+                return None
+            
+            self._entries.move_to_end((user_id, key))
+            self._hits += 1
+            return entry[1]
+    
+    def put(self, user_id: str, key: Hashable, body: bytes) -> None:
+        """
+        Cache a page body, evicting least recently used pages if needed.
+        
+        Args:
+            user_id: User ID
+            key: Page parameters
+            body: Rendered response body
+        """
+        if len(body) > self._max_bytes:
+            return
+        
+        with self._lock:
+            if (user_id, key) in self._entries:
+                self._remove(user_id, key)
+            
+            self._entries[(user_id, key)] = (time.monotonic() + self._ttl_seconds, body)
+            self._keys_by_user.setdefault(user_id, set()).add(key)
+            self._bytes += len(body)
+            
+            while self._bytes > self._max_bytes:
+                (old_user_id, old_key), _ = next(iter(self._entries.items()))
+                self._remove(old_user_id, old_key)
+                self._evictions += 1
+    
+    def invalidate(self, user_id: str) -> None:
+        """
+        Drop all cached pages of a user.
+        
+        Args:
+            user_id: User ID
+        """
+        with self._lock:
+            for key in list(self._keys_by_user.get(user_id, ())):
+                self._remove(user_id, key)
+            self._invalidations += 1
+    
+    def clear(self) -> None:
+        """Clear all cached pages and counters (useful for testing)."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_user.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = self._invalidations = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with hits, misses, evictions, invalidations,
+            entries and bytes
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes
+            }
+    
+    def _remove(self, user_id: str, key: Hashable) -> None:
+        """Remove one entry (caller holds the lock)."""
+        _, body = self._entries.pop((user_id, key))
+        self._bytes -= len(body)
+        
+        keys = self._keys_by_user[user_id]
+        keys.discard(key)
+        if not keys:
+            del self._keys_by_user[user_id]
+
+
+# Global cache instance
+todo_page_cache = TodoPageCache(
+    max_bytes=settings.TODO_PAGE_CACHE_MAX_BYTES,
+    ttl_seconds=settings.TODO_PAGE_CACHE_TTL_SECONDS
+)
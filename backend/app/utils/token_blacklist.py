@@ -1,31 +1,76 @@
-from typing import Set
-from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Tuple
+from datetime import datetime
 from threading import Lock
+import hashlib
+import heapq
+import time
+
 
 class TokenBlacklist:
     """
     In-memory token blacklist for logout functionality.
     
-    In production, this should be replaced with Redis or a database table.
-    This implementation is thread-safe and includes automatic cleanup of expired tokens.
+    Tokens are stored as 16-byte BLAKE2b digests mapped to their expiry
+    (Unix seconds), plus a min-heap of (expiry, digest) so expired entries
+    are swept from the top of the heap on every add: each entry is removed
+    once, in O(log n), and memory stays proportional to the tokens that
+    are still valid. Membership checks are a lock-free dict lookup.
+    
+    Memory: about 180 bytes per entry (~170 MiB at 1M entries), against
+    ~350 bytes when full tokens were kept (python -m
+    benchmarks.bench_token_blacklist).
+    
+    This is each worker's local copy of the revoked_tokens table (see
+    app.services.token_revocation): synced_id is the id of the last row
+    merged in, and checks never touch the database.
     """
     
     def __init__(self):
-        self._blacklist: Set[str] = set()
+        self._expiry_by_digest: Dict[bytes, float] = {}
+        self._expiry_heap: List[Tuple[float, bytes]] = []
         self._lock = Lock()
-        self._expiry_times: dict[str, datetime] = {}
+        self.synced_id = 0
+    
+    @staticmethod
+    def digest(token: str) -> bytes:
+        """Get the fixed-size key of a token."""
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
     
     def add(self, token: str, expires_at: datetime) -> None:
         """
-        Add a token to the blacklist.
+        Add a token to the blacklist, sweeping expired entries.
         
         Args:
             token: JWT token string to blacklist
-            expires_at: When the token expires (for cleanup)
+            expires_at: When the token expires (entry is dropped after that)
+        """
+        self.add_digest(self.digest(token), expires_at.timestamp())
+    
+    def add_digest(self, key: bytes, expiry: float) -> None:
+        """
+        Add a token digest to the blacklist, sweeping expired entries.
+        
+        Args:
+            key: Token digest (see digest())
+            expiry: When the token expires, in Unix seconds
+        """
+        with self._lock:
+            self._sweep(time.time())
+            self._push(key, expiry)
+    
+    def merge(self, entries: Iterable[Tuple[bytes, float]], synced_id: int) -> None:
+        """
+        Add token digests synced from the revoked_tokens table.
+        
+        Args:
+            entries: (digest, expiry) pairs
+            synced_id: Id of the last row read; the next sync starts after it
         """
         with self._lock:
-            self._blacklist.add(token)
-            self._expiry_times[token] = expires_at
+            self._sweep(time.time())
+            for key, expiry in entries:
+                self._push(key, expiry)
+            self.synced_id = max(self.synced_id, synced_id)
     
     def is_blacklisted(self, token: str) -> bool:
         """
@@ -33,49 +78,68 @@ class TokenBlacklist:
         
         Args:
             token: JWT token string to check
-            
+        
         Returns:
             True if token is blacklisted, False otherwise
         """
-        with self._lock:
-            return token in self._blacklist
+        # Single dict lookup, atomic under the GIL: no lock needed
+        expiry = self._expiry_by_digest.get(self.digest(token))
+        return expiry is not None and expiry > time.time()
     
     def cleanup_expired(self) -> int:
         """
         Remove expired tokens from blacklist to save memory.
         
+        add() already does this; call it to release memory when no tokens
+        are being added.
+        
         Returns:
             Number of tokens removed
         """
         with self._lock:
-            now = datetime.now(timezone.utc)
-            expired_tokens = [
-                token for token, expiry in self._expiry_times.items()
-                if expiry < now
-            ]
-            
-            for token in expired_tokens:
-                self._blacklist.discard(token)
-                del self._expiry_times[token]
-            
-            return len(expired_tokens)
+            return self._sweep(time.time())
     
     def size(self) -> int:
         """
         Get the current size of the blacklist.
         
         Returns:
-            Number of blacklisted tokens
+            Number of blacklisted tokens (including expired ones not yet swept)
         """
-        with self._lock:
-            return len(self._blacklist)
+        return len(self._expiry_by_digest)
     
     def clear(self) -> None:
         """Clear all tokens from blacklist (useful for testing)."""
         with self._lock:
-            self._blacklist.clear()
-            self._expiry_times.clear()
+            self._expiry_by_digest.clear()
+            self._expiry_heap.clear()
+            self.synced_id = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get blacklist counters.
+        
+        Returns:
+            Dictionary with entries and synced_id
+        """
+        return {"entries": len(self._expiry_by_digest), "synced_id": self.synced_id}
+    
+    def _push(self, key: bytes, expiry: float) -> None:
+        """Insert an entry unless present (caller holds the lock)."""
+        if key not in self._expiry_by_digest:
+            self._expiry_by_digest[key] = expiry
+            heapq.heappush(self._expiry_heap, (expiry, key))
+    
+    def _sweep(self, now: float) -> int:
+        """Pop expired entries off the heap (caller holds the lock)."""
+        removed = 0
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            _, key = heapq.heappop(heap)
+            del self._expiry_by_digest[key]
+            removed += 1
+        return removed
 
 
 # Global blacklist instance
-token_blacklist = TokenBlacklist()
\ No newline at end of file
+token_blacklist = TokenBlacklist()
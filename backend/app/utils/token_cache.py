@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import time
+from app.config import settings
+
+
+class DecodedTokenCache:
+    """
+    In-memory cache of verified JWT claims, keyed by token digest.
+    
+    A client sends the same token on every request until it expires, and
+    some handlers decode it several times; each decode costs an HMAC check
+    plus base64 and JSON decoding. Only tokens that passed verification
+    are cached, and an entry is never returned past the token's exp.
+    
+    Keys are SHA-256 digests, so the cache holds no usable tokens.
+    Eviction is least recently used (max_entries); max_entries=0 disables
+    caching.
+    """
+    
+    def __init__(self, max_entries: int = 10000):
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = Lock()
+        self._max_entries = max_entries
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    @staticmethod
+    def digest(token: str) -> bytes:
+        """Get the cache key of a token."""
+        return hashlib.sha256(token.encode()).digest()
+    
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Get the cached claims of a token.
+        
+        Args:
+            key: Token digest (see digest())
+        
+        Returns:
+            Copy of the verified claims, or None on a miss (absent or expired)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                    self._evictions += 1
+                self._misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return dict(entry[1])
+    
+    def put(self, key: bytes, claims: Dict[str, Any]) -> None:
+        """
+        Cache the claims of a verified token until its exp.
+        
+        Args:
+            key: Token digest (see digest())
+            claims: Verified claims (tokens without exp are not cached)
+        """
+        if self._max_entries <= 0 or not isinstance(claims.get("exp"), (int, float)):
+            return
+        
+        with self._lock:
+            self._entries[key] = (claims["exp"], dict(claims))
+            self._entries.move_to_end(key)
+            
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+    
+    def clear(self) -> None:
+        """Clear all cached claims and counters (useful for testing)."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+        
+        Returns:
+            Dictionary with hits, misses, evictions and entries
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "entries": len(self._entries)
+            }
+
+
+# Global cache instance
+decoded_token_cache = DecodedTokenCache(max_entries=settings.TOKEN_CACHE_MAX_ENTRIES)
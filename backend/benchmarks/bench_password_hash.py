@@ -0,0 +1,49 @@
+"""
+Benchmark bcrypt hashing cost per cost factor, and the startup calibration.
+
+Prints the time of one hash at each cost (run in the password hasher's
+process pool, as in production), then the cost calibrate() picks for a
+latency budget. Use it to choose PASSWORD_HASH_ROUNDS, or a
+PASSWORD_HASH_TARGET_MS for calibration at startup.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_password_hash [--target-ms 250] [--max-rounds 14]
+"""
+import argparse
+import os
+import statistics
+import time
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from app.utils.password_hasher import PasswordHasher  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--max-rounds", type=int, default=14)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    
+    hasher = PasswordHasher(workers=1)
+    hasher.hash(b"warm-up", 4)
+    
+    for rounds in range(10, args.max_rounds + 1):
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            hasher.hash(b"benchmark password", rounds)
+            timings.append((time.perf_counter() - started) * 1000)
+        print(f"cost {rounds:>2}: {statistics.median(timings):8.1f} ms/hash")
+    
+    started = time.perf_counter()
+    rounds = hasher.calibrate(args.target_ms)
+    elapsed = (time.perf_counter() - started) * 1000
+    print(f"calibrate({args.target_ms:g} ms) -> cost {rounds} (took {elapsed:.0f} ms)")
+    
+    hasher.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Benchmark todo list serialization: response_model path vs. direct rendering.
+
+The "model" path mirrors the old handlers: copy each row into a dict,
+build TodoResponse objects, let FastAPI validate them against the
+response_model and encode with the stdlib JSON encoder. The "direct"
+path renders todo_to_dict() output with orjson.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_serialization [--rows 100] [--iterations 2000]
+"""
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from datetime import date, datetime, timezone
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_response_field  # noqa: E402
+
+from app.models.todo import Todo, PriorityLevel  # noqa: E402
+from app.schemas.todo import TodoResponse, TodoListResponse  # noqa: E402
+from app.utils.serializers import todo_to_dict  # noqa: E402
+
+
+def make_todos(rows: int) -> list:
+    """Build detached Todo objects as a list page would return them."""
+    now = datetime(2025, 1, 15, 10, 30, tzinfo=timezone.utc)
+    return [
+        Todo(
+            id=uuid.uuid4(),
+            user_id=uuid.uuid4(),
+            title=f"Todo {i}",
+            description="Write comprehensive API documentation with examples",
+            priority=PriorityLevel.HIGH,
+            due_date=date(2025, 12, 31),
+            is_completed=False,
+            created_at=now,
+            updated_at=now
+        )
+        for i in range(rows)
+    ]
+
+
+async def model_path(todos: list, field) -> bytes:
+    """Old path: dict copy -> TodoResponse -> response_model -> json."""
+    todo_responses = []
+    for todo in todos:
+        todo_dict = {
+            "id": str(todo.id),
+            "user_id": str(todo.user_id),
+            "title": todo.title,
+            "description": todo.description,
+            "priority": todo.priority,
+            "due_date": todo.due_date,
+            "is_completed": todo.is_completed,
+            "created_at": todo.created_at,
+            "updated_at": todo.updated_at
+        }
+        todo_responses.append(TodoResponse(**todo_dict))
+    
+    content = TodoListResponse(
+        todos=todo_responses,
+        pagination={"total": len(todos), "page": 1, "page_size": len(todos),
+                    "total_pages": 1, "has_more": False}
+    )
+    serialized = await serialize_response(field=field, response_content=content)
+    return JSONResponse(serialized).body
+
+
+async def direct_path(todos: list) -> bytes:
+    """New path: todo_to_dict -> orjson."""
+    return ORJSONResponse({
+        "todos": [todo_to_dict(todo) for todo in todos],
+        "pagination": {"total": len(todos), "page": 1, "page_size": len(todos),
+                       "total_pages": 1, "has_more": False, "next_cursor": None}
+    }).body
+
+
+async def run(rows: int, iterations: int) -> None:
+    """Time both paths on the same page of todos."""
+    todos = make_todos(rows)
+    field = create_response_field(name="response", type_=TodoListResponse, mode="serialization")
+    
+    for name, render in (
+        ("model", lambda: model_path(todos, field)),
+        ("direct", lambda: direct_path(todos)),
+    ):
+        await render()  # warm up
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await render()
+        elapsed = time.perf_counter() - started
+        per_row = elapsed / (iterations * rows) * 1e6
+        print(f"{name:>6}: {per_row:6.2f} µs/row ({elapsed / iterations * 1e3:.2f} ms/page)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    
+    asyncio.run(run(args.rows, args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+Benchmark the todo index layout: insert cost vs. list query cost.
+
+Compares the previous layout (four (user_id, X) indexes plus the
+standalone user_id index) with the current model indexes on a throwaway
+SQLite database.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_todo_indexes [--rows 20000] [--users 20]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+import uuid
+from datetime import date, datetime, timedelta, timezone
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine, event, insert, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.models import user, password_reset, todo  # noqa: E402,F401
+from app.models.todo import Todo, PriorityLevel, priority_rank  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.todo import SortField, SortOrder, CountStrategy  # noqa: E402
+from app.services.todo import get_user_todos  # noqa: E402
+
+# Index layout before the rework
+OLD_INDEXES = [
+    "CREATE INDEX ix_todos_user_id ON todos (user_id)",
+    "CREATE INDEX ix_todos_user_completed ON todos (user_id, is_completed)",
+    "CREATE INDEX ix_todos_user_created ON todos (user_id, created_at)",
+    "CREATE INDEX ix_todos_user_due_date ON todos (user_id, due_date)",
+    "CREATE INDEX ix_todos_user_priority ON todos (user_id, priority)",
+    "CREATE INDEX ix_todos_user_priority_rank ON todos (user_id, priority_rank)",
+]
+
+
+def make_engine(path: str, layout: str):
+    """Create a database with the given index layout ("old" or "new")."""
+    engine = create_engine(f"sqlite:///{path}")
+    
+    # Skip fsync so inserts measure index maintenance rather than the disk
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragma(dbapi_conn, connection_record):
+        cursor = dbapi_conn.cursor()
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.close()
+    
+    Base.metadata.create_all(bind=engine)
+    
+    if layout == "old":
+        with engine.begin() as conn:
+            for index in Todo.__table__.indexes:
+                conn.execute(text(f"DROP INDEX {index.name}"))
+            for ddl in OLD_INDEXES:
+                conn.execute(text(ddl))
+    
+    return engine
+
+
+def make_row(user_id: uuid.UUID, created_at: datetime) -> dict:
+    """Build one random todo row."""
+    priority = random.choice([None, *PriorityLevel])
+    return {
+        "id": uuid.uuid4(),
+        "user_id": user_id,
+        "title": "Benchmark todo",
+        "description": "x" * random.randint(0, 200),
+        "priority": priority,
+        "priority_rank": priority_rank(priority),
+        "due_date": date(2025, 1, 1) + timedelta(days=random.randint(0, 365)),
+        "is_completed": False,
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+def bench_inserts(engine, user_ids, rows: int) -> float:
+    """Insert rows one transaction at a time, like create_todo. Returns µs/insert."""
+    start_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    stmt = insert(Todo.__table__)
+    
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        for i in range(rows):
+            created_at = start_time + timedelta(seconds=i // 3)
+            conn.execute(stmt, make_row(random.choice(user_ids), created_at))
+            conn.commit()
+    elapsed = time.perf_counter() - started
+    
+    return elapsed / rows * 1e6
+
+
+def bench_lists(engine, user_ids, pages: int) -> dict:
+    """Time list queries per sort field. Returns µs/query per sort field."""
+    results = {}
+    with Session(engine) as db:
+        for sort_by in SortField:
+            # Relevance needs a search query; this compares plain list plans
+            if sort_by == SortField.RELEVANCE:
+                continue
+            started = time.perf_counter()
+            for i in range(pages):
+                get_user_todos(
+                    db,
+                    str(user_ids[i % len(user_ids)]),
+                    page=1 + i % 10,
+                    page_size=20,
+                    sort_by=sort_by,
+                    sort_order=SortOrder.DESC,
+                    count_strategy=CountStrategy.EXACT
+                )
+            results[sort_by.value] = (time.perf_counter() - started) / pages * 1e6
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--pages", type=int, default=500)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        for layout in ("old", "new"):
+            random.seed(1)
+            engine = make_engine(os.path.join(tmp, f"{layout}.db"), layout)
+            
+            user_ids = [uuid.uuid4() for _ in range(args.users)]
+            with engine.begin() as conn:
+                conn.execute(insert(User.__table__), [
+                    {"id": user_id, "username": f"user{i}", "password_hash": "x", "is_active": True}
+                    for i, user_id in enumerate(user_ids)
+                ])
+            
+            insert_us = bench_inserts(engine, user_ids, args.rows)
+            list_us = bench_lists(engine, user_ids, args.pages)
+            engine.dispose()
+            
+            print(f"{layout} indexes:")
+            print(f"  insert: {insert_us:8.1f} µs/row")
+            for sort_by, us in list_us.items():
+                print(f"  list by {sort_by:<10}: {us:8.1f} µs/page")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Benchmark token blacklist memory and latency at 1M entries.
+
+Compares the digest + expiry heap blacklist with the previous layout
+(full JWT strings in a set plus a dict of datetimes), using real tokens.
+Memory is measured with tracemalloc; the old layout also keeps every
+token string alive, so their size is added to its total. Latency is
+timed on a second fill without tracemalloc.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_token_blacklist [--entries 1000000]
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from app.utils.security import create_access_token  # noqa: E402
+from app.utils.token_blacklist import TokenBlacklist  # noqa: E402
+
+
+class FullTokenBlacklist:
+    """The previous layout: every token string in a set and a dict."""
+    
+    def __init__(self):
+        self._blacklist = set()
+        self._expiry_times = {}
+    
+    def add(self, token: str, expires_at: datetime) -> None:
+        self._blacklist.add(token)
+        self._expiry_times[token] = expires_at
+    
+    def is_blacklisted(self, token: str) -> bool:
+        return token in self._blacklist
+
+
+def measure(blacklist_class, tokens, expires_at) -> None:
+    """Fill a blacklist and print memory per entry and operation latency."""
+    blacklist = blacklist_class()
+    tracemalloc.start()
+    for token in tokens:
+        blacklist.add(token, expires_at)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if isinstance(blacklist, FullTokenBlacklist):
+        memory += sum(sys.getsizeof(token) for token in tokens)
+    
+    blacklist = blacklist_class()
+    started = time.perf_counter()
+    for token in tokens:
+        blacklist.add(token, expires_at)
+    add_us = (time.perf_counter() - started) / len(tokens) * 1e6
+    
+    probes = tokens[::10]
+    started = time.perf_counter()
+    for token in probes:
+        blacklist.is_blacklisted(token)
+    check_us = (time.perf_counter() - started) / len(probes) * 1e6
+    
+    print(f"{type(blacklist).__name__}:")
+    print(f"  memory: {memory / 2**20:8.1f} MiB ({memory / len(tokens):.0f} B/entry)")
+    print(f"  add   : {add_us:8.2f} µs")
+    print(f"  check : {check_us:8.2f} µs")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=1_000_000)
+    args = parser.parse_args()
+    
+    # Real tokens (signing is slow, so sign a few and vary the tail)
+    base = create_access_token({"sub": "550e8400-e29b-41d4-a716-446655440000", "username": "benchmark"})
+    tokens = [f"{base}{i:07d}" for i in range(args.entries)]
+    print(f"{args.entries} tokens of {len(tokens[0])} chars")
+    
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    for blacklist_class in (FullTokenBlacklist, TokenBlacklist):
+        measure(blacklist_class, tokens, expires_at)
+    
+    # Sweep: entries expiring one per µs from now, all expired by the sweep
+    blacklist = TokenBlacklist()
+    now = datetime.now(timezone.utc)
+    for i, token in enumerate(tokens):
+        blacklist.add(token, now + timedelta(microseconds=i))
+    print(f"sweep: {blacklist.size()} of {len(tokens)} entries left after the fill (rest swept by add)")
+    time.sleep(max(0.0, (now + timedelta(microseconds=len(tokens))).timestamp() - time.time()))
+    started = time.perf_counter()
+    removed = blacklist.cleanup_expired()
+    sweep_us = (time.perf_counter() - started) / max(removed, 1) * 1e6
+    print(f"       {removed} expired entries removed, {sweep_us:.2f} µs each, {blacklist.size()} left")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+Benchmark per-write latency of todo mutations on SQLite.
+
+The "orm" path mirrors the old handlers: SELECT the todo through
+get_todo_by_id, mutate it, commit, then refresh (default session with
+expire_on_commit). The "returning" path uses the ownership-checked
+single-statement services (UPDATE/DELETE ... RETURNING).
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_write_latency [--ops 2000]
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.database import Base  # noqa: E402
+from app.models import user, password_reset, todo  # noqa: E402,F401
+from app.models.todo import Todo  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.schemas.todo import TodoCreate, TodoUpdate  # noqa: E402
+from app.services.todo import (  # noqa: E402
+    create_todo,
+    get_todo_by_id,
+    update_todo_by_id,
+    delete_todo_by_id
+)
+
+
+def orm_ops(db, owner: User, ops: int) -> dict:
+    """Old style writes: lookup, mutate, commit, refresh."""
+    timings = {}
+    
+    started = time.perf_counter()
+    ids = []
+    for i in range(ops):
+        todo = Todo(user_id=owner.id, title=f"Todo {i}", due_date=date(2025, 1, 1))
+        db.add(todo)
+        db.commit()
+        db.refresh(todo)
+        ids.append(str(todo.id))
+    timings["create"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    for todo_id in ids:
+        todo = get_todo_by_id(db, todo_id, str(owner.id))
+        todo.title = "Updated"
+        db.commit()
+        db.refresh(todo)
+    timings["update"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    for todo_id in ids:
+        todo = get_todo_by_id(db, todo_id, str(owner.id))
+        db.delete(todo)
+        db.commit()
+    timings["delete"] = time.perf_counter() - started
+    
+    return timings
+
+
+def returning_ops(db, owner: User, ops: int) -> dict:
+    """New style writes: single ownership-checked statements."""
+    timings = {}
+    
+    started = time.perf_counter()
+    ids = []
+    for i in range(ops):
+        todo = create_todo(db, owner, TodoCreate(title=f"Todo {i}", due_date=date(2025, 1, 1)))
+        ids.append(str(todo.id))
+    timings["create"] = time.perf_counter() - started
+    
+    update_data = TodoUpdate(title="Updated")
+    started = time.perf_counter()
+    for todo_id in ids:
+        update_todo_by_id(db, todo_id, str(owner.id), update_data)
+    timings["update"] = time.perf_counter() - started
+    
+    started = time.perf_counter()
+    for todo_id in ids:
+        delete_todo_by_id(db, todo_id, str(owner.id))
+    timings["delete"] = time.perf_counter() - started
+    
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=2000)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        
+        for name, session_options, run in (
+            ("orm", {}, orm_ops),
+            ("returning", {"expire_on_commit": False}, returning_ops),
+        ):
+            Session = sessionmaker(bind=engine, autoflush=False, **session_options)
+            with Session() as db:
+                owner = User(username=f"bench_{name}", password_hash="x")
+                db.add(owner)
+                db.commit()
+                
+                timings = run(db, owner, args.ops)
+            
+            print(f"{name}:")
+            for op, elapsed in timings.items():
+                print(f"  {op:<6}: {elapsed / args.ops * 1e6:8.1f} µs/write")
+        
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Shared fixtures: a throwaway SQLite database and an API client.
+
+Settings are read at import time, so the environment is set up before
+the app is imported.
+"""
+import os
+import tempfile
+import uuid
+
+_db_dir = tempfile.mkdtemp(prefix="todo-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_db_dir}/test.db"
+os.environ.setdefault("SECRET_KEY", "test")
+os.environ["RATE_LIMIT_ENABLED"] = "False"
+os.environ["PASSWORD_HASH_ROUNDS"] = "4"
+os.environ["PASSWORD_HASH_TARGET_MS"] = "0"
+os.environ["TOKEN_REVOCATION_SYNC_SECONDS"] = "0"
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.database import engine  # noqa: E402
+from app.utils.login_throttle import login_throttle  # noqa: E402
+from app.utils.rate_limiter import rate_limit_store  # noqa: E402
+
+PASSWORD = "Password123!"
+
+
+@pytest.fixture(scope="session")
+def client():
+    """API client; runs the app's startup (tables, migrations) and shutdown."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def db_engine(client):
+    """Engine of the test database, once the app has created the schema."""
+    return engine
+
+
+@pytest.fixture(autouse=True)
+def reset_throttles():
+    """Start every test with no rate limit buckets or failed logins."""
+    rate_limit_store.clear()
+    login_throttle.clear()
+
+
+@pytest.fixture
+def make_user(client):
+    """Register a new user and return (username, auth headers)."""
+    def make():
+        username = f"user_{uuid.uuid4().hex[:12]}"
+        response = client.post("/api/auth/register", json={"username": username, "password": PASSWORD})
+        assert response.status_code == 201, response.text
+        response = client.post("/api/auth/login", json={"username": username, "password": PASSWORD})
+        assert response.status_code == 200, response.text
+        return username, {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return make
+
+
+@pytest.fixture
+def auth_headers(make_user):
+    """Auth headers of a new user."""
+    return make_user()[1]
+
+
+@pytest.fixture
+def create_todo(client):
+    """Create a todo through the API and return its JSON."""
+    def create(headers, title, **fields):
+        payload = {"title": title, "due_date": "2030-01-01T00:00:00Z", **fields}
+        response = client.post("/api/todos/", json=payload, headers=headers)
+        assert response.status_code == 201, response.text
+        return response.json()
+    return create
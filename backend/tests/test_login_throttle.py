@@ -0,0 +1,63 @@
+from app.config import settings
+from app.utils import login_throttle as login_throttle_module
+from app.utils.login_throttle import LoginThrottle
+
+from conftest import PASSWORD
+
+
+def login(client, username, password):
+    return client.post("/api/auth/login", json={"username": username, "password": password})
+
+
+def test_failed_logins_back_off_before_the_password_check(client, make_user):
+    username, _ = make_user()
+
+    for _ in range(settings.LOGIN_THROTTLE_USER_ATTEMPTS + 1):
+        assert login(client, username, "Wrong-password1").status_code == 401
+
+    # Blocked: even the right password is rejected without being checked
+    response = login(client, username, PASSWORD)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+
+def test_success_clears_the_username_record(client, make_user):
+    username, _ = make_user()
+
+    for _ in range(settings.LOGIN_THROTTLE_USER_ATTEMPTS):
+        assert login(client, username, "Wrong-password1").status_code == 401
+    assert login(client, username, PASSWORD).status_code == 200
+
+    for _ in range(settings.LOGIN_THROTTLE_USER_ATTEMPTS):
+        assert login(client, username, "Wrong-password1").status_code == 401
+    assert login(client, username, PASSWORD).status_code == 200
+
+
+def test_backoff_doubles_up_to_max_delay_and_resets(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(login_throttle_module.time, "monotonic", lambda: now[0])
+    throttle = LoginThrottle(user_attempts=1, ip_attempts=100, base_delay=1, max_delay=4, reset_seconds=60)
+
+    def blocked_for():
+        try:
+            throttle.check("alice", "10.0.0.1")
+        except login_throttle_module.LoginThrottled as e:
+            return e.retry_after
+        return 0
+
+    throttle.record_failure("alice", "10.0.0.1")
+    assert blocked_for() == 0
+
+    delays = []
+    for _ in range(4):
+        throttle.record_failure("alice", "10.0.0.1")
+        delays.append(blocked_for())
+        now[0] += delays[-1]
+    assert delays == [1, 2, 4, 4]
+
+    # Other usernames from the same IP are not blocked
+    throttle.check("bob", "10.0.0.1")
+
+    now[0] += 61
+    throttle.record_failure("alice", "10.0.0.1")
+    assert blocked_for() == 0
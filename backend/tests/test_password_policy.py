@@ -0,0 +1,58 @@
+import bcrypt
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.app_setting import AppSetting
+from app.services.password_policy import load_password_hash_rounds
+from app.utils.password_hasher import PasswordHasher, password_hasher
+
+
+def test_needs_rehash_only_upgrades():
+    hasher = PasswordHasher(rounds=5)
+
+    assert hasher.needs_rehash(bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4)))
+    assert not hasher.needs_rehash(bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=5)))
+    assert not hasher.needs_rehash(bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=6)))
+    assert hasher.needs_rehash(bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=6, prefix=b"2a")))
+
+
+def test_calibration_runs_once_and_is_shared(client, monkeypatch):
+    calls = []
+
+    def calibrate(target_ms, min_rounds):
+        calls.append((target_ms, min_rounds))
+        return 7
+
+    monkeypatch.setattr(settings, "PASSWORD_HASH_TARGET_MS", 123)
+    monkeypatch.setattr(settings, "PASSWORD_HASH_MIN_ROUNDS", 5)
+    monkeypatch.setattr(password_hasher, "rounds", 4)
+    monkeypatch.setattr(password_hasher, "calibrate", calibrate)
+
+    db = SessionLocal()
+    try:
+        assert load_password_hash_rounds(db) == 7
+
+        # Another worker (or a restart) reads the stored cost back
+        password_hasher.rounds = 4
+        assert load_password_hash_rounds(db) == 7
+        assert password_hasher.rounds == 7
+        assert calls == [(123, 5)]
+
+        # A raised floor applies to the stored cost too
+        monkeypatch.setattr(settings, "PASSWORD_HASH_MIN_ROUNDS", 9)
+        assert load_password_hash_rounds(db) == 9
+    finally:
+        db.query(AppSetting).delete()
+        db.commit()
+        db.close()
+
+
+def test_without_budget_configured_cost_is_kept(client, monkeypatch):
+    monkeypatch.setattr(settings, "PASSWORD_HASH_TARGET_MS", 0)
+    monkeypatch.setattr(password_hasher, "rounds", 4)
+
+    db = SessionLocal()
+    try:
+        assert load_password_hash_rounds(db) == 4
+    finally:
+        db.close()
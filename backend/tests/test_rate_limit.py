@@ -0,0 +1,79 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+from app.utils import rate_limiter
+from app.utils.rate_limiter import RateLimitMiddleware, RateLimitPolicy, TokenBucketStore
+
+
+@pytest.fixture
+def limited_client(client):
+    """Client for the app behind the rate limit middleware, with its own buckets."""
+    return TestClient(RateLimitMiddleware(app, store=TokenBucketStore()))
+
+
+def test_bucket_allows_burst_then_refills(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    store = TokenBucketStore()
+    policy = RateLimitPolicy("test", 2, window=60)
+
+    assert store.take(policy, "a")[:2] == (True, 1)
+    assert store.take(policy, "a")[:2] == (True, 0)
+    allowed, remaining, retry_after = store.take(policy, "a")
+    assert (allowed, remaining, retry_after) == (False, 0, 30)
+
+    # Buckets are per client
+    assert store.take(policy, "b")[0] is True
+
+    now[0] += 30
+    assert store.take(policy, "a")[0] is True
+    assert store.take(policy, "a")[0] is False
+    assert store.stats()["limited"] == 2
+
+
+def test_full_buckets_are_evicted(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    store = TokenBucketStore(shards=1)
+    policy = RateLimitPolicy("test", 2, window=60)
+
+    store.take(policy, "a")
+    now[0] += 60
+    store.take(policy, "b")
+    assert store.stats()["buckets"] == 1
+
+
+def test_auth_endpoints_are_limited_per_client_ip(limited_client):
+    limit = settings.RATE_LIMIT_AUTH_PER_MINUTE
+    for remaining in reversed(range(limit)):
+        response = limited_client.post("/api/auth/register", json={})
+        assert response.status_code == 422
+        assert response.headers["RateLimit-Remaining"] == str(remaining)
+        assert response.headers["RateLimit-Policy"] == f"{limit};w=60"
+
+    response = limited_client.post("/api/auth/register", json={})
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert response.json() == {"detail": "Too many requests, try again later"}
+
+
+def test_api_limits_are_per_user_and_per_route_policy(limited_client, make_user):
+    _, alice = make_user()
+    _, bob = make_user()
+
+    response = limited_client.get("/api/todos/", headers=alice)
+    assert response.headers["RateLimit-Limit"] == str(settings.RATE_LIMIT_PER_MINUTE)
+    assert response.headers["RateLimit-Remaining"] == str(settings.RATE_LIMIT_PER_MINUTE - 1)
+    response = limited_client.get("/api/todos/", headers=bob)
+    assert response.headers["RateLimit-Remaining"] == str(settings.RATE_LIMIT_PER_MINUTE - 1)
+
+    response = limited_client.get("/api/todos/export", headers=alice)
+    assert response.headers["RateLimit-Limit"] == str(settings.RATE_LIMIT_BULK_PER_MINUTE)
+
+
+def test_paths_outside_api_are_not_limited(limited_client):
+    response = limited_client.get("/health")
+    assert response.status_code == 200
+    assert "RateLimit-Limit" not in response.headers
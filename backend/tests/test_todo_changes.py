@@ -0,0 +1,113 @@
+import uuid
+
+from sqlalchemy import insert, select, text
+
+from app.database import SessionLocal
+from app.models.todo_tombstone import TodoTombstone
+from app.models.user import User
+from app.services.todo import purge_todo_tombstones
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def changes(client, headers, since=None, **params):
+    if since is not None:
+        params["since"] = since
+    response = client.get("/api/todos/changes", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_changes_return_updates_deletions_and_completions_since_cursor(client, auth_headers, create_todo):
+    kept = create_todo(auth_headers, "Kept")
+    deleted = create_todo(auth_headers, "Deleted")
+    completed = create_todo(auth_headers, "Completed")
+    
+    full = changes(client, auth_headers)
+    assert sorted(todo["title"] for todo in full["todos"]) == ["Completed", "Deleted", "Kept"]
+    assert full["deleted"] == []
+    assert full["has_more"] is False
+    
+    assert changes(client, auth_headers, full["cursor"])["todos"] == []
+    
+    client.put(f"/api/todos/{kept['id']}", json={"title": "Kept, renamed"}, headers=auth_headers)
+    client.delete(f"/api/todos/{deleted['id']}", headers=auth_headers)
+    client.post(f"/api/todos/{completed['id']}/complete", headers=auth_headers)
+    
+    delta = changes(client, auth_headers, full["cursor"])
+    assert [todo["title"] for todo in delta["todos"]] == ["Kept, renamed"]
+    assert sorted(delta["deleted"]) == sorted([deleted["id"], completed["id"]])
+    assert changes(client, auth_headers, delta["cursor"]) == {**delta, "todos": [], "deleted": []}
+
+
+def test_changes_pages_return_every_change_once(client, auth_headers, create_todo):
+    created = [create_todo(auth_headers, f"Todo {i}")["id"] for i in range(5)]
+    client.delete(f"/api/todos/{created[0]}", headers=auth_headers)
+    
+    seen, deleted, cursor, pages = [], [], None, 0
+    while True:
+        page = changes(client, auth_headers, cursor, limit=2)
+        seen += [todo["id"] for todo in page["todos"]]
+        deleted += page["deleted"]
+        cursor, pages = page["cursor"], pages + 1
+        if not page["has_more"]:
+            break
+    
+    assert sorted(seen) == sorted(created[1:])
+    assert deleted == [created[0]]
+    assert pages == 3
+
+
+def test_changes_reject_cursor_older_than_tombstone_retention(client, auth_headers, create_todo):
+    create_todo(auth_headers, "Todo")
+    data = decode_cursor(changes(client, auth_headers)["cursor"])
+    
+    stale = encode_cursor({**data, "t": data["t"] - 31 * 86400})
+    response = client.get("/api/todos/changes", params={"since": stale}, headers=auth_headers)
+    assert response.status_code == 410
+    
+    # Cursors issued before they carried a timestamp cannot be trusted either
+    untimed = encode_cursor({key: value for key, value in data.items() if key != "t"})
+    response = client.get("/api/todos/changes", params={"since": untimed}, headers=auth_headers)
+    assert response.status_code == 410
+    
+    fresh = encode_cursor({**data, "t": data["t"] - 29 * 86400})
+    assert changes(client, auth_headers, fresh)["has_more"] is False
+    
+    response = client.get("/api/todos/changes", params={"since": "garbage"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_caught_up_cursor_restarts_the_retention_clock(client, auth_headers, create_todo):
+    create_todo(auth_headers, "Todo")
+    data = decode_cursor(changes(client, auth_headers)["cursor"])
+    
+    old = encode_cursor({**data, "t": data["t"] - 29 * 86400})
+    assert decode_cursor(changes(client, auth_headers, old)["cursor"])["t"] >= data["t"]
+
+
+def test_purge_deletes_only_tombstones_past_retention(client, db_engine, make_user):
+    username, _ = make_user()
+    old_id, recent_id = str(uuid.uuid4()), str(uuid.uuid4())
+    
+    db = SessionLocal()
+    try:
+        user_id = db.execute(select(User.id).where(User.username == username)).scalar_one()
+        db.execute(insert(TodoTombstone.__table__), [
+            {"todo_id": old_id, "user_id": user_id, "change_seq": 1},
+            {"todo_id": recent_id, "user_id": user_id, "change_seq": 2},
+        ])
+        db.execute(
+            text("UPDATE todo_tombstones SET deleted_at = datetime('now', '-31 days') WHERE todo_id = :id"),
+            {"id": old_id}
+        )
+        db.commit()
+        
+        assert purge_todo_tombstones(db, retention_days=30) == 1
+        assert purge_todo_tombstones(db, retention_days=0) == 0
+        
+        remaining = db.execute(
+            select(TodoTombstone.todo_id).where(TodoTombstone.user_id == user_id)
+        ).scalars().all()
+        assert [str(todo_id) for todo_id in remaining] == [recent_id]
+    finally:
+        db.close()
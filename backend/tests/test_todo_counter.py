@@ -0,0 +1,56 @@
+import typing
+
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings
+from app.schemas.todo import CountStrategy
+from app.utils.todo_counter import TodoCounter
+
+
+def test_seed_during_a_write_is_dropped():
+    counter = TodoCounter()
+    counter.seed("u", 3, counter.snapshot())
+    
+    with counter.writing():
+        # A COUNT that already sees the commit, seeded before adjust()
+        marker = counter.snapshot()
+        counter.seed("u", 4, marker)
+        counter.adjust("u", 1)
+    
+    assert counter.get("u") == 4
+
+
+def test_seed_spanning_a_write_is_dropped():
+    counter = TodoCounter()
+    marker = counter.snapshot()
+    
+    with counter.writing():
+        counter.adjust("u", 1)
+    counter.seed("u", 0, marker)
+    
+    assert counter.get("u") is None
+    
+    counter.seed("u", 1, counter.snapshot())
+    assert counter.get("u") == 1
+
+
+def test_failed_write_does_not_block_seeding():
+    counter = TodoCounter()
+    
+    try:
+        with counter.writing():
+            raise RuntimeError("commit failed")
+    except RuntimeError:
+        pass
+    
+    counter.seed("u", 2, counter.snapshot())
+    assert counter.get("u") == 2
+
+
+def test_count_strategy_setting_is_validated_at_startup():
+    allowed = typing.get_args(Settings.model_fields["TODO_COUNT_STRATEGY"].annotation)
+    assert set(allowed) == {strategy.value for strategy in CountStrategy}
+    
+    with pytest.raises(ValidationError):
+        Settings(TODO_COUNT_STRATEGY="bogus")
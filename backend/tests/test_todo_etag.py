@@ -0,0 +1,64 @@
+import uuid
+
+
+def get(client, url, headers, etag=None, **params):
+    if etag is not None:
+        headers = {**headers, "If-None-Match": etag}
+    return client.get(url, params=params, headers=headers)
+
+
+def test_list_etag_revalidates_until_todos_change(client, auth_headers, create_todo):
+    create_todo(auth_headers, "First")
+    
+    response = get(client, "/api/todos/", auth_headers)
+    etag = response.headers["ETag"]
+    assert response.status_code == 200
+    
+    response = get(client, "/api/todos/", auth_headers, etag)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    
+    # Other query parameters are a different representation
+    assert get(client, "/api/todos/", auth_headers, etag, sort_order="asc").status_code == 200
+    
+    create_todo(auth_headers, "Second")
+    response = get(client, "/api/todos/", auth_headers, etag)
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_single_todo_etag_changes_on_update(client, auth_headers, create_todo):
+    todo = create_todo(auth_headers, "Todo")
+    url = f"/api/todos/{todo['id']}"
+    
+    etag = get(client, url, auth_headers).headers["ETag"]
+    assert get(client, url, auth_headers, etag).status_code == 304
+    assert get(client, url, auth_headers, f'"other", {etag}').status_code == 304
+    assert get(client, url, auth_headers, "*").status_code == 304
+    
+    client.put(url, json={"title": "Renamed"}, headers=auth_headers)
+    response = get(client, url, auth_headers, etag)
+    assert response.status_code == 200
+    assert response.json()["title"] == "Renamed"
+
+
+def test_etag_is_per_user(client, make_user, create_todo):
+    _, alice = make_user()
+    _, bob = make_user()
+    create_todo(alice, "Alice's")
+    
+    etag = get(client, "/api/todos/", alice).headers["ETag"]
+    assert get(client, "/api/todos/", bob, etag).status_code == 200
+
+
+def test_missing_or_foreign_todo_never_matches(client, make_user, create_todo):
+    _, alice = make_user()
+    _, bob = make_user()
+    todo = create_todo(alice, "Alice's")
+    
+    response = get(client, f"/api/todos/{uuid.uuid4()}", alice, "*")
+    assert response.status_code == 404
+    
+    response = get(client, f"/api/todos/{todo['id']}", bob, "*")
+    assert response.status_code == 404
@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from app.api.v1.todos import _todo_event_stream
+from app.config import settings
+
+from conftest import PASSWORD
+
+
+def first_frames(stream, count):
+    """Read up to count frames from an event stream, then close it."""
+    async def read():
+        frames = []
+        try:
+            async for frame in stream:
+                frames.append(frame)
+                if len(frames) == count:
+                    break
+        finally:
+            await stream.aclose()
+        return frames
+    return asyncio.run(asyncio.wait_for(read(), 5))
+
+
+def open_stream(client, headers):
+    me = client.get("/api/users/me", headers=headers).json()
+    token = headers["Authorization"].split()[1]
+    return _todo_event_stream(me["id"], 0, None, token, 0)
+
+
+@pytest.fixture(autouse=True)
+def fast_heartbeat(monkeypatch):
+    monkeypatch.setattr(settings, "TODO_EVENTS_HEARTBEAT_SECONDS", 0.01)
+
+
+def test_stream_sends_heartbeats_while_token_is_valid(client, auth_headers):
+    frames = first_frames(open_stream(client, auth_headers), 3)
+    assert b"event: ready" in frames[0]
+    assert frames[1:] == [b": keepalive\n\n", b": keepalive\n\n"]
+
+
+def test_logout_ends_open_stream(client, auth_headers):
+    stream = open_stream(client, auth_headers)
+    assert client.post("/api/auth/logout", headers=auth_headers).status_code == 204
+    
+    frames = first_frames(stream, 3)
+    assert frames[1].startswith(b"event: expired")
+    assert len(frames) == 2
+
+
+def test_password_change_ends_open_stream(client, auth_headers):
+    stream = open_stream(client, auth_headers)
+    response = client.put("/api/users/me", json={"password": PASSWORD + "x"}, headers=auth_headers)
+    assert response.status_code == 200
+    
+    frames = first_frames(stream, 3)
+    assert frames[1].startswith(b"event: expired")
+    assert len(frames) == 2
@@ -0,0 +1,50 @@
+import orjson
+from sqlalchemy import select
+
+from app.database import SessionLocal
+from app.models.user import User
+from app.services.todo import iter_user_todos
+
+
+def user_id_of(username):
+    db = SessionLocal()
+    try:
+        return db.execute(select(User.id).where(User.username == username)).scalar_one()
+    finally:
+        db.close()
+
+
+def test_export_streams_every_todo_oldest_first(client, make_user, create_todo):
+    _, headers = make_user()
+    created = [create_todo(headers, f"Todo {i}")["id"] for i in range(5)]
+    
+    response = client.get("/api/todos/export", headers=headers)
+    assert response.status_code == 200
+    lines = [orjson.loads(line) for line in response.content.splitlines()]
+    assert sorted(todo["id"] for todo in lines) == sorted(created)
+    assert [todo["created_at"] for todo in lines] == sorted(todo["created_at"] for todo in lines)
+    
+    response = client.get("/api/todos/export", params={"format": "csv"}, headers=headers)
+    assert len(response.text.splitlines()) == 6
+
+
+def test_batches_cover_ties_and_do_not_block_writers(client, make_user, create_todo):
+    username, headers = make_user()
+    created = [create_todo(headers, f"Todo {i}")["id"] for i in range(5)]
+    
+    db = SessionLocal()
+    try:
+        batches = iter_user_todos(db, user_id_of(username), batch_size=2)
+        seen = [str(todo.id) for todo in next(batches)]
+        
+        # A write while the export is between batches does not wait on it
+        late = create_todo(headers, "Written mid-export")["id"]
+        
+        for batch in batches:
+            seen += [str(todo.id) for todo in batch]
+    finally:
+        db.close()
+    
+    # Rows written mid-export may or may not be included, but none twice
+    assert len(seen) == len(set(seen))
+    assert set(created) <= set(seen) <= set(created + [late])
@@ -0,0 +1,63 @@
+import pytest
+
+from app.utils.pagination import decode_cursor, encode_cursor
+
+
+def list_page(client, headers, **params):
+    response = client.get("/api/todos/", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.fixture
+def todos(auth_headers, create_todo):
+    """Seven todos with tied due dates and priorities, to exercise the id tiebreak."""
+    for i in range(7):
+        create_todo(
+            auth_headers,
+            f"Todo {i}",
+            due_date=f"2030-01-0{1 + i % 3}T00:00:00Z",
+            priority=["high", "medium", "low"][i % 3] if i % 4 else None
+        )
+
+
+@pytest.mark.parametrize("sort_by", ["created_at", "due_date", "priority"])
+@pytest.mark.parametrize("sort_order", ["asc", "desc"])
+def test_cursor_pages_match_offset_order(client, auth_headers, todos, sort_by, sort_order):
+    params = {"sort_by": sort_by, "sort_order": sort_order}
+    expected = [todo["id"] for todo in list_page(client, auth_headers, page_size=100, **params)["todos"]]
+    assert len(expected) == 7
+
+    seen, cursor = [], None
+    while True:
+        page = list_page(client, auth_headers, page_size=3, **params, **({"cursor": cursor} if cursor else {}))
+        seen += [todo["id"] for todo in page["todos"]]
+        cursor = page["pagination"]["next_cursor"]
+        assert page["pagination"]["has_more"] is (cursor is not None)
+        if cursor is None:
+            break
+
+    assert seen == expected
+
+
+def test_cursor_must_match_sort(client, auth_headers, todos):
+    cursor = list_page(client, auth_headers, page_size=3)["pagination"]["next_cursor"]
+
+    response = client.get(
+        "/api/todos/", params={"cursor": cursor, "sort_by": "priority"}, headers=auth_headers
+    )
+    assert response.status_code == 400
+
+    response = client.get(
+        "/api/todos/", params={"cursor": cursor, "sort_order": "asc"}, headers=auth_headers
+    )
+    assert response.status_code == 400
+
+
+def test_invalid_cursor_is_rejected(client, auth_headers, todos):
+    cursor = list_page(client, auth_headers, page_size=3)["pagination"]["next_cursor"]
+    tampered = encode_cursor({**decode_cursor(cursor), "id": "not-a-uuid"})
+
+    for bad in ("garbage", tampered):
+        response = client.get("/api/todos/", params={"cursor": bad}, headers=auth_headers)
+        assert response.status_code == 400, bad
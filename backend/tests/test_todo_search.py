@@ -0,0 +1,101 @@
+from sqlalchemy import create_engine, text
+
+from app.database import Base
+from app.migrations import create_todo_search_index
+from app.models.todo import TODO_FTS_TABLE, TODO_FTS_KEYS_TABLE
+
+
+def search(client, headers, q, **params):
+    response = client.get("/api/todos/", params={"q": q, **params}, headers=headers)
+    assert response.status_code == 200, response.text
+    return [todo["title"] for todo in response.json()["todos"]]
+
+
+def test_search_matches_word_prefixes_in_title_and_description(client, auth_headers, create_todo):
+    create_todo(auth_headers, "Buy groceries")
+    create_todo(auth_headers, "Call plumber", description="kitchen sink leaks")
+    create_todo(auth_headers, "Read a book")
+    
+    assert search(client, auth_headers, "groc") == ["Buy groceries"]
+    assert search(client, auth_headers, "kitchen") == ["Call plumber"]
+    assert search(client, auth_headers, "call sink") == ["Call plumber"]
+    assert search(client, auth_headers, "call book") == []
+
+
+def test_search_only_returns_own_todos(client, make_user, create_todo):
+    _, alice = make_user()
+    _, bob = make_user()
+    create_todo(alice, "Alice secret plan")
+    
+    assert search(client, alice, "secret") == ["Alice secret plan"]
+    assert search(client, bob, "secret") == []
+
+
+def test_search_follows_updates_and_deletes(client, auth_headers, create_todo):
+    todo = create_todo(auth_headers, "Draft report")
+    other = create_todo(auth_headers, "Draft email")
+    
+    response = client.put(f"/api/todos/{todo['id']}", json={"title": "Final report"}, headers=auth_headers)
+    assert response.status_code == 200
+    assert search(client, auth_headers, "draft") == ["Draft email"]
+    assert search(client, auth_headers, "final") == ["Final report"]
+    
+    assert client.delete(f"/api/todos/{other['id']}", headers=auth_headers).status_code == 204
+    assert search(client, auth_headers, "draft") == []
+
+
+def test_search_survives_rowid_renumbering(client, db_engine, auth_headers, create_todo):
+    # todos has no INTEGER PRIMARY KEY, so VACUUM (or copying the table)
+    # may renumber its implicit rowids; renumber them outright here
+    create_todo(auth_headers, "Keep watering plants")
+    create_todo(auth_headers, "Repot the cactus")
+    
+    with db_engine.begin() as conn:
+        conn.execute(text("UPDATE todos SET rowid = -rowid"))
+    with db_engine.connect() as conn:
+        conn.exec_driver_sql("VACUUM")
+    
+    assert search(client, auth_headers, "watering") == ["Keep watering plants"]
+    assert search(client, auth_headers, "cactus") == ["Repot the cactus"]
+
+
+def test_relevance_sort_requires_search(client, auth_headers):
+    response = client.get("/api/todos/", params={"sort_by": "relevance"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_search_without_words_is_rejected(client, auth_headers):
+    response = client.get("/api/todos/", params={"q": "!!!"}, headers=auth_headers)
+    assert response.status_code == 400
+
+
+def test_migration_replaces_rowid_keyed_index(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/old.db")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE {TODO_FTS_TABLE} USING fts5("
+            "title, description, content='todos', content_rowid='rowid')"
+        ))
+        conn.execute(text(
+            "INSERT INTO users (id, username, password_hash, is_active, todos_version, token_version) "
+            "VALUES ('u1', 'old', 'x', 1, 0, 0)"
+        ))
+        conn.execute(text(
+            "INSERT INTO todos (id, user_id, title, due_date, is_completed, priority_rank, change_seq) "
+            "VALUES ('t1', 'u1', 'Legacy entry', '2030-01-01', 0, 0, 0)"
+        ))
+    
+    create_todo_search_index(engine)
+    
+    with engine.connect() as conn:
+        keys = conn.execute(text(f"SELECT todo_id FROM {TODO_FTS_KEYS_TABLE}")).scalars().all()
+        matches = conn.execute(text(
+            f"SELECT k.todo_id FROM {TODO_FTS_TABLE} f "
+            f"JOIN {TODO_FTS_KEYS_TABLE} k ON k.rowid = f.rowid "
+            f"WHERE {TODO_FTS_TABLE} MATCH 'legacy'"
+        )).scalars().all()
+    engine.dispose()
+    
+    assert keys == ["t1"]
+    assert matches == ["t1"]
@@ -0,0 +1,53 @@
+import os
+import time
+
+from sqlalchemy import func, select
+
+from app.database import SessionLocal
+from app.models.revoked_token import RevokedToken
+from app.services.token_revocation import sync_revoked_tokens
+from app.utils.token_blacklist import token_blacklist
+
+
+def me(client, headers):
+    return client.get("/api/users/me", headers=headers).status_code
+
+
+def test_logout_revokes_token_here_and_in_other_workers(client, auth_headers):
+    assert me(client, auth_headers) == 200
+    assert client.post("/api/auth/logout", headers=auth_headers).status_code == 204
+    assert me(client, auth_headers) == 401
+
+    # Another worker starts with an empty blacklist and loads the table
+    token_blacklist.clear()
+    assert me(client, auth_headers) == 200
+    db = SessionLocal()
+    try:
+        sync_revoked_tokens(db)
+    finally:
+        db.close()
+    assert me(client, auth_headers) == 401
+
+
+def test_sync_picks_up_rows_committed_out_of_id_order(client):
+    expires_at = int(time.time()) + 3600
+    early, late = os.urandom(16), os.urandom(16)
+
+    db = SessionLocal()
+    try:
+        last_id = db.execute(select(func.coalesce(func.max(RevokedToken.id), 0))).scalar_one()
+        sync_revoked_tokens(db)
+
+        # Id last_id + 1 is taken by a transaction that commits after last_id + 2
+        db.add(RevokedToken(id=last_id + 2, token_digest=early, expires_at=expires_at))
+        db.commit()
+        sync_revoked_tokens(db)
+        assert token_blacklist.synced_id == last_id + 2
+
+        db.add(RevokedToken(id=last_id + 1, token_digest=late, expires_at=expires_at))
+        db.commit()
+        sync_revoked_tokens(db)
+        assert late in token_blacklist._expiry_by_digest
+        assert early in token_blacklist._expiry_by_digest
+    finally:
+        db.close()
@@ -0,0 +1,42 @@
+from sqlalchemy import event
+
+from app.database import SessionLocal, engine
+from app.schemas.user import UserCreate, UserUpdate
+from app.services.auth import create_user, get_user_by_username
+from app.services.user import update_user_profile
+
+from conftest import PASSWORD
+
+
+def test_register_and_update_return_server_timestamps(client, make_user):
+    username, headers = make_user()
+    me = client.get("/api/users/me", headers=headers).json()
+    
+    response = client.put("/api/users/me", json={"username": username + "_new"}, headers=headers)
+    assert response.status_code == 200, response.text
+    updated = response.json()
+    assert updated["username"] == username + "_new"
+    assert updated["created_at"] == me["created_at"]
+    assert updated["updated_at"] >= me["updated_at"]
+
+
+def test_user_writes_do_not_select_back(client):
+    statements = []
+    
+    def record(conn, cursor, statement, *args):
+        statements.append(statement.split()[0].upper())
+    
+    db = SessionLocal()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        user = create_user(db, UserCreate(username="no_refresh_user", password=PASSWORD))
+        assert user.created_at is not None and user.updated_at is not None
+        
+        statements.clear()
+        update_user_profile(db, user, UserUpdate(username="no_refresh_user2"))
+        assert statements.count("SELECT") == 1  # the username availability check
+        assert user.username == "no_refresh_user2" and user.updated_at is not None
+        assert get_user_by_username(db, "no_refresh_user2") is user
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+        db.close()
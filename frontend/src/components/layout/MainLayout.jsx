@@ -1,6 +1,7 @@
 import { Outlet, Link, useNavigate } from 'react-router-dom';
 import useAuthStore from '../../stores/authStore';
 import { useLogout } from '../../hooks/useAuth';
+import { useTodoEvents } from '../../hooks/useTodos';
 import useAppStore from '../../stores/appStore';
 
 function MainLayout() {
@@ -9,6 +10,9 @@ function MainLayout() {
   const navigate = useNavigate();
   const showNotification = useAppStore((state) => state.showNotification);
 
+  // Live todo updates for every protected page
+  useTodoEvents();
+
   const handleLogout = async () => {
     try {
       await logoutMutation.mutateAsync();
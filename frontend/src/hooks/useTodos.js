@@ -1,5 +1,6 @@
+import { useEffect } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
-import { todoAPI } from '../Lib/api';
+import api, { todoAPI, getAuthToken } from '../Lib/api';
 
 // Query keys
 export const todoKeys = {
@@ -108,4 +109,63 @@ export function useDeleteTodo() {
       queryClient.invalidateQueries({ queryKey: todoKeys.lists() });
     },
   });
-}
\ No newline at end of file
+}
+
+// ============================================
+// SUBSCRIPTION: Server-pushed todo changes
+// ============================================
+// Keeps todo queries fresh without polling: every create/update/complete/
+// delete (from any tab or device) invalidates the cached todo queries.
+// fetch() instead of EventSource so the token goes in the Authorization
+// header rather than the URL.
+export function useTodoEvents() {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    const controller = new AbortController();
+    let retryTimer;
+
+    const connect = async () => {
+      const token = getAuthToken();
+      if (!token) return;
+
+      try {
+        const response = await fetch(`${api.defaults.baseURL}/api/todos/events`, {
+          headers: { Authorization: `Bearer ${token}` },
+          signal: controller.signal,
+        });
+        if (!response.ok) return; // Logged out or token revoked: stop
+
+        const reader = response.body.pipeThrough(new TextDecoderStream()).getReader();
+        let buffer = '';
+        for (;;) {
+          const { value, done } = await reader.read();
+          if (done) break;
+
+          buffer += value;
+          const frames = buffer.split('\n\n');
+          buffer = frames.pop();
+          for (const frame of frames) {
+            const event = frame.match(/^event: (.+)$/m)?.[1];
+            if (event && event !== 'ready') {
+              // Anything changed (including resync/expired): refetch
+              queryClient.invalidateQueries({ queryKey: todoKeys.all });
+            }
+          }
+        }
+      } catch (error) {
+        if (controller.signal.aborted) return;
+      }
+
+      // Stream ended (server restart, token expired): reconnect
+      retryTimer = setTimeout(connect, 5000);
+    };
+
+    connect();
+
+    return () => {
+      controller.abort();
+      clearTimeout(retryTimer);
+    };
+  }, [queryClient]);
+}